@@ -0,0 +1,100 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+class FakeRest:
+    """Conta as chamadas REST que o bot faria, simulando a latência do Discord."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = Counter()
+
+    async def call(self, route):
+        self.calls[route] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+class FakeMessage:
+    def __init__(self, channel, message_id, embeds=None):
+        self.channel = channel
+        self.id = message_id
+        self.author = channel.rest_owner.user
+        self.embeds = embeds or []
+
+    async def edit(self, **kwargs):
+        await self.channel.rest.call("edit")
+
+class FakeChannel:
+    def __init__(self, bot, channel_id, name):
+        self.rest_owner = bot
+        self.rest = bot.rest
+        self.id = channel_id
+        self.name = name
+        self.mention = f"<#{channel_id}>"
+        self._messages = []
+
+    def get_partial_message(self, message_id):
+        return FakeMessage(self, message_id)
+
+    async def send(self, **kwargs):
+        await self.rest.call("send")
+        message = FakeMessage(self, len(self._messages) + 1, embeds=[kwargs.get('embed')])
+        self._messages.append(message)
+        return message
+
+    async def fetch_message(self, message_id):
+        await self.rest.call("fetch_message")
+        return FakeMessage(self, message_id)
+
+    async def history(self, limit=100):
+        await self.rest.call("history")
+        for message in self._messages[-limit:]:
+            yield message
+
+class FakeGuild:
+    def __init__(self, guild_id, channel):
+        self.id = guild_id
+        self.text_channels = [channel]
+
+class FakeBot:
+    """
+    Substituto mínimo do ExoBot para o StatusCog: guilds, canais e mapeamento
+    das mensagens de status em memória, sem gateway nem data.json.
+    """
+
+    def __init__(self, guilds, configured=True, rest_latency=0.0, channel_name='📊-status-servidor'):
+        self.rest = FakeRest(rest_latency)
+        self.user = SimpleNamespace(id=1)
+        self.guilds = []
+        self._channels = {}
+        self._status = {}
+        self._never_ready = asyncio.Event()
+
+        for i in range(guilds):
+            guild_id = 1000 + i
+            channel = FakeChannel(self, 5000 + i, channel_name)
+            self._channels[channel.id] = channel
+            self.guilds.append(FakeGuild(guild_id, channel))
+            if configured:
+                self._status.setdefault('status_messages', {})[str(guild_id)] = {"channel_id": channel.id, "message_id": 1}
+
+    async def wait_until_ready(self):
+        # Os loops reais nunca começam: o benchmark chama os ciclos diretamente
+        await self._never_ready.wait()
+
+    def status_messages_for(self, monitor):
+        return self._status.setdefault(monitor.messages_key, {})
+
+    def save_status_message(self, guild_id, channel_id, message_id, monitor=None):
+        key = monitor.messages_key if monitor else 'status_messages'
+        self._status.setdefault(key, {})[str(guild_id)] = {"channel_id": channel_id, "message_id": message_id}
+
+    def forget_status_message(self, guild_id, monitor=None):
+        key = monitor.messages_key if monitor else 'status_messages'
+        self._status.get(key, {}).pop(str(guild_id), None)
+
+    def get_partial_messageable(self, channel_id):
+        return self._channels[channel_id]
+
+    def get_channel(self, channel_id):
+        return self._channels.get(channel_id)
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import deque
+from aiohttp import web
+
+class MockExoMetric:
+    """
+    Servidor local que imita os endpoints do mod ExoMetric (/mc-stats e /mc-stats/players).
+    - players: quantidade de jogadores online
+    - latency: atraso (segundos) de cada resposta
+    - failure_rate: fração de respostas com HTTP 500
+    - churn: fração dos jogadores trocada a cada consulta de /players
+    - volatile: métricas mudam a cada consulta (painel sempre "diferente")
+    - stream: expõe /mc-stats/events (SSE); sem ele o endpoint responde 404
+    - event_interval: a cada N segundos um jogador sai e outro entra (gera eventos)
+    Responde com ETag (304 para If-None-Match igual), aceita ?fields= em /players
+    e expõe /players/{uuid}; bytes_sent soma o tamanho dos corpos enviados.
+    """
+
+    def __init__(self, players=0, latency=0.0, failure_rate=0.0, churn=0.0, volatile=True, token="bench", stream=False, event_interval=0.0):
+        self.players = players
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.churn = churn
+        self.volatile = volatile
+        self.token = token
+        self.stream = stream
+        self.event_interval = event_interval
+        self.calls = {'stats': 0, 'players': 0, 'player': 0, 'events': 0}
+        self.bytes_sent = 0
+        self.not_modified = 0
+        self._next_id = 0
+        self._roster = [self._new_player() for _ in range(players)]
+        self._started = time.time()
+        self._runner = None
+        self._churn_task = None
+        self.url = None
+
+        # Eventos recentes (para Last-Event-ID) e filas dos clientes conectados
+        self._event_seq = 0
+        self._event_log = deque(maxlen=1000)
+        self._subscribers = set()
+
+    def _new_player(self):
+        self._next_id += 1
+        i = self._next_id
+        return {
+            'uuid': f"00000000-0000-0000-0000-{i:012d}",
+            'name': f"Player{i}",
+            'ping': 20 + i % 80,
+            'health': 20.0, 'food': 20, 'saturation': 5.0,
+            'level': i % 30, 'gamemode': 'SURVIVAL',
+            'dimension': 'minecraft:overworld',
+            'x': i * 10.5, 'y': 64.0, 'z': -i * 3.5,
+            'online_seconds': 60 * (i % 120),
+            'inventory': [{'slot': s, 'id': 'minecraft:stone', 'count': 64} for s in range(9)]
+        }
+
+    def _emit(self, kind, data):
+        self._event_seq += 1
+        event = (self._event_seq, kind, data)
+        self._event_log.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def _swap_player(self):
+        left = self._roster.pop(random.randrange(len(self._roster)))
+        joined = self._new_player()
+        self._roster.append(joined)
+        self._emit('leave', {'uuid': left['uuid'], 'name': left['name']})
+        self._emit('join', {'uuid': joined['uuid'], 'name': joined['name']})
+
+    def _rotate_roster(self):
+        swaps = int(len(self._roster) * self.churn)
+        for _ in range(swaps):
+            self._swap_player()
+
+    async def _churn_loop(self):
+        while True:
+            await asyncio.sleep(self.event_interval)
+            if self._roster:
+                self._swap_player()
+            self._emit('stats', self._stats())
+
+    def _stats(self):
+        cpu = round(random.uniform(5, 80), 1) if self.volatile else 25.0
+        return {
+            'cpu_percent': cpu,
+            'memory_bytes': 4 * 1024 ** 3,
+            'network_rx_bytes': 1024 * 50, 'network_tx_bytes': 1024 * 120,
+            'players_online': len(self._roster),
+            'uptime_seconds': int(time.time() - self._started) if self.volatile else 3600,
+            'world_day': 42, 'world_time': 6000, 'world_seed': '123456789',
+            'loaded_chunks': 900, 'difficulty': 'normal', 'is_raining': False,
+            'disk_bytes': 10 * 1024 ** 3,
+            'tps': 20.0, 'mspt': 12.5,
+            'heap_used_bytes': 2 * 1024 ** 3, 'heap_max_bytes': 8 * 1024 ** 3
+        }
+
+    async def _respond(self, request, kind, payload_fn):
+        self.calls[kind] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.query.get('token') != self.token:
+            return web.json_response({'error': 'unauthorized'}, status=401)
+        if self.failure_rate and random.random() < self.failure_rate:
+            return web.json_response({'error': 'boom'}, status=500)
+        payload = payload_fn()
+        if payload is None:
+            return web.json_response({'error': 'not found'}, status=404)
+
+        body = json.dumps(payload).encode('utf-8')
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get('If-None-Match') == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={'ETag': etag})
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type='application/json', headers={'ETag': etag})
+
+    async def handle_stats(self, request):
+        return await self._respond(request, 'stats', self._stats)
+
+    async def handle_players(self, request):
+        def payload():
+            self._rotate_roster()
+            fields = request.query.get('fields')
+            if fields:
+                keys = fields.split(',')
+                return {'players': [{k: p[k] for k in keys if k in p} for p in self._roster]}
+            return {'players': self._roster}
+        return await self._respond(request, 'players', payload)
+
+    async def handle_player(self, request):
+        uuid = request.match_info['uuid']
+        def payload():
+            return next((p for p in self._roster if p['uuid'] == uuid), None)
+        return await self._respond(request, 'player', payload)
+
+    async def handle_events(self, request):
+        self.calls['events'] += 1
+        if request.query.get('token') != self.token:
+            return web.json_response({'error': 'unauthorized'}, status=401)
+
+        resp = web.StreamResponse(headers={'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache'})
+        await resp.prepare(request)
+        queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            # Resume: reenvia o que o cliente perdeu desde o último id que ele viu
+            last_id = request.headers.get('Last-Event-ID')
+            if last_id and last_id.isdigit():
+                for event in list(self._event_log):
+                    if event[0] > int(last_id):
+                        queue.put_nowait(event)
+            while True:
+                try:
+                    seq, kind, data = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    await resp.write(b": ping\n\n")
+                    continue
+                await resp.write(f"id: {seq}\nevent: {kind}\ndata: {json.dumps(data)}\n\n".encode('utf-8'))
+        except ConnectionResetError:
+            pass # Cliente desconectou
+        finally:
+            self._subscribers.discard(queue)
+        return resp
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get('/mc-stats', self.handle_stats)
+        app.router.add_get('/mc-stats/players', self.handle_players)
+        if self.stream:
+            app.router.add_get('/mc-stats/events', self.handle_events)
+        app.router.add_get('/mc-stats/players/{uuid}', self.handle_player)
+        return app
+
+    async def start(self, host='127.0.0.1', port=0):
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}/mc-stats"
+        if self.event_interval:
+            self._churn_task = asyncio.create_task(self._churn_loop())
+        return self.url
+
+    async def stop(self):
+        if self._churn_task is not None:
+            self._churn_task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+async def _serve_forever(args):
+    mock = MockExoMetric(
+        players=args.players, latency=args.latency, failure_rate=args.failure_rate, churn=args.churn,
+        stream=args.stream, event_interval=args.event_interval
+    )
+    url = await mock.start(port=args.port)
+    print(f"🧪 Mock ExoMetric em {url} (token: {mock.token})")
+    await asyncio.Event().wait()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Servidor ExoMetric falso para testes locais")
+    parser.add_argument("--port", type=int, default=25081)
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--churn", type=float, default=0.0)
+    parser.add_argument("--stream", action="store_true", help="habilita /mc-stats/events (SSE)")
+    parser.add_argument("--event-interval", type=float, default=0.0, help="troca um jogador a cada N segundos")
+    asyncio.run(_serve_forever(parser.parse_args()))
@@ -0,0 +1,276 @@
+"""
+Benchmark offline do ExoMetric-DC: mock da API ExoMetric + Discord falso.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --guilds 1 50 500 --players 0 100 --ticks 20 --json resultado.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import timeit
+from collections import Counter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.mock_exometric import MockExoMetric
+from benchmarks.fake_discord import FakeBot
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+async def run_scenario(guilds, players, ticks, api_latency, rest_latency, churn, volatile, configured, rate_limits, failure_rate=0.0):
+    mock = MockExoMetric(players=players, latency=api_latency, failure_rate=failure_rate, churn=churn, volatile=volatile)
+    url = await mock.start()
+
+    # O registro lê API_URL/API_TOKEN na carga; recria para cada cenário
+    os.environ.pop("SERVERS_FILE", None)
+    os.environ["API_URL"] = url
+    os.environ["API_TOKEN"] = mock.token
+    from src.services.server_registry import registry
+    from src.services.exo_service import http_pool, OK
+    from src.cogs.status_cog import StatusCog
+    registry.__init__()
+    registry.load()
+    monitor = registry.primary
+
+    bot = FakeBot(guilds, configured=configured, rest_latency=rest_latency)
+    cog = StatusCog(bot)
+    if not rate_limits:
+        # Os ticks rodam colados; sem isso o benchmark mede a espera proposital do limitador
+        cog.route_limiter.per = 0
+
+    stats_times, presence_times = [], []
+    # Ticks em que a leitura falhou (retries esgotados ou disjuntor aberto): o painel ficou com o dado anterior
+    stats_failed, presence_failed = Counter(), Counter()
+    try:
+        for _ in range(ticks):
+            started = time.perf_counter()
+            await cog.update_stats(monitor)
+            stats_times.append(time.perf_counter() - started)
+            if monitor.service.state("stats") != OK:
+                stats_failed[monitor.service.state("stats")] += 1
+
+            started = time.perf_counter()
+            await cog.update_presence(monitor)
+            presence_times.append(time.perf_counter() - started)
+            if monitor.service.state("roster") != OK:
+                presence_failed[monitor.service.state("roster")] += 1
+    finally:
+        await cog.cog_unload()
+        await http_pool.close()
+        await mock.stop()
+
+    rest_total = sum(bot.rest.calls.values())
+    return {
+        'guilds': guilds,
+        'players': players,
+        'ticks': ticks,
+        'stats_p50_ms': percentile(stats_times, 50) * 1000,
+        'stats_p95_ms': percentile(stats_times, 95) * 1000,
+        'stats_p99_ms': percentile(stats_times, 99) * 1000,
+        'presence_p50_ms': percentile(presence_times, 50) * 1000,
+        'presence_p95_ms': percentile(presence_times, 95) * 1000,
+        'api_calls_per_tick': (mock.calls['stats'] + mock.calls['players']) / ticks,
+        'api_kb_per_tick': mock.bytes_sent / 1024 / ticks,
+        'api_not_modified': mock.not_modified,
+        'rest_calls_per_guild_tick': rest_total / (ticks * max(guilds, 1)),
+        'rest_calls': dict(bot.rest.calls),
+        'failure_rate': failure_rate,
+        'stats_failed_ticks': sum(stats_failed.values()),
+        'presence_failed_ticks': sum(presence_failed.values()),
+        'failed_states': dict(stats_failed + presence_failed),
+    }
+
+def bench_status_embed(iterations=2000):
+    from src.utils.ui import create_status_embed, render_fingerprint
+    from src.structures.models import ServerStats
+    data = ServerStats.from_dict(MockExoMetric(players=10)._stats())
+    per_call = timeit.timeit(lambda: create_status_embed(data), number=iterations) / iterations
+    embed, files = create_status_embed(data)
+
+    class _View:
+        children = []
+    fp_call = timeit.timeit(lambda: render_fingerprint(embed, files, _View), number=iterations) / iterations
+    return {'create_status_embed_us': per_call * 1e6, 'render_fingerprint_us': fp_call * 1e6}
+
+async def bench_render(iterations=5):
+    """Render do inventário (precisa dos assets da exo-inventory; falha é reportada, não derruba o benchmark)."""
+    from src.utils.inventory_renderer import renderer
+    player = MockExoMetric(players=1)._roster[0]
+    try:
+        started = time.perf_counter()
+        await renderer.render(player)
+        cold = time.perf_counter() - started
+
+        warm = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await renderer.render(dict(player, ping=player['ping'] + 1))
+            warm.append(time.perf_counter() - started)
+        return {'render_cold_ms': cold * 1000, 'render_cached_p50_ms': statistics.median(warm) * 1000}
+    except Exception as e:
+        return {'render_error': repr(e)}
+    finally:
+        await renderer.close()
+
+async def bench_sessions(players=300, days=90):
+    """Popula um banco de sessões temporário com meses de histórico e mede as consultas do /stats."""
+    import random
+    import tempfile
+    from src.structures.models import Player
+    from src.utils.sessions import SessionStore
+
+    rng = random.Random(42)
+    roster = [Player.from_dict({'uuid': f"uuid-{i}", 'name': f"Jogador{i}", 'ping': rng.randint(20, 200)}, keep_raw=False) for i in range(players)]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(os.path.join(tmp, "sessions.db"))
+        store.connect()
+        start = time.time() - days * 86400
+        total = 0
+        started = time.perf_counter()
+        for day in range(days):
+            # Cada jogador entra ~1,5 vez por dia, em sessões de 10 min a 3 h
+            for player in roster:
+                for _ in range(rng.choice((0, 1, 2, 2))):
+                    joined = start + day * 86400 + rng.uniform(0, 80000)
+                    store.join("bench", player, joined)
+                    store.leave("bench", player.uuid, joined + rng.uniform(600, 10800))
+                    total += 1
+            await store.flush()
+        ingest = time.perf_counter() - started
+
+        queries = {
+            'top_players': lambda: store.top_players("bench", 10),
+            'summary': lambda: store.summary("bench"),
+            'player': lambda: store.player("bench", "jogador123"),
+            'daily_peaks': lambda: store.daily_peaks("bench", 14),
+            'heatmap': lambda: store.heatmap("bench"),
+        }
+        result = {'sessions': total, 'ingest_s': ingest}
+        for name, query in queries.items():
+            result[f"{name}_ms"] = timeit.timeit(query, number=50) / 50 * 1000
+        store.close()
+    return result
+
+async def startup_child():
+    """
+    Filho do --startup: faz o boot do ExoBot real (setup_hook sem gateway) e a
+    primeira edição do painel num Discord falso; imprime RSS e o momento da edição.
+    """
+    import resource
+    import tempfile
+    mock = MockExoMetric(players=50, latency=0.02)
+    url = await mock.start()
+    tmp = tempfile.mkdtemp()
+    os.environ.pop("SERVERS_FILE", None)
+    os.environ.update({"API_URL": url, "API_TOKEN": mock.token, "SESSIONS_DB": os.path.join(tmp, "sessions.db"), "HISTORY_PATH": ""})
+
+    from src.structures.bot import ExoBot
+    from src.services.server_registry import registry
+    from src.cogs.status_cog import StatusCog
+    bot = ExoBot()
+    await bot.setup_hook()
+
+    # O StatusCog do bot real espera o on_ready; a primeira edição sai por um cog ligado ao Discord falso
+    fake = FakeBot(1)
+    cog = StatusCog(fake)
+    await cog.update_stats(registry.primary)
+    edited_at = time.time()
+    print(json.dumps({
+        'first_edit_at': edited_at,
+        'edits': fake.rest.calls['edit'],
+        'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'exo_inventory_loaded': 'exo_inventory' in sys.modules,
+        'pillow_loaded': 'PIL.Image' in sys.modules,
+    }))
+    sys.stdout.flush()
+    os._exit(0)
+
+def bench_startup(runs=5):
+    """Tempo do início do processo até a primeira edição do painel e RSS nesse momento (mediana de `runs`)."""
+    import subprocess
+    samples = []
+    for _ in range(runs):
+        started = time.time()
+        out = subprocess.run([sys.executable, "-m", "benchmarks.run", "--startup-child"], cwd=ROOT, capture_output=True, text=True, timeout=120)
+        line = out.stdout.strip().splitlines()[-1]
+        result = json.loads(line)
+        result['first_edit_ms'] = (result.pop('first_edit_at') - started) * 1000
+        samples.append(result)
+    return {
+        'first_edit_p50_ms': statistics.median(r['first_edit_ms'] for r in samples),
+        'rss_p50_mb': statistics.median(r['rss_mb'] for r in samples),
+        'exo_inventory_loaded': samples[-1]['exo_inventory_loaded'],
+        'pillow_loaded': samples[-1]['pillow_loaded'],
+        'edits': samples[-1]['edits'],
+    }
+
+def print_table(rows):
+    header = f"{'guilds':>7} {'players':>8} {'stats p50':>10} {'p95':>9} {'p99':>9} {'pres p50':>9} {'api/tick':>9} {'KB/tick':>8} {'rest/guild':>11} {'falhas s/p':>11}"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(f"{r['guilds']:>7} {r['players']:>8} {r['stats_p50_ms']:>8.1f}ms {r['stats_p95_ms']:>7.1f}ms {r['stats_p99_ms']:>7.1f}ms "
+              f"{r['presence_p50_ms']:>7.1f}ms {r['api_calls_per_tick']:>9.2f} {r['api_kb_per_tick']:>8.2f} {r['rest_calls_per_guild_tick']:>11.3f} "
+              f"{r['stats_failed_ticks']:>5}/{r['presence_failed_ticks']:<5}")
+
+async def main(args):
+    rows = []
+    for guilds in args.guilds:
+        for players in args.players:
+            rows.append(await run_scenario(
+                guilds, players, args.ticks, args.api_latency, args.rest_latency,
+                args.churn, not args.static, not args.unconfigured, args.rate_limits, args.failure_rate
+            ))
+    print_table(rows)
+
+    result = {'scenarios': rows, 'micro': bench_status_embed()}
+    print(f"\ncreate_status_embed: {result['micro']['create_status_embed_us']:.1f}µs | render_fingerprint: {result['micro']['render_fingerprint_us']:.1f}µs")
+
+    if args.render:
+        result['render'] = await bench_render()
+        print(f"render: {result['render']}")
+
+    if args.startup:
+        result['startup'] = bench_startup()
+        print(f"startup: {result['startup']}")
+
+    if args.sessions:
+        result['sessions'] = await bench_sessions()
+        print(f"sessions: {result['sessions']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=4)
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark offline do loop de status")
+    parser.add_argument("--guilds", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--players", type=int, nargs="+", default=[0, 100])
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--api-latency", type=float, default=0.02, help="latência simulada da API ExoMetric (s)")
+    parser.add_argument("--rest-latency", type=float, default=0.05, help="latência simulada de cada chamada REST do Discord (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fração de respostas da API com HTTP 500")
+    parser.add_argument("--churn", type=float, default=0.05, help="fração de jogadores trocada a cada consulta")
+    parser.add_argument("--static", action="store_true", help="métricas constantes (mede o pulo de edits sem mudança)")
+    parser.add_argument("--unconfigured", action="store_true", help="guilds sem /setup (mede a auto-descoberta)")
+    parser.add_argument("--rate-limits", action="store_true", help="mantém as esperas do RouteLimiter entre ticks colados")
+    parser.add_argument("--render", action="store_true", help="inclui o render de inventário")
+    parser.add_argument("--sessions", action="store_true", help="inclui as consultas do /stats sobre 90 dias de sessões")
+    parser.add_argument("--startup", action="store_true", help="mede o tempo até a primeira edição do painel e o RSS num processo novo")
+    parser.add_argument("--startup-child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--json", help="salva o resultado em JSON")
+    args = parser.parse_args()
+    asyncio.run(startup_child() if args.startup_child else main(args))
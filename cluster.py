@@ -0,0 +1,59 @@
+"""
+Sobe o bot em vários processos, cada um com um grupo de shards do Discord.
+O processo 0 é o líder: consulta a API do ExoMetric e publica os snapshots pelo
+IPC local; os outros só recebem e atualizam as guilds dos próprios shards.
+Todos usam o mesmo data.json, gravado só pelo líder.
+
+    python cluster.py --processes 4 --shards 16
+"""
+import argparse
+import os
+import subprocess
+import sys
+from dotenv import load_dotenv
+
+def shard_groups(shards, processes):
+    """Divide os shards em `processes` grupos contíguos (o mais equilibrado possível)."""
+    size, extra = divmod(shards, processes)
+    groups, start = [], 0
+    for i in range(processes):
+        end = start + size + (1 if i < extra else 0)
+        groups.append(list(range(start, end)))
+        start = end
+    return [g for g in groups if g]
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="ExoMetric-DC em vários processos (sharding)")
+    parser.add_argument("--processes", type=int, default=2, help="quantidade de processos do bot")
+    parser.add_argument("--shards", type=int, required=True, help="total de shards do Discord")
+    parser.add_argument("--ipc", default=os.getenv("CLUSTER_IPC", "127.0.0.1:8765"), help="endereço do IPC local (host:porta)")
+    args = parser.parse_args()
+
+    metrics_port = int(os.getenv("METRICS_PORT", "0") or 0)
+    children = []
+    for index, shard_ids in enumerate(shard_groups(args.shards, max(1, args.processes))):
+        env = dict(os.environ)
+        env.update({
+            "SHARD_COUNT": str(args.shards),
+            "SHARD_IDS": ",".join(str(i) for i in shard_ids),
+            "CLUSTER_ROLE": "leader" if index == 0 else "follower",
+            "CLUSTER_IPC": args.ipc,
+        })
+        if metrics_port:
+            env["METRICS_PORT"] = str(metrics_port + index)
+        print(f"🚀 Processo {index}: shards {shard_ids} ({env['CLUSTER_ROLE']})")
+        children.append(subprocess.Popen([sys.executable, "main.py"], env=env))
+
+    try:
+        for child in children:
+            child.wait()
+    except KeyboardInterrupt:
+        for child in children:
+            child.terminate()
+        for child in children:
+            child.wait()
+        print("🛑 Cluster desligado.")
+
+if __name__ == "__main__":
+    main()
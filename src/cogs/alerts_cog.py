@@ -0,0 +1,51 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from src.services.server_registry import registry
+from src.utils.persistence import store
+
+class AlertsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="alerts", description="Mostra as regras de alerta e define para onde os alertas desta guild vão")
+    @app_commands.describe(
+        canal="Canal que recebe os alertas (padrão: o canal do painel)",
+        papel="Cargo mencionado nos alertas (padrão: MENTION_ROLE_ID)",
+        desligar="Silencia os alertas nesta guild (use False para reativar)"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def alerts(self, interaction: discord.Interaction, canal: discord.TextChannel = None, papel: discord.Role = None, desligar: bool = None):
+        guild_id = str(interaction.guild_id)
+        route = dict(store.get('alert_routes', {}).get(guild_id) or {})
+
+        if canal is not None or papel is not None or desligar is not None:
+            if canal is not None:
+                route['channel_id'] = canal.id
+            if papel is not None:
+                route['role_id'] = papel.id
+            if desligar is not None:
+                route['muted'] = desligar
+            if 'channel_id' not in route:
+                await interaction.response.send_message("❌ Informe o `canal` na primeira configuração.", ephemeral=True)
+                return
+            store.update('alert_routes', guild_id, route)
+
+        embed = discord.Embed(title="🚨 Alertas do ExoMetric", color=0xE74C3C)
+        if route.get('muted'):
+            destino = "🔕 Silenciados nesta guild"
+        elif route:
+            papel_txt = f" • <@&{route['role_id']}>" if route.get('role_id') else ""
+            destino = f"<#{route['channel_id']}>{papel_txt}"
+        else:
+            destino = "Canal do painel de status"
+        embed.add_field(name="📬 Destino", value=destino, inline=False)
+
+        for monitor in registry:
+            firing = set(rule.name for rule in monitor.alerts.firing())
+            lines = [f"{'🔴' if rule.name in firing else '🟢'} **{rule.name}**: `{rule.describe()}`" for rule in monitor.alerts.rules]
+            embed.add_field(name=f"🖥️ {monitor.name}", value="\n".join(lines)[:1024] or "Nenhuma regra", inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(AlertsCog(bot))
@@ -0,0 +1,67 @@
+import discord
+import time
+from discord.ext import commands
+from discord import app_commands
+from src.services.server_registry import registry
+from src.utils.instrumentation import metrics
+
+def _fmt_seconds(value):
+    if value == float('inf'):
+        return ">10s"
+    return f"{value * 1000:.0f}ms" if value < 1 else f"{value:.2f}s"
+
+def _code_block(lines, empty):
+    """Bloco de código que respeita o limite de 1024 caracteres de um campo."""
+    body = ""
+    for line in lines:
+        if len(body) + len(line) + 10 > 1024:
+            body += "…\n"
+            break
+        body += line + "\n"
+    return f"```\n{body or empty + chr(10)}```"
+
+class DiagnosticsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="diagnostics", description="Tempos, erros e agendamento do bot (admin)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def diagnostics(self, interaction: discord.Interaction):
+        embed = discord.Embed(title="🩺 Diagnóstico do ExoMetric-DC", color=0x95A5A6, timestamp=discord.utils.utcnow())
+
+        # Etapas: contagem, média e p95 (estimado pelos buckets)
+        lines = []
+        for labels, count, mean, p95 in metrics.stages():
+            name = labels.pop('stage')
+            extra = f" [{', '.join(labels.values())}]" if labels else ""
+            lines.append(f"{name}{extra}: n={count} avg={_fmt_seconds(mean)} p95={_fmt_seconds(p95)}")
+        embed.add_field(name="⏱️ Etapas", value=_code_block(lines, "sem amostras"), inline=False)
+
+        errors = [f"{e['stage']}/{e['category']}: {value}" for e, value in metrics.errors()]
+        embed.add_field(name="❌ Erros", value=_code_block(errors, "nenhum"), inline=False)
+
+        schedules = [
+            f"{m.name}: stats {m.stats_schedule.describe()} | presença {m.presence_schedule.describe()}"
+            for m in registry
+        ]
+        embed.add_field(name="📡 Polling", value=_code_block(schedules, ""), inline=False)
+
+        api = [f"{m.name}: disjuntor {m.service.breaker.describe()} | última leitura {m.service.state('stats')}" for m in registry]
+        embed.add_field(name="🔌 API", value=_code_block(api, ""), inline=False)
+
+        status_cog = self.bot.get_cog("StatusCog")
+        if status_cog:
+            shards = ", ".join(str(i) for i in sorted(self.bot.shards)) or "0"
+            role = status_cog.cluster.describe()
+            if status_cog.subscriber is not None:
+                role += " conectado" if status_cog.subscriber.connected else " desconectado"
+            embed.add_field(name="🧩 Cluster", value=f"`{role}` • shards `{shards}` de `{self.bot.shard_count}` • `{len(self.bot.guilds)}` guilds", inline=False)
+        if status_cog and status_cog.last_report:
+            embed.add_field(name="🧭 Último fan-out", value=f"`{status_cog.last_report!r}`", inline=False)
+
+        uptime = int(time.time() - metrics.started_at)
+        embed.set_footer(text=f"Coletando há {uptime // 3600}h {(uptime % 3600) // 60}m")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(DiagnosticsCog(bot))
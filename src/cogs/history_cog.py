@@ -0,0 +1,100 @@
+import asyncio
+import discord
+import io
+import os
+from discord.ext import commands, tasks
+from discord import app_commands
+from src.services.server_registry import registry
+from src.services.cluster import ClusterConfig
+from src.utils.ui import format_bytes, TZ_OFFSET
+from src.utils.servers import server_autocomplete
+
+# {coluna: (rótulo, formatador)}
+METRICS = {
+    'cpu_percent': ("CPU", lambda v: f"{v:.0f}%"),
+    'memory_bytes': ("RAM", format_bytes),
+    'tps': ("TPS", lambda v: f"{v:.2f}"),
+    'mspt': ("MSPT", lambda v: f"{v:.1f}ms"),
+    'heap_used_bytes': ("Java Heap", format_bytes),
+    'network_rx_bytes': ("Rede (In)", lambda v: f"{format_bytes(v)}/s"),
+    'network_tx_bytes': ("Rede (Out)", lambda v: f"{format_bytes(v)}/s"),
+    'players_online': ("Jogadores", lambda v: f"{v:.0f}"),
+}
+
+WINDOWS = {
+    '15m': ("15 minutos", 900),
+    '1h': ("1 hora", 3600),
+    '6h': ("6 horas", 6 * 3600),
+    '24h': ("24 horas", 86400),
+    '7d': ("7 dias", 7 * 86400),
+    '30d': ("30 dias", 30 * 86400),
+}
+
+class HistoryCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        # Persistência opcional do histórico entre reinícios
+        self.history_path = os.getenv("HISTORY_PATH", "")
+        # Em cluster todos os processos recebem as mesmas amostras; só quem consulta a API grava
+        self.saves = bool(self.history_path) and ClusterConfig().polls
+        if self.history_path:
+            for monitor in registry:
+                monitor.history.load(monitor.history_path(self.history_path))
+        if self.saves:
+            self.save_loop.start()
+
+    async def cog_unload(self):
+        if self.saves:
+            self.save_loop.cancel()
+            await self._save_all()
+
+    async def _save_all(self):
+        for monitor in registry:
+            await asyncio.to_thread(monitor.history.save, monitor.history_path(self.history_path))
+
+    @tasks.loop(minutes=5)
+    async def save_loop(self):
+        try:
+            await self._save_all()
+        except Exception as e:
+            print(f"⚠️ Erro ao salvar histórico: {e}")
+
+    @app_commands.command(name="history", description="Mostra o gráfico do histórico de uma métrica do servidor")
+    @app_commands.describe(metrica="Métrica a ser exibida", janela="Período do gráfico", servidor="Servidor monitorado (padrão: o principal)")
+    @app_commands.choices(
+        metrica=[app_commands.Choice(name=label, value=key) for key, (label, _) in METRICS.items()],
+        janela=[app_commands.Choice(name=label, value=key) for key, (label, _) in WINDOWS.items()]
+    )
+    @app_commands.autocomplete(servidor=server_autocomplete)
+    async def history_command(self, interaction: discord.Interaction, metrica: app_commands.Choice[str], janela: app_commands.Choice[str], servidor: str = None):
+        await interaction.response.defer(ephemeral=True)
+
+        monitor = registry.get(servidor)
+        if monitor is None:
+            await interaction.followup.send(f"❌ Servidor `{servidor}` não encontrado.", ephemeral=True)
+            return
+
+        label, value_fmt = METRICS[metrica.value]
+        window_label, seconds = WINDOWS[janela.value]
+        tier, (timestamps, values) = monitor.history.query(metrica.value, seconds)
+        if not values:
+            await interaction.followup.send("📉 Ainda não há amostras para esse período.", ephemeral=True)
+            return
+
+        # Pillow só entra na memória quando alguém pede o primeiro gráfico
+        from src.utils.chart_renderer import render_line_chart
+        title = f"{label} - últimos {window_label} ({len(values)} pontos, resolução {tier})"
+        png = await asyncio.to_thread(render_line_chart, timestamps, values, title, value_fmt, TZ_OFFSET)
+        file = discord.File(io.BytesIO(png), filename="history.png")
+
+        embed = discord.Embed(title=f"📈 Histórico: {label}", color=0x3498DB)
+        if monitor.label:
+            embed.set_author(name=f"🖥️ {monitor.label}")
+        embed.add_field(name="🔻 Mín", value=f"`{value_fmt(min(values))}`", inline=True)
+        embed.add_field(name="📊 Média", value=f"`{value_fmt(sum(values) / len(values))}`", inline=True)
+        embed.add_field(name="🔺 Máx", value=f"`{value_fmt(max(values))}`", inline=True)
+        embed.set_image(url="attachment://history.png")
+        await interaction.followup.send(embed=embed, file=file, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(HistoryCog(bot))
@@ -0,0 +1,43 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from src.services.server_registry import registry
+from src.utils.ui import show_player_dossier
+from src.utils.servers import server_autocomplete
+
+class PlayerCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def player_autocomplete(self, interaction: discord.Interaction, current: str):
+        # Busca por prefixo no índice do servidor escolhido (sem chamar a API)
+        monitor = registry.get(interaction.namespace.servidor)
+        if monitor is None:
+            return []
+        return [app_commands.Choice(name=p.name, value=p.uuid) for p in monitor.players.search(current, 25)]
+
+    @app_commands.command(name="player", description="Abre o dossiê de um jogador online")
+    @app_commands.describe(nome="Nome do jogador", servidor="Servidor monitorado (padrão: o principal)")
+    @app_commands.autocomplete(nome=player_autocomplete, servidor=server_autocomplete)
+    async def player_command(self, interaction: discord.Interaction, nome: str, servidor: str = None):
+        await interaction.response.defer(ephemeral=True)
+
+        monitor = registry.get(servidor)
+        if monitor is None:
+            await interaction.followup.send(f"❌ Servidor `{servidor}` não encontrado.", ephemeral=True)
+            return
+
+        # O autocomplete manda o uuid; texto digitado à mão vale como nome exato ou prefixo
+        player = monitor.players.find(nome) or next(iter(monitor.players.search(nome, 1)), None)
+        if player is None:
+            await interaction.followup.send(f"❌ Jogador `{nome}` não está online.", ephemeral=True)
+            return
+
+        try:
+            await show_player_dossier(interaction, monitor.cache, player.uuid)
+        except Exception as e:
+            print(f"❌ Erro: {e}")
+            await interaction.followup.send("❌ Erro ao gerar inventário.", ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(PlayerCog(bot))
@@ -0,0 +1,169 @@
+import asyncio
+import discord
+import os
+import time
+from datetime import datetime
+from discord.ext import commands, tasks
+from discord import app_commands
+from src.services.server_registry import registry
+from src.services.cluster import ClusterConfig
+from src.utils.instrumentation import metrics
+from src.utils.sessions import sessions, WEEKDAYS
+from src.utils.servers import server_autocomplete
+from src.utils.ui import TZ_OFFSET
+
+VIEWS = {
+    'ranking': "🏆 Tempo de jogo",
+    'picos': "📈 Picos diários",
+    'horarios': "🗓️ Horários movimentados",
+}
+
+HEAT_LEVELS = " ░▒▓█"
+
+def format_playtime(seconds):
+    seconds = int(seconds)
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    return f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+
+class StatsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        # Em cluster só quem consulta a API grava; os seguidores abrem o mesmo banco só para ler
+        self.writes = ClusterConfig().polls
+        sessions.connect(recover=self.writes)
+        if self.writes:
+            self.flush_loop.change_interval(seconds=float(os.getenv("SESSIONS_FLUSH_INTERVAL", "60")))
+            self.flush_loop.start()
+
+    async def cog_unload(self):
+        if self.writes:
+            self.flush_loop.cancel()
+            await sessions.flush()
+        sessions.close()
+
+    @tasks.loop(seconds=60)
+    async def flush_loop(self):
+        try:
+            with metrics.timer("sessions_flush"):
+                await sessions.flush()
+        except Exception as e:
+            print(f"⚠️ Erro ao gravar sessões: {e}")
+
+    @app_commands.command(name="stats", description="Estatísticas de tempo de jogo, picos de jogadores e horários movimentados")
+    @app_commands.describe(visao="O que mostrar", jogador="Mostra o tempo de jogo de um jogador", servidor="Servidor monitorado (padrão: o principal)")
+    @app_commands.choices(visao=[app_commands.Choice(name=label, value=key) for key, label in VIEWS.items()])
+    @app_commands.autocomplete(servidor=server_autocomplete)
+    async def stats_command(self, interaction: discord.Interaction, visao: app_commands.Choice[str] = None, jogador: str = None, servidor: str = None):
+        await interaction.response.defer(ephemeral=True)
+
+        monitor = registry.get(servidor)
+        if monitor is None:
+            await interaction.followup.send(f"❌ Servidor `{servidor}` não encontrado.", ephemeral=True)
+            return
+
+        # Sessões encerradas desde o último flush também entram na resposta
+        if self.writes:
+            try:
+                await sessions.flush()
+            except Exception as e:
+                print(f"⚠️ Erro ao gravar sessões: {e}")
+
+        try:
+            with metrics.timer("stats_query", server=monitor.name):
+                if jogador:
+                    embed = await self._player_embed(monitor, jogador)
+                elif visao is None or visao.value == 'ranking':
+                    embed = await self._ranking_embed(monitor)
+                elif visao.value == 'picos':
+                    embed = await self._peaks_embed(monitor)
+                else:
+                    embed = await self._heatmap_embed(monitor)
+        except Exception as e:
+            print(f"❌ Erro no /stats: {e}")
+            await interaction.followup.send("❌ Erro ao consultar as estatísticas.", ephemeral=True)
+            return
+
+        if monitor.label:
+            embed.set_author(name=f"🖥️ {monitor.label}")
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    async def _ranking_embed(self, monitor):
+        top = await asyncio.to_thread(sessions.top_players, monitor.name, 10)
+        players, seconds, count = await asyncio.to_thread(sessions.summary, monitor.name)
+
+        embed = discord.Embed(title=VIEWS['ranking'], color=0xF1C40F)
+        if not top:
+            embed.description = "Nenhuma sessão registrada ainda."
+            return embed
+        medals = ["🥇", "🥈", "🥉"]
+        lines = [
+            f"{medals[i] if i < 3 else f'`{i + 1}.`'} **{name}**: {format_playtime(secs)} ({n} sessões)"
+            for i, (name, secs, n) in enumerate(top)
+        ]
+        embed.description = "\n".join(lines)
+        embed.set_footer(text=f"{players} jogadores • {format_playtime(seconds)} no total • {count} sessões encerradas")
+        return embed
+
+    async def _player_embed(self, monitor, name):
+        row = await asyncio.to_thread(sessions.player, monitor.name, name)
+        online = monitor.players.find(name)
+        current = sessions.open_session(monitor.name, online.uuid) if online is not None else None
+        if row is None and current is None:
+            return discord.Embed(title="⏱️ Tempo de jogo", description=f"❌ Nenhuma sessão de `{name}` registrada.", color=0xE74C3C)
+
+        uuid, display, seconds, count, longest, last_seen = row or (online.uuid, online.name, 0.0, 0, 0.0, None)
+        embed = discord.Embed(title=f"⏱️ Tempo de jogo: {display}", color=0x3498DB)
+        if current is not None:
+            # Sessão em andamento ainda não está nos rollups
+            elapsed = time.time() - current.joined_at
+            seconds += elapsed
+            embed.add_field(name="🟢 Online agora", value=f"há {format_playtime(elapsed)}", inline=False)
+        elif last_seen is not None:
+            embed.add_field(name="👀 Visto por último", value=f"<t:{int(last_seen)}:R>", inline=False)
+        dimension = current.dimension if current is not None else await asyncio.to_thread(sessions.last_dimension, monitor.name, uuid)
+        if dimension:
+            embed.add_field(name="🌍 Dimensão", value=f"`{dimension.split(':')[-1]}`", inline=False)
+        embed.add_field(name="🕒 Total", value=f"`{format_playtime(seconds)}`", inline=True)
+        embed.add_field(name="🔁 Sessões", value=f"`{count}`", inline=True)
+        if count:
+            embed.add_field(name="📏 Média / Mais longa", value=f"`{format_playtime(seconds / (count + (current is not None)))}` / `{format_playtime(longest)}`", inline=True)
+        return embed
+
+    async def _peaks_embed(self, monitor):
+        rows = await asyncio.to_thread(sessions.daily_peaks, monitor.name, 14)
+        embed = discord.Embed(title=VIEWS['picos'], color=0x2ECC71)
+        if not rows:
+            embed.description = "Nenhum pico registrado ainda."
+            return embed
+        top = max(peak for _, peak, _ in rows) or 1
+        lines = []
+        for day, peak, peak_at in rows:
+            bar = "█" * round(peak / top * 12)
+            at = datetime.fromtimestamp(peak_at, TZ_OFFSET).strftime("%H:%M")
+            lines.append(f"`{day[8:10]}/{day[5:7]}` {bar} **{peak}** às {at}")
+        embed.description = "\n".join(lines)
+        embed.set_footer(text="Últimos 14 dias • jogadores online ao mesmo tempo")
+        return embed
+
+    async def _heatmap_embed(self, monitor):
+        grid = await asyncio.to_thread(sessions.heatmap, monitor.name)
+        embed = discord.Embed(title=VIEWS['horarios'], color=0x9B59B6)
+        top = max(max(row) for row in grid)
+        if not top:
+            embed.description = "Nenhuma sessão registrada ainda."
+            return embed
+
+        scale = len(HEAT_LEVELS) - 1
+        lines = ["    00    06    12    18"]
+        for weekday, row in enumerate(grid):
+            cells = "".join(HEAT_LEVELS[min(scale, int(v / top * scale + 0.999))] for v in row)
+            lines.append(f"{WEEKDAYS[weekday]} {cells}")
+        busiest_day, busiest_hour = max(((d, h) for d in range(7) for h in range(24)), key=lambda k: grid[k[0]][k[1]])
+        embed.description = "```\n" + "\n".join(lines) + "\n```"
+        embed.add_field(name="🔥 Mais movimentado", value=f"{WEEKDAYS[busiest_day]} às {busiest_hour:02d}h ({format_playtime(top)} jogados no total)", inline=False)
+        embed.set_footer(text=f"Horário local (UTC{TZ_OFFSET.utcoffset(None).total_seconds() / 3600:+.0f}) • sessões encerradas")
+        return embed
+
+async def setup(bot):
+    await bot.add_cog(StatsCog(bot))
@@ -1,133 +1,494 @@
+import asyncio
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
-from src.services.exo_service import exo_service
-from src.utils.ui import create_status_embed, StatusView
+from functools import partial
+from src.services.server_registry import registry
+from src.services.event_stream import EventStreamClient, StreamEvent
+from src.services.cluster import ClusterConfig, SnapshotPublisher, SnapshotSubscriber, LEADER
+from src.services.exo_service import AUTH_ERROR, MALFORMED
+from src.structures.models import ModelError, Player, ServerStats, parse_players
+from src.utils.ui import create_alert_embeds, create_status_embed, create_notification_embeds, render_fingerprint, stamp_status_embed, status_view_for
+from src.utils.notifications import split_messages
+from src.utils.message_cache import StatusMessageCache
+from src.utils.discovery import ChannelDiscovery
+from src.utils.fanout import FanoutScheduler, RouteLimiter
+from src.utils.scheduler import PollLoop
+from src.utils.instrumentation import metrics
+from src.utils.settings import settings
+from src.utils.persistence import store
+from src.utils.sessions import sessions
+from src.utils.servers import server_autocomplete
 import os
 import time
 
+def stats_changed(previous, current):
+    """Mudança relevante entre duas amostras (acelera o polling enquanto dura)."""
+    if previous is None:
+        return True
+    if previous.players_online != current.players_online:
+        return True
+    if abs(previous.tps - current.tps) >= 1:
+        return True
+    if abs(previous.mspt - current.mspt) >= 10:
+        return True
+    return abs(previous.cpu_percent - current.cpu_percent) >= 20
+
 class StatusCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.online_players = {} # Cache de {uuid: name}
-        self.first_run = True
-        self.server_online = None # Status anterior do servidor
-        self.update_loop.start()
-
-    def cog_unload(self):
-        self.update_loop.cancel()
-
-    @tasks.loop(seconds=15)
-    async def update_loop(self):
-        data = await exo_service.get_stats()
-        players_data = await exo_service.get_players()
-        
-        is_online = (data is not None)
-        embed, files = create_status_embed(data)
-        view = StatusView(self.bot, exo_service, is_online=is_online)
-
-        # Lógica de Entrada/Saída (calculada uma vez por ciclo)
+        # Limites e fan-out compartilhados por todos os servidores monitorados
+        self.route_limiter = RouteLimiter(rate=5, per=5.0)
+        self.fanout = FanoutScheduler(
+            concurrency=int(os.getenv("FANOUT_CONCURRENCY", "25")),
+            deadline=float(os.getenv("TICK_DEADLINE", "12"))
+        )
+        self.last_report = None
+        self.stream_flush_delay = float(os.getenv("STREAM_FLUSH_DELAY", "1.5"))
+
+        # Cluster: só o líder (ou o processo único) consulta a API; seguidores recebem
+        # os snapshots pelo IPC local e cada processo atualiza só as guilds dos seus shards
+        self.cluster = ClusterConfig()
+        self.publisher = SnapshotPublisher(self.cluster.host, self.cluster.port) if self.cluster.role == LEADER else None
+        self.subscriber = None
+        if not self.cluster.polls:
+            self.subscriber = SnapshotSubscriber(self.cluster.host, self.cluster.port, self.handle_cluster_message)
+
+        # Estado persistido (data.json) compartilhado: só o líder grava; mudanças feitas num
+        # seguidor vão para o líder, que grava e repassa a todos. Quem conecta recebe tudo.
+        if self.publisher is not None:
+            self.publisher.on_message = self.handle_follower_message
+            self.publisher.replay_providers.append(lambda: ("", "store_sync", {'data': store.snapshot()}))
+            store.on_change = lambda change: self.publisher.publish("", "store", change, replay=False)
+        elif self.subscriber is not None:
+            store.on_change = partial(self.subscriber.send, "store")
+
+        # Dois loops por servidor, todos no mesmo event loop e no mesmo pool HTTP
+        self.loops = []
+        for monitor in registry:
+            monitor.message_cache = StatusMessageCache(self.bot, max_silence=settings.current.status_max_silence)
+            monitor.discovery = ChannelDiscovery(self.bot, monitor.channel_name, retry=float(os.getenv("DISCOVERY_RETRY", "3600")))
+            if not self.cluster.polls:
+                continue
+            self.loops.append(PollLoop(f"stats:{monitor.name}", partial(self.update_stats, monitor), monitor.stats_schedule, before=self.bot.wait_until_ready))
+            self.loops.append(PollLoop(f"presença:{monitor.name}", partial(self.update_presence, monitor), monitor.presence_schedule, before=self.bot.wait_until_ready))
+            if monitor.stream_enabled:
+                monitor.stream = EventStreamClient(
+                    monitor.service,
+                    on_event=partial(self.handle_stream_event, monitor),
+                    on_connect=partial(self._on_stream_connect, monitor),
+                    before=self.bot.wait_until_ready
+                )
+                monitor.stream.start()
+        for loop in self.loops:
+            loop.start()
+        settings.on_reload(self._apply_settings)
+
+    async def cog_load(self):
+        if self.publisher is not None:
+            await self.publisher.start()
+        if self.subscriber is not None:
+            self.subscriber.start()
+
+    def _apply_settings(self, cfg):
+        """Hot reload: o que foi construído com a configuração antiga recebe os valores novos."""
+        for monitor in registry:
+            monitor.message_cache.max_silence = cfg.status_max_silence
+            monitor.notifications.debounce = cfg.notify_debounce
+
+    async def cog_unload(self):
+        for loop in self.loops:
+            loop.cancel()
+        for monitor in registry:
+            if monitor.stream is not None:
+                monitor.stream.cancel()
+            if monitor.stream_flush is not None:
+                monitor.stream_flush.cancel()
+        store.on_change = None
+        if self.subscriber is not None:
+            self.subscriber.cancel()
+        if self.publisher is not None:
+            await self.publisher.close()
+
+    async def update_stats(self, monitor):
+        # O tick sempre busca dados novos e alimenta o cache usado pelos botões
+        with metrics.timer("fetch_stats", server=monitor.name):
+            data = await monitor.cache.refresh_stats()
+
+        state = monitor.service.state("stats")
+        if self.publisher is not None:
+            self.publisher.publish(monitor.name, "stats", {'state': state, 'data': data.to_dict() if data is not None else None})
+        await self.apply_stats(monitor, data, state)
+
+    async def apply_stats(self, monitor, data, state):
+        """Processa um snapshot de stats (lido aqui ou recebido do líder do cluster)."""
+        if data is not None:
+            monitor.history.record(data)
+            alert_events = monitor.alerts.evaluate(data, time.time())
+            if alert_events and settings.current.notify_alerts:
+                monitor.pending_alerts.extend(alert_events)
+            monitor.stats_schedule.on_success(stats_changed(monitor.last_stats, data))
+        else:
+            monitor.stats_schedule.on_unreachable()
+
+        # Token errado / payload inválido não dizem se o servidor está no ar
+        evidence = True if data is not None else (None if state in (AUTH_ERROR, MALFORMED) else False)
+        was_online = monitor.server_online
+        is_online = monitor.confirm_online(evidence)
+        if is_online is False:
+            monitor.alerts.reset()
+        self._collect_server_notifications(monitor, data, was_online, is_online)
+
+        if evidence is False and is_online:
+            # Falha ainda não confirmada: o painel fica com a última leitura boa
+            await self._dispatch(monitor, {'embed': None})
+            return
+
+        with metrics.timer("build_embed", server=monitor.name):
+            embed, files, view, fingerprint = self._render_status(monitor, data, state)
+
+        await self._dispatch(monitor, {
+            'embed': embed,
+            'files': files,
+            'view': view,
+            'fingerprint': fingerprint
+        })
+
+        # Atualiza estados para o próximo loop
+        if data is not None:
+            monitor.last_stats = data
+
+    def _render_status(self, monitor, data, state):
+        """
+        Embed/view/fingerprint do painel, montados uma vez por estado distinto e
+        compartilhados por todas as guilds. Se o snapshot é o mesmo objeto do tick
+        anterior (ex.: 304 da API) ou o servidor segue offline pelo mesmo motivo,
+        só o rodapé com o horário é atualizado.
+        """
+        key = (data, state)
+        rendered = monitor.rendered_status
+        if rendered is not None and rendered[0] == key:
+            _, embed, files, view, fingerprint = rendered
+            stamp_status_embed(embed, data)
+            metrics.inc("exometric_embed_reused_total", server=monitor.name)
+            return embed, files, view, fingerprint
+
+        embed, files = create_status_embed(data, monitor.host, state)
+        # A view só muda com online/offline: reaproveita a instância entre ticks
+        view = status_view_for(self.bot, monitor, is_online=(data is not None))
+        fingerprint = render_fingerprint(embed, files, view)
+        monitor.rendered_status = (key, embed, files, view, fingerprint)
+        return embed, files, view, fingerprint
+
+    async def update_presence(self, monitor):
+        # Com o stream ativo, entradas/saídas chegam por evento; o poll só ressincroniza
+        # depois de uma (re)conexão ou a cada STREAM_RESYNC_INTERVAL segundos
+        if monitor.stream is not None and monitor.stream.connected and not monitor.needs_resync:
+            if time.monotonic() - monitor.last_presence_poll < settings.current.stream_resync_interval:
+                monitor.presence_schedule.hold(monitor.presence_schedule.base, "stream de eventos ativo")
+                return
+        monitor.needs_resync = False
+        monitor.last_presence_poll = time.monotonic()
+
+        # Só a lista leve (uuid/nome/ping): inventários ficam para quando o dossiê é aberto
+        with metrics.timer("fetch_roster", server=monitor.name):
+            players_data = await monitor.cache.refresh_roster()
+
+        if self.publisher is not None:
+            players = None if players_data is None else [{'uuid': p.uuid, 'name': p.name, 'ping': p.ping, 'dimension': p.dimension} for p in players_data]
+            self.publisher.publish(monitor.name, "roster", {'players': players})
+        await self.apply_roster(monitor, players_data)
+
+    async def apply_roster(self, monitor, players_data):
+        """Diff de entradas/saídas a partir de uma lista de jogadores (lida aqui ou recebida do líder)."""
+        if players_data is None:
+            # Falha na leitura não é "todo mundo saiu": mantém o índice até o servidor
+            # ser confirmado offline (a notificação de queda já cobre as saídas)
+            monitor.presence_schedule.on_unreachable()
+            if monitor.server_online is False:
+                monitor.players.replace([])
+                self._record_sessions(monitor)
+            await self._dispatch(monitor, {'embed': None})
+            return
+
+        # Lógica de Entrada/Saída
         current_players = {}
-        if players_data and 'players' in players_data:
-            current_players = {p['uuid']: p['name'] for p in players_data['players']}
-        
+        if players_data:
+            current_players = {p.uuid: p for p in players_data}
+
         new_joins = []
         new_leaves = []
-        
-        if not self.first_run:
+
+        if not monitor.first_run:
             # 📥 QUEM ENTROU
-            join_uuids = set(current_players.keys()) - set(self.online_players.keys())
-            for uuid in join_uuids:
-                new_joins.append({'uuid': uuid, 'name': current_players[uuid]})
-            
+            for uuid, player in current_players.items():
+                if uuid not in monitor.players:
+                    new_joins.append({'uuid': uuid, 'name': player.name})
+
             # 📤 QUEM SAIU
-            leave_uuids = set(self.online_players.keys()) - set(current_players.keys())
-            for uuid in leave_uuids:
-                new_leaves.append({'uuid': uuid, 'name': self.online_players[uuid]})
-
-        for guild in self.bot.guilds:
-            guild_id = str(guild.id)
-            msg_info = self.bot.status_messages.get(guild_id)
-
-            if not msg_info:
-                # Auto-descoberta se não houver no DB
-                channel = discord.utils.get(guild.text_channels, name='📊-status-servidor')
-                if channel:
-                    try:
-                        async for message in channel.history(limit=20):
-                            if message.author.id == self.bot.user.id and message.embeds:
-                                self.bot.save_status_message(guild.id, channel.id, message.id)
-                                msg_info = self.bot.status_messages.get(guild_id)
-                                break
-                    except: pass
-
-            if not msg_info: continue
+            for player in monitor.players:
+                if player.uuid not in current_players:
+                    new_leaves.append({'uuid': player.uuid, 'name': player.name})
 
-            try:
-                channel = self.bot.get_channel(msg_info['channel_id']) or await self.bot.fetch_channel(msg_info['channel_id'])
-                
-                # Atualiza o Embed Principal
+        monitor.presence_schedule.on_success(bool(new_joins or new_leaves))
+
+        self._collect_player_notifications(monitor, new_joins, new_leaves)
+        # Sem embed: esse ciclo só entrega notificações (se o lote estiver pronto)
+        await self._dispatch(monitor, {'embed': None})
+
+        monitor.players.replace(current_players.values())
+        monitor.first_run = False
+        self._record_sessions(monitor)
+
+    async def _on_stream_connect(self, monitor):
+        print(f"📡 Stream de eventos conectado ({monitor.name})")
+        monitor.needs_resync = True
+
+    async def handle_follower_message(self, message):
+        """Líder: mudança no estado persistido feita num seguidor; grava e repassa a todos."""
+        if message.get('kind') == 'store':
+            store.apply(message)
+
+    async def handle_cluster_message(self, message):
+        """Seguidor: aplica o snapshot publicado pelo líder como se tivesse acabado de ler da API."""
+        if message.get('kind') == 'store':
+            store.apply(message, notify=False)
+            return
+        if message.get('kind') == 'store_sync':
+            store.replace(message['data'])
+            return
+        monitor = registry.get(message.get('server'))
+        if monitor is None:
+            return
+        try:
+            kind = message['kind']
+            if kind == 'stats':
+                data = ServerStats.from_dict(message['data']) if message['data'] is not None else None
+                # Cache e estado locais ficam iguais aos do líder (botões e motivo do offline)
+                monitor.service.states['stats'] = message['state']
+                if data is not None:
+                    monitor.cache.put('stats', data)
+                await self.apply_stats(monitor, data, message['state'])
+            elif kind == 'roster':
+                players = None
+                if message['players'] is not None:
+                    players, _ = parse_players(message['players'], keep_raw=False)
+                    monitor.cache.put('roster', players)
+                await self.apply_roster(monitor, players)
+            elif kind == 'event':
+                await self.handle_stream_event(monitor, StreamEvent(None, message['type'], message['data']))
+        except (KeyError, ModelError) as e:
+            metrics.error("cluster_receive", e, server=monitor.name)
+
+    async def handle_stream_event(self, monitor, event):
+        """Eventos push: entradas/saídas são notificadas na hora, sem esperar o próximo poll."""
+        if self.publisher is not None:
+            # Eventos não são reenviados na reconexão: só valem no momento em que acontecem
+            self.publisher.publish(monitor.name, "event", {'type': event.type, 'data': event.data}, replay=False)
+        try:
+            if event.type == 'join':
+                player = Player.from_dict(event.data, keep_raw=False)
+                if player.uuid not in monitor.players:
+                    monitor.players.add(player)
+                    if self.cluster.polls:
+                        sessions.join(monitor.name, player, time.time())
+                    self._collect_player_notifications(monitor, [{'uuid': player.uuid, 'name': player.name}], [])
+            elif event.type == 'leave':
+                player = Player.from_dict(event.data, keep_raw=False)
+                left = monitor.players.remove(player.uuid)
+                if self.cluster.polls:
+                    sessions.leave(monitor.name, player.uuid, time.time())
+                name = left.name if left is not None else player.name
+                self._collect_player_notifications(monitor, [], [{'uuid': player.uuid, 'name': name}])
+            elif event.type == 'stats':
+                # Mantém o cache dos botões fresco; o painel continua no ritmo do update_loop
+                monitor.cache.put('stats', ServerStats.from_dict(event.data))
+            else:
+                return
+        except ModelError as e:
+            metrics.error("stream_event", e, server=monitor.name)
+            return
+        self._schedule_stream_flush(monitor)
+
+    def _schedule_stream_flush(self, monitor):
+        """
+        Eventos do stream só enfileiram notificações: uma tarefa curta junta tudo que
+        chegar em STREAM_FLUSH_DELAY segundos num único envio por guild, sem prender
+        o leitor do stream nos limites de envio do Discord.
+        """
+        if monitor.stream_flush is None or monitor.stream_flush.done():
+            monitor.stream_flush = asyncio.create_task(self._stream_flush(monitor))
+
+    async def _stream_flush(self, monitor):
+        await asyncio.sleep(self.stream_flush_delay)
+        try:
+            await self._dispatch(monitor, {'embed': None})
+        except Exception as e:
+            metrics.error("stream_flush", e, server=monitor.name)
+
+    async def _dispatch(self, monitor, tick):
+        """Anexa as notificações prontas ao tick e distribui o trabalho entre as guilds."""
+        notifications = []
+        if monitor.notifications.ready():
+            notifications = split_messages(create_notification_embeds(monitor.notifications.drain(), monitor.label))
+        alerts = []
+        if monitor.pending_alerts:
+            alerts = split_messages(create_alert_embeds(monitor.pending_alerts, monitor.label))
+            monitor.pending_alerts = []
+        if tick['embed'] is None and not notifications and not alerts:
+            return
+
+        tick['notifications'] = notifications
+        tick['alerts'] = alerts
+        tick['mention'] = settings.current.mention
+
+        # Cada guild é processada em paralelo; uma guild lenta não atrasa as outras
+        with metrics.timer("fanout", server=monitor.name):
+            report = await self.fanout.run([(guild.id, (guild, monitor, tick)) for guild in self.bot.guilds], self._update_guild)
+        self.last_report = report
+        metrics.inc("exometric_guild_updates_total", len(report.completed), server=monitor.name, result="ok")
+        metrics.inc("exometric_guild_updates_total", len(report.failed), server=monitor.name, result="failed")
+        metrics.inc("exometric_guild_updates_total", len(report.skipped), server=monitor.name, result="skipped")
+        if report.skipped or report.failed:
+            print(f"⚠️ Tick parcial ({monitor.name}): {report}. Puladas: {report.skipped}")
+
+    def _record_sessions(self, monitor):
+        """Sessões de jogo seguem o índice de jogadores; em cluster só o processo que consulta a API grava."""
+        if self.cluster.polls:
+            sessions.sync(monitor.name, monitor.players, time.time())
+
+    def _collect_server_notifications(self, monitor, data, was_online, is_online):
+        cfg = settings.current
+
+        # 🟢 SERVIDOR LIGOU
+        if was_online is False and is_online and cfg.notify_server_start:
+            launch_ts = int(time.time() - data.uptime_seconds) if data else None
+            monitor.notifications.add_start(launch_ts)
+
+        # 🔴 SERVIDOR DESLIGOU
+        elif was_online is True and is_online is False and cfg.notify_server_stop:
+            monitor.notifications.add_stop()
+
+    def _collect_player_notifications(self, monitor, new_joins, new_leaves):
+        cfg = settings.current
+
+        # 📥 ENTRADAS
+        if cfg.notify_login:
+            for p in new_joins:
+                monitor.notifications.add_join(p)
+
+        # 📤 SAÍDAS
+        if cfg.notify_logout:
+            for p in new_leaves:
+                monitor.notifications.add_leave(p)
+
+    async def _update_guild(self, args):
+        guild, monitor, tick = args
+        embed = tick['embed']
+
+        guild_id = str(guild.id)
+        status_messages = self.bot.status_messages_for(monitor)
+        msg_info = status_messages.get(guild_id)
+
+        if not msg_info:
+            # Auto-descoberta se não houver no DB (com cache negativo por guild)
+            found = await monitor.discovery.find(guild)
+            if found:
+                self.bot.save_status_message(guild.id, found[0], found[1], monitor)
+                msg_info = status_messages.get(guild_id)
+
+        if tick['alerts']:
+            await self._deliver_alerts(guild_id, msg_info, tick['alerts'])
+
+        if not msg_info: return
+
+        # Exception (e não except puro) para não engolir o cancelamento do prazo do tick
+        try:
+            # Handle em memória: sem fetch_channel/fetch_message a cada tick
+            message = monitor.message_cache.get_handle(guild_id, msg_info)
+            channel = message.channel
+
+            # Atualiza o Embed Principal (só se o conteúdo visível mudou)
+            if embed is not None and monitor.message_cache.needs_edit(guild_id, tick['fingerprint']):
                 try:
-                    message = await channel.fetch_message(msg_info['message_id'])
-                    await message.edit(embed=embed, attachments=files, view=view)
-                except: pass # Mensagem original sumiu
-
-                # --- Lógica de Notificações ---
-                role_id = os.getenv("MENTION_ROLE_ID", "")
-                mention = f"<@&{role_id}>" if role_id else ""
-                
-                notify_start = os.getenv("NOTIFY_SERVER_START", "on").lower() == "on"
-                notify_stop = os.getenv("NOTIFY_SERVER_STOP", "on").lower() == "on"
-                notify_login = os.getenv("NOTIFY_LOGIN", "on").lower() == "on"
-                notify_logout = os.getenv("NOTIFY_LOGOUT", "on").lower() == "on"
-
-                # 🟢 SERVIDOR LIGOU
-                if self.server_online is False and is_online and notify_start:
-                    online_embed = discord.Embed(title="🚀 Servidor Iniciado!", description="O servidor foi **ligado com sucesso**!", color=0x57F287, timestamp=discord.utils.utcnow())
-                    if data:
-                        launch_ts = int(time.time() - data.get('uptime_seconds', 0))
-                        online_embed.add_field(name="⏱️ Online desde", value=f"<t:{launch_ts}:R>")
-                    await channel.send(content=mention, embed=online_embed, delete_after=60)
-
-                # 🔴 SERVIDOR DESLIGOU
-                elif self.server_online is True and not is_online and notify_stop:
-                    offline_embed = discord.Embed(title="🛑 Servidor Desconectado!", description="O servidor acaba de ficar **OFFLINE**.", color=0xFF4B4B, timestamp=discord.utils.utcnow())
-                    await channel.send(content=mention, embed=offline_embed, delete_after=60)
-
-                # 📥 ENTRADAS
-                if notify_login:
-                    for p in new_joins:
-                        join_embed = discord.Embed(title="📥 Novo Jogador Online!", description=f"O jogador **{p['name']}** entrou no mundo!", color=0x2ECC71, timestamp=discord.utils.utcnow())
-                        join_embed.set_thumbnail(url=f"https://mc-heads.net/avatar/{p['uuid']}/64")
-                        join_embed.add_field(name="⏱️ Hora da Entrada", value=f"<t:{int(time.time())}:R>")
-                        await channel.send(content=mention, embed=join_embed, delete_after=60)
-
-                # 📤 SAÍDAS
-                if notify_logout:
-                    for p in new_leaves:
-                        leave_embed = discord.Embed(title="📤 Jogador Desconectado!", description=f"O jogador **{p['name']}** saiu do mundo!", color=0xE67E22, timestamp=discord.utils.utcnow())
-                        leave_embed.set_thumbnail(url=f"https://mc-heads.net/avatar/{p['uuid']}/64")
-                        leave_embed.add_field(name="⏱️ Hora da Saída", value=f"<t:{int(time.time())}:R>")
-                        await channel.send(content=mention, embed=leave_embed, delete_after=60)
-
-            except: pass
+                    await self.route_limiter.acquire(("edit", channel.id))
+                    with metrics.timer("edit"):
+                        await message.edit(embed=embed, attachments=tick['files'], view=tick['view'])
+                    monitor.message_cache.mark_edited(guild_id, tick['fingerprint'])
+                except discord.NotFound:
+                    # Mensagem original sumiu: a entrada salva sai do store (senão todo tick
+                    # tentaria editar a mensagem apagada). Não reenvia: quem apagou pode não
+                    # querer o painel; o /setup ou a auto-descoberta trazem de volta
+                    monitor.message_cache.forget(guild_id)
+                    self.bot.forget_status_message(guild.id, monitor)
+                    monitor.discovery.invalidate(guild.id)
+                except Exception: pass # Já contabilizado pelo timer
+            elif embed is not None:
+                metrics.inc("exometric_edits_skipped_total", server=monitor.name)
 
-        # Atualiza estados para o próximo loop
-        self.online_players = current_players
-        self.server_online = is_online
-        self.first_run = False
+            # 🔔 Notificações agrupadas do tick (uma mensagem por guild)
+            for embeds in tick['notifications']:
+                await self._send(channel, content=tick['mention'], embeds=embeds, delete_after=60)
+
+        except Exception: pass # Já contabilizado pelos timers
+
+    async def _deliver_alerts(self, guild_id, msg_info, alerts):
+        """Alertas vão para o canal escolhido no /alerts (com o cargo de lá) ou, sem rota, para o canal do painel."""
+        route = store.get('alert_routes', {}).get(guild_id)
+        if route is not None:
+            if route.get('muted'):
+                return
+            channel_id = route['channel_id']
+            mention = f"<@&{route['role_id']}>" if route.get('role_id') else settings.current.mention
+        elif msg_info:
+            channel_id, mention = msg_info['channel_id'], settings.current.mention
+        else:
+            return
+
+        channel = self.bot.get_partial_messageable(channel_id)
+        try:
+            for embeds in alerts:
+                await self._send(channel, content=mention, embeds=embeds)
+        except Exception: pass # Já contabilizado pelo timer
 
-    @update_loop.before_loop
-    async def before_update_loop(self):
-        await self.bot.wait_until_ready()
+    # Eventos que podem fazer a auto-descoberta achar algo novo invalidam o cache negativo
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self._invalidate_discovery(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        # Renomeado para o nome do painel, permissões alteradas, etc.
+        self._invalidate_discovery(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._invalidate_discovery(guild.id)
+
+    def _invalidate_discovery(self, guild_id):
+        for monitor in registry:
+            if monitor.discovery is not None:
+                monitor.discovery.invalidate(guild_id)
+
+    async def _send(self, channel, **kwargs):
+        await self.route_limiter.acquire(("send", channel.id))
+        with metrics.timer("notify_send"):
+            await channel.send(**kwargs)
 
     @app_commands.command(name="setup", description="Configura o painel de status do ExoMetric")
+    @app_commands.describe(servidor="Servidor monitorado (padrão: o principal)")
+    @app_commands.autocomplete(servidor=server_autocomplete)
     @app_commands.checks.has_permissions(administrator=True)
-    async def setup(self, interaction: discord.Interaction):
+    async def setup(self, interaction: discord.Interaction, servidor: str = None):
         await interaction.response.defer(ephemeral=True)
-        
+
+        monitor = registry.get(servidor)
+        if monitor is None:
+            await interaction.followup.send(f"❌ Servidor `{servidor}` não encontrado.", ephemeral=True)
+            return
+
         guild_id = str(interaction.guild_id)
-        msg_info = self.bot.status_messages.get(guild_id)
+        msg_info = self.bot.status_messages_for(monitor).get(guild_id)
         channel = None
 
         # 1. Prioridade: Tentar recuperar o canal pelo ID salvo (mesmo se mudou o nome)
@@ -141,21 +502,21 @@ class StatusCog(commands.Cog):
 
         # 2. Se não achou por ID, tenta pelo nome padrão
         if not channel:
-            channel = discord.utils.get(interaction.guild.text_channels, name='📊-status-servidor')
-        
+            channel = discord.utils.get(interaction.guild.text_channels, name=monitor.channel_name)
+
         # 3. Se ainda não achou, cria um novo
         if not channel:
             channel = await interaction.guild.create_text_channel(
-                '📊-status-servidor',
+                monitor.channel_name,
                 overwrites={
                     interaction.guild.default_role: discord.PermissionOverwrite(send_messages=False, view_channel=True),
                     interaction.guild.me: discord.PermissionOverwrite(send_messages=True, view_channel=True)
                 }
             )
 
-        data = await exo_service.get_stats()
-        embed, files = create_status_embed(data)
-        view = StatusView(self.bot, exo_service, is_online=(data is not None))
+        data = await monitor.cache.get_stats()
+        embed, files = create_status_embed(data, monitor.host, monitor.service.state("stats"))
+        view = status_view_for(self.bot, monitor, is_online=(data is not None))
 
         message = None
         if msg_info:
@@ -166,9 +527,12 @@ class StatusCog(commands.Cog):
             except:
                 message = None
 
+        # O próximo tick reenvia o painel completo para essa guild
+        monitor.message_cache.forget(guild_id)
+
         if not message:
             message = await channel.send(embed=embed, file=files[0] if len(files) == 1 else None, files=files if len(files) > 1 else None, view=view)
-            self.bot.save_status_message(interaction.guild_id, channel.id, message.id)
+            self.bot.save_status_message(interaction.guild_id, channel.id, message.id, monitor)
 
         await interaction.followup.send(f"✅ Monitoramento configurado em {channel.mention}", ephemeral=True)
 
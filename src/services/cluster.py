@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import random
+from src.structures.models import loads
+from src.utils.instrumentation import metrics
+
+# Papéis de um processo do bot
+STANDALONE = "standalone" # Processo único: consulta a API e atualiza as próprias guilds
+LEADER = "leader" # Consulta a API, publica os snapshots e atualiza as próprias guilds
+FOLLOWER = "follower" # Não consulta a API: recebe os snapshots do líder pelo IPC local
+
+class ClusterConfig:
+    """Papel do processo e endereço do canal IPC (lidos do ambiente; o cluster.py preenche)."""
+
+    def __init__(self):
+        self.role = os.getenv("CLUSTER_ROLE", STANDALONE).lower()
+        host, _, port = os.getenv("CLUSTER_IPC", "127.0.0.1:8765").rpartition(":")
+        self.host = host or "127.0.0.1"
+        self.port = int(port)
+
+    @property
+    def polls(self):
+        return self.role != FOLLOWER
+
+    def describe(self):
+        return self.role if self.role == STANDALONE else f"{self.role} ({self.host}:{self.port})"
+
+def _encode(server, kind, payload):
+    return (json.dumps({'server': server, 'kind': kind, **payload}, ensure_ascii=False) + "\n").encode('utf-8')
+
+class SnapshotPublisher:
+    """
+    Lado do líder: servidor TCP local que repassa cada snapshot (uma linha JSON) a
+    todos os seguidores. O último snapshot de cada tipo é reenviado a quem conecta,
+    então um seguidor que (re)conecta não espera o próximo tick para ter estado.
+    Linhas mandadas pelos seguidores vão para `on_message`.
+    """
+    MAX_BUFFER = 4 * 1024 * 1024 # Seguidor travado acima disso é desconectado (ele reconecta)
+
+    def __init__(self, host, port, on_message=None):
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.replay_providers = [] # Funções () -> (servidor, tipo, payload) mandadas a quem conecta
+        self._server = None
+        self._writers = set()
+        self._last = {} # {(servidor, tipo): linha}
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._on_connect, self.host, self.port)
+        print(f"📡 IPC do cluster ouvindo em {self.host}:{self.port}")
+
+    async def _on_connect(self, reader, writer):
+        for line in self._last.values():
+            writer.write(line)
+        for provider in self.replay_providers:
+            writer.write(_encode(*provider()))
+        self._writers.add(writer)
+        metrics.set_gauge("exometric_cluster_followers", len(self._writers))
+        try:
+            while line := await reader.readline():
+                if self.on_message is None:
+                    continue
+                try:
+                    await self.on_message(loads(line))
+                except Exception as e:
+                    metrics.error("cluster_follower_message", e)
+        except ConnectionError:
+            pass
+        finally:
+            self._drop(writer)
+
+    def _drop(self, writer):
+        self._writers.discard(writer)
+        writer.close()
+        metrics.set_gauge("exometric_cluster_followers", len(self._writers))
+
+    def publish(self, server, kind, payload, replay=True):
+        line = _encode(server, kind, payload)
+        if replay:
+            self._last[(server, kind)] = line
+        for writer in list(self._writers):
+            if writer.transport.get_write_buffer_size() > self.MAX_BUFFER:
+                metrics.inc("exometric_errors_total", stage="cluster_publish", category="slow_follower")
+                self._drop(writer)
+                continue
+            writer.write(line)
+
+    async def close(self):
+        for writer in list(self._writers):
+            self._drop(writer)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+class SnapshotSubscriber:
+    """
+    Lado do seguidor: conecta no líder e entrega cada mensagem a `on_message` (reconecta sozinho).
+    `send` manda uma mensagem ao líder; sem conexão ela espera a próxima.
+    """
+
+    def __init__(self, host, port, on_message, max_backoff=30):
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.max_backoff = max_backoff
+        self.connected = False
+        self._task = None
+        self._writer = None
+        self._outbox = []
+
+    def send(self, kind, payload):
+        line = _encode("", kind, payload)
+        if self._writer is not None:
+            self._writer.write(line)
+        else:
+            self._outbox.append(line)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port, limit=2 ** 22)
+                self.connected = True
+                backoff = 1.0
+                print(f"🔗 Conectado ao líder do cluster em {self.host}:{self.port}")
+                for line in self._outbox:
+                    writer.write(line)
+                self._outbox.clear()
+                self._writer = writer
+                try:
+                    while line := await reader.readline():
+                        try:
+                            message = loads(line)
+                        except Exception as e:
+                            metrics.error("cluster_receive", e)
+                            continue
+                        await self.on_message(message)
+                finally:
+                    self._writer = None
+                    writer.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                metrics.error("cluster_receive", e)
+            if self.connected:
+                print("⚠️ Conexão com o líder do cluster perdida; reconectando...")
+            self.connected = False
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.5))
+            backoff = min(self.max_backoff, backoff * 2)
@@ -0,0 +1,130 @@
+import aiohttp
+import asyncio
+import random
+from src.structures.models import loads
+from src.utils.instrumentation import metrics
+
+class StreamUnavailable(Exception):
+    """O servidor não oferece o endpoint de eventos (ex.: versão antiga do mod)."""
+
+class StreamEvent:
+    __slots__ = ('id', 'type', 'data')
+
+    def __init__(self, event_id, event_type, data):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+
+    def __repr__(self):
+        return f"<StreamEvent {self.type} id={self.id}>"
+
+def parse_sse_lines(lines):
+    """
+    Parser incremental de Server-Sent Events: recebe linhas (str, sem o \\n)
+    e devolve StreamEvents a cada linha em branco. Comentários (':') são heartbeats.
+    """
+    event_id, event_type, data = None, "message", []
+    for line in lines:
+        if line == "":
+            if data:
+                yield StreamEvent(event_id, event_type, "\n".join(data))
+            event_id, event_type, data = None, "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "id":
+            event_id = value
+        elif field == "event":
+            event_type = value
+        elif field == "data":
+            data.append(value)
+
+class EventStreamClient:
+    """
+    Consome o feed de eventos do ExoMetric ({api_url}/events, SSE) e chama
+    `on_event` para cada join/leave/stats. Reconecta com backoff e retoma do
+    último id recebido (Last-Event-ID). Enquanto `connected` for falso, o
+    polling normal continua valendo.
+    """
+    HEARTBEAT_TIMEOUT = 60 # Sem nenhum byte nesse tempo, a conexão é considerada morta
+    UNAVAILABLE_RETRY = 300 # Endpoint inexistente: tenta de novo só depois disso
+
+    def __init__(self, service, on_event, on_connect=None, before=None, max_backoff=60):
+        self.service = service
+        self.on_event = on_event
+        self.on_connect = on_connect
+        self.before = before
+        self.max_backoff = max_backoff
+        self.connected = False
+        self.last_event_id = None
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="exometric-stream")
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+        self.connected = False
+
+    async def _stream(self):
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=self.HEARTBEAT_TIMEOUT)
+        params = {"token": self.service.api_token}
+
+        async with self.service.pool.get().get(f"{self.service.api_url}/events", params=params, headers=headers, timeout=timeout) as resp:
+            if resp.status in (404, 405, 501):
+                raise StreamUnavailable(f"HTTP {resp.status}")
+            resp.raise_for_status()
+
+            self.connected = True
+            if self.on_connect is not None:
+                await self.on_connect()
+
+            async def lines():
+                async for raw in resp.content:
+                    yield raw.decode('utf-8').rstrip("\r\n")
+
+            buffer = []
+            async for line in lines():
+                buffer.append(line)
+                if line != "":
+                    continue
+                for event in parse_sse_lines(buffer):
+                    if event.id is not None:
+                        self.last_event_id = event.id
+                    try:
+                        payload = loads(event.data)
+                    except Exception as e: # JSONDecodeError / erro do backend rápido
+                        metrics.error("stream_event", e)
+                        continue
+                    metrics.inc("exometric_stream_events_total", type=event.type)
+                    await self.on_event(StreamEvent(event.id, event.type, payload))
+                buffer = []
+
+    async def _run(self):
+        if self.before is not None:
+            await self.before()
+        failures = 0
+        while True:
+            try:
+                await self._stream()
+                failures = 0 # Servidor fechou a conexão normalmente
+            except asyncio.CancelledError:
+                raise
+            except StreamUnavailable as e:
+                self.connected = False
+                print(f"📴 Stream de eventos indisponível ({e}); usando polling.")
+                await asyncio.sleep(self.UNAVAILABLE_RETRY)
+                continue
+            except Exception as e:
+                metrics.error("stream", e)
+                failures += 1
+            self.connected = False
+            delay = min(self.max_backoff, 2 ** failures) * random.uniform(0.5, 1.0)
+            await asyncio.sleep(delay)
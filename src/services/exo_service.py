@@ -1,31 +1,225 @@
 import aiohttp
+import asyncio
 import os
+import random
+from collections import OrderedDict
+from src.structures.models import Player, ServerStats, loads, parse_players
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.instrumentation import metrics
+
+class HttpPool:
+    """
+    Sessão HTTP (pool de conexões com keep-alive) compartilhada por todos os
+    clientes da API, não importa quantos servidores estejam sendo monitorados.
+    """
+    POOL_LIMIT = 100
+    POOL_LIMIT_PER_HOST = 10
+    KEEPALIVE_SECONDS = 60
 
-class ExoMetricService:
     def __init__(self):
-        self.api_url = os.getenv("API_URL")
-        self.api_token = os.getenv("API_TOKEN")
+        self._session = None
+
+    @staticmethod
+    def request_timeout():
+        """
+        Conexão e leitura com limites separados: um host que aceita a conexão mas
+        nunca responde (meio-aberto) estoura o de leitura em vez de travar o loop.
+        """
+        connect = float(os.getenv("API_CONNECT_TIMEOUT", "5"))
+        read = float(os.getenv("API_READ_TIMEOUT", "10"))
+        return aiohttp.ClientTimeout(total=connect + read, sock_connect=connect, sock_read=read)
+
+    def get(self):
+        """Retorna a sessão compartilhada, criando-a sob demanda (precisa de um loop rodando)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.POOL_LIMIT,
+                limit_per_host=self.POOL_LIMIT_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_SECONDS,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.request_timeout())
+        return self._session
+
+    async def close(self):
+        """Fecha a sessão compartilhada (chamado no desligamento do bot)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+# Pool único do processo
+http_pool = HttpPool()
+
+# Resultado de uma chamada à API (o None devolvido aos chamadores não diz o porquê)
+OK = "ok"
+OFFLINE = "offline" # Conexão recusada/derrubada: servidor fora do ar
+TIMEOUT = "timeout" # Conectou (ou tentou) mas não respondeu a tempo
+AUTH_ERROR = "auth_error" # 401/403: servidor no ar, token errado
+MALFORMED = "malformed" # Respondeu, mas com JSON quebrado ou fora do formato
+HTTP_ERROR = "http_error" # Outro status HTTP (5xx, 404...)
+CIRCUIT_OPEN = "circuit_open" # Nem tentou: disjuntor aberto depois de falhas seguidas
+
+# Falhas que indicam servidor inacessível: são repetidas e contam para o disjuntor
+TRANSIENT_STATES = (OFFLINE, TIMEOUT, HTTP_ERROR)
+
+class ExoMetricService:
+    # Campos pedidos na lista leve de jogadores (presença e histórico de sessões só precisam disso)
+    ROSTER_FIELDS = ("uuid", "name", "ping", "dimension")
+
+    def __init__(self, api_url=None, api_token=None, pool=None, name=None):
+        self.api_url = api_url or os.getenv("API_URL")
+        self.api_token = api_token or os.getenv("API_TOKEN")
+        self.pool = pool or http_pool
+        self.name = name or "principal"
+        # LRU {url+params: (ETag, corpo já decodificado)}: cada /players/{uuid} consultado
+        # vira uma entrada, então o tamanho é limitado
+        self._etags = OrderedDict()
+        self.etag_cache_size = int(os.getenv("API_ETAG_CACHE_SIZE", "256"))
+        self._player_endpoint = True # Vira False se o mod não tiver /players/{uuid}
+        self.retries = int(os.getenv("API_RETRIES", "2"))
+        self.retry_backoff = float(os.getenv("API_RETRY_BACKOFF", "0.5"))
+        self.breaker = CircuitBreaker(
+            threshold=int(os.getenv("API_BREAKER_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("API_BREAKER_RESET", "30"))
+        )
+        self.states = {} # {tipo de chamada: resultado da última} ("stats", "roster", ...)
+
+    async def _request(self, url, extra_params=None, decode=None):
+        """
+        GET com compressão e requisição condicional: se a resposta anterior trouxe
+        ETag, manda If-None-Match e um 304 devolve o modelo guardado sem baixar nem
+        decodificar nada. `decode` transforma o JSON no modelo (validação fica aqui,
+        na borda; a UI só recebe dados já confiáveis).
+        Falhas transitórias são repetidas com backoff e alimentam o disjuntor.
+        Retorna (resultado, status HTTP, corpo).
+        """
+        if not self.breaker.allow():
+            metrics.inc("exometric_api_short_circuited_total", server=self.name)
+            return CIRCUIT_OPEN, 0, None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                # Backoff exponencial com jitter entre as tentativas
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+                metrics.inc("exometric_api_retries_total", server=self.name)
+            state, status, body = await self._attempt(url, extra_params, decode)
+            if state not in TRANSIENT_STATES or 400 <= status < 500:
+                break
+
+        if state in TRANSIENT_STATES and not 400 <= status < 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success() # Respondeu (mesmo que 401/404): o servidor está no ar
+        metrics.set_gauge("exometric_api_circuit_open", 0 if self.breaker.state == CircuitBreaker.CLOSED else 1, server=self.name)
+        return state, status, body
+
+    async def _attempt(self, url, extra_params, decode):
+        params = {"token": self.api_token}
+        if extra_params:
+            params.update(extra_params)
+        cache_key = (url, tuple(sorted(params.items())))
+        headers = {"Accept-Encoding": "gzip, deflate"}
+        cached = self._etags.get(cache_key)
+        if cached:
+            self._etags.move_to_end(cache_key)
+            headers["If-None-Match"] = cached[0]
+
+        try:
+            async with self.pool.get().get(url, params=params, headers=headers) as resp:
+                if resp.status == 304 and cached:
+                    metrics.inc("exometric_api_not_modified_total")
+                    return OK, 200, cached[1]
+                if resp.status == 200:
+                    raw = await resp.read()
+                    try:
+                        with metrics.timer("decode"):
+                            body = loads(raw)
+                            if decode is not None:
+                                body = decode(body)
+                    except Exception:
+                        # JSON quebrado ou fora do formato (o timer já contou o erro em "decode")
+                        return MALFORMED, 200, None
+                    etag = resp.headers.get("ETag")
+                    if etag:
+                        self._etags[cache_key] = (etag, body)
+                        self._etags.move_to_end(cache_key)
+                        while len(self._etags) > self.etag_cache_size:
+                            self._etags.popitem(last=False)
+                    else:
+                        self._etags.pop(cache_key, None)
+                    return OK, 200, body
+                metrics.inc("exometric_errors_total", stage="api_fetch", category=f"http_{resp.status}")
+                if resp.status in (401, 403):
+                    return AUTH_ERROR, resp.status, None
+                return HTTP_ERROR, resp.status, None
+        except asyncio.TimeoutError as e:
+            metrics.error("api_fetch", e)
+            return TIMEOUT, 0, None
+        except Exception as e:
+            metrics.error("api_fetch", e)
+            return OFFLINE, 0, None
+
+    async def _fetch(self, kind, url, extra_params=None, decode=None):
+        state, _, body = await self._request(url, extra_params, decode)
+        self.states[kind] = state
+        return body
+
+    def state(self, kind):
+        """Resultado da última chamada daquele tipo (OK, OFFLINE, TIMEOUT...)."""
+        return self.states.get(kind, OK)
+
+    def _players(self, keep_raw):
+        def decode(data):
+            players, dropped = parse_players(data, keep_raw)
+            if dropped:
+                metrics.inc("exometric_errors_total", stage="decode", category="invalid_player", value=dropped)
+            return players
+        return decode
 
     async def get_stats(self):
-        async with aiohttp.ClientSession() as session:
-            try:
-                params = {"token": self.api_token}
-                async with session.get(self.api_url, params=params) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-            except:
-                pass
-        return None
+        """ServerStats ou None se o servidor não respondeu."""
+        return await self._fetch("stats", self.api_url, decode=ServerStats.from_dict)
 
     async def get_players(self):
-        async with aiohttp.ClientSession() as session:
-            try:
-                params = {"token": self.api_token}
-                async with session.get(f"{self.api_url}/players", params=params) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-            except:
-                pass
-        return None
-
-exo_service = ExoMetricService()
+        """Lista completa de Player (inclui inventários em `raw`) ou None."""
+        return await self._fetch("players", f"{self.api_url}/players", decode=self._players(keep_raw=True))
+
+    async def get_roster(self):
+        """
+        Lista leve (uuid/nome/ping/dimensão) para detectar entradas e saídas. Pede a projeção
+        via ?fields=; se o mod ignorar o parâmetro, o resto é descartado no decode.
+        """
+        return await self._fetch(
+            "roster",
+            f"{self.api_url}/players",
+            {"fields": ",".join(self.ROSTER_FIELDS)},
+            decode=self._players(keep_raw=False)
+        )
+
+    async def get_player(self, uuid):
+        """Player completo (dossiê). Usa /players/{uuid} quando o mod oferece."""
+        if self._player_endpoint:
+            state, status, player = await self._request(
+                f"{self.api_url}/players/{uuid}",
+                decode=lambda data: Player.from_dict(data.get('player', data) if isinstance(data, dict) else data)
+            )
+            self.states["player"] = state
+            if state == OK and player:
+                return player
+            if status not in (404, 405, 501):
+                return None
+
+        players = await self.get_players()
+        if not players:
+            return None
+        player = next((p for p in players if p.uuid == uuid), None)
+        if player is not None and self._player_endpoint:
+            # O jogador existe mas a rota não: o mod não tem o endpoint por uuid
+            self._player_endpoint = False
+        return player
+
+    async def get_snapshot(self):
+        """Busca stats e jogadores em paralelo. Retorna (stats, players)."""
+        stats, players = await asyncio.gather(self.get_stats(), self.get_players())
+        return stats, players
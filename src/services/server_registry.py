@@ -0,0 +1,164 @@
+import json
+import os
+from src.services.exo_service import ExoMetricService, http_pool
+from src.services.snapshot_cache import SnapshotCache
+from src.utils.alerts import AlertEngine, load_alert_rules
+from src.utils.metrics_history import MetricsHistory
+from src.utils.notifications import NotificationBatch
+from src.utils.player_index import PlayerIndex
+from src.utils.scheduler import AdaptiveInterval
+from src.utils.settings import settings
+
+DEFAULT_HOST = "osguri.servegame.net"
+DEFAULT_CHANNEL_NAME = "📊-status-servidor"
+
+class ServerMonitor:
+    """
+    Tudo que pertence a um servidor monitorado: cliente da API, cache, histórico,
+    agenda de polling e o estado usado para detectar mudanças.
+    O servidor principal (primeiro da lista) mantém as chaves antigas
+    (custom_ids dos botões, 'status_messages' no data.json, nome do canal).
+    """
+
+    def __init__(self, name, api_url, api_token, host=None, primary=False, stream=False):
+        self.name = name
+        self.host = host or DEFAULT_HOST
+        self.primary = primary
+        self.service = ExoMetricService(api_url, api_token, pool=http_pool, name=name)
+        self.cache = SnapshotCache(self.service)
+        self.history = MetricsHistory()
+        self.notifications = NotificationBatch(debounce=settings.current.notify_debounce)
+        self.alerts = AlertEngine(load_alert_rules(name))
+        self.pending_alerts = [] # Eventos de alerta aguardando o próximo envio
+
+        # Cadências independentes: stats (painel, pesado) e presença (entradas/saídas, leve)
+        max_backoff = float(os.getenv("POLL_MAX_BACKOFF", "120"))
+        self.stats_schedule = AdaptiveInterval(
+            base=float(os.getenv("STATS_INTERVAL", "15")),
+            fast=float(os.getenv("STATS_FAST_INTERVAL", "10")),
+            max_interval=max_backoff
+        )
+        self.presence_schedule = AdaptiveInterval(
+            base=float(os.getenv("PRESENCE_INTERVAL", "10")),
+            fast=float(os.getenv("PRESENCE_FAST_INTERVAL", "5")),
+            max_interval=max_backoff
+        )
+
+        # Estado entre ciclos
+        self.players = PlayerIndex() # Jogadores online (uuid e busca por nome)
+        self.first_run = True
+        self.server_online = None # Status confirmado do servidor
+        self.confirmations = max(1, int(os.getenv("STATE_CONFIRMATIONS", "2")))
+        self._pending_online = None # Leitura divergente do status confirmado...
+        self._pending_count = 0 # ...e quantas vezes seguidas ela se repetiu
+        self.last_stats = None
+        self.message_cache = None # StatusMessageCache, criado pelo StatusCog
+        self.discovery = None # ChannelDiscovery, criado pelo StatusCog
+        self.status_views = {} # {online?: StatusView} reaproveitadas entre ticks
+        self.rendered_status = None # ((snapshot, estado), embed, files, view, fingerprint) do último tick
+
+        # Stream de eventos (SSE) opcional; o polling de presença vira só ressincronização
+        self.stream_enabled = stream
+        self.stream = None # EventStreamClient, criado pelo StatusCog
+        self.needs_resync = False
+        self.last_presence_poll = 0.0
+        self.stream_flush = None # Tarefa que junta as notificações do stream antes do envio
+
+    def confirm_online(self, online):
+        """
+        Alimenta uma leitura (True/False, ou None quando ela não diz nada, ex.: token
+        errado) e retorna o status confirmado. Ligar/desligar só é aceito depois de
+        `confirmations` leituras seguidas, para um timeout isolado não virar
+        notificação falsa de queda e volta.
+        """
+        if online is None or online == self.server_online:
+            self._pending_online, self._pending_count = None, 0
+            return self.server_online
+        if self.server_online is None:
+            # Primeira leitura: não há o que confirmar (e nem o que notificar)
+            self.server_online = online
+            return online
+
+        if online == self._pending_online:
+            self._pending_count += 1
+        else:
+            self._pending_online, self._pending_count = online, 1
+        if self._pending_count >= self.confirmations:
+            self.server_online = online
+            self._pending_online, self._pending_count = None, 0
+        return self.server_online
+
+    @property
+    def messages_key(self):
+        """Chave no data.json com o mapeamento {guild_id: mensagem de status}."""
+        return "status_messages" if self.primary else f"status_messages:{self.name}"
+
+    @property
+    def view_suffix(self):
+        """Sufixo dos custom_ids dos botões persistentes."""
+        return "" if self.primary else f":{self.name}"
+
+    @property
+    def channel_name(self):
+        return DEFAULT_CHANNEL_NAME if self.primary else f"📊-status-{self.name}"
+
+    @property
+    def label(self):
+        """Nome exibido nas notificações (vazio quando só existe um servidor)."""
+        return "" if len(registry.monitors) <= 1 else self.name
+
+    def history_path(self, base_path):
+        return base_path if self.primary else f"{base_path}.{self.name}"
+
+def load_server_configs():
+    """
+    Lê a lista de servidores de SERVERS_FILE (JSON), ou usa API_URL/API_TOKEN
+    como servidor único quando o arquivo não está configurado.
+    """
+    path = os.getenv("SERVERS_FILE", "")
+    if not path:
+        return [{"name": "principal", "api_url": os.getenv("API_URL"), "api_token": os.getenv("API_TOKEN")}]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    names = [entry['name'] for entry in entries]
+    if not entries or len(set(names)) != len(names):
+        raise ValueError(f"{path}: a lista de servidores precisa ter nomes únicos e não pode ser vazia")
+    return entries
+
+class ServerRegistry:
+    def __init__(self):
+        self.monitors = []
+        self._by_name = {}
+
+    def load(self):
+        if self.monitors:
+            return self
+        for i, entry in enumerate(load_server_configs()):
+            monitor = ServerMonitor(
+                name=entry['name'],
+                api_url=entry.get('api_url'),
+                api_token=entry.get('api_token'),
+                host=entry.get('host'),
+                primary=(i == 0),
+                stream=entry.get('stream', os.getenv("EXOMETRIC_STREAM", "off").lower() == "on")
+            )
+            self.monitors.append(monitor)
+            self._by_name[monitor.name] = monitor
+        return self
+
+    @property
+    def primary(self):
+        return self.monitors[0]
+
+    def get(self, name=None):
+        """Servidor pelo nome; sem nome, o principal."""
+        if not name:
+            return self.primary
+        return self._by_name.get(name)
+
+    def __iter__(self):
+        return iter(self.monitors)
+
+# Registro único dos servidores monitorados (carregado no setup_hook)
+registry = ServerRegistry()
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import time
+
+class SnapshotCache:
+    """
+    Cache compartilhado na frente de um ExoMetricService (um por servidor monitorado).
+    - Dentro do TTL: responde direto da memória.
+    - Entre o TTL e o limite de "stale": responde o valor antigo e revalida em segundo plano.
+    - Chamadas simultâneas para a mesma chave aguardam a mesma requisição (single-flight).
+    Expõe a mesma interface de leitura do serviço (get_stats/get_players/get_roster/get_player),
+    então pode ser passado direto para as Views.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.ttl = float(os.getenv("CACHE_TTL", "10"))
+        self.stale_ttl = float(os.getenv("CACHE_STALE_TTL", "60"))
+        self._entries = {} # {chave: (valor, momento da busca)}
+        self._inflight = {} # {chave: asyncio.Task}
+
+    MAX_ENTRIES = 256 # Chaves por jogador ("player:<uuid>") são podadas acima disso
+
+    def _loader(self, key):
+        if key.startswith("player:"):
+            uuid = key.split(":", 1)[1]
+            return lambda: self.service.get_player(uuid)
+        return {
+            "stats": self.service.get_stats,
+            "players": self.service.get_players,
+            "roster": self.service.get_roster
+        }[key]
+
+    def put(self, key, value):
+        self._entries[key] = (value, time.monotonic())
+        if len(self._entries) > self.MAX_ENTRIES:
+            limit = time.monotonic() - (self.ttl + self.stale_ttl)
+            for old_key in [k for k, (_, fetched_at) in self._entries.items() if fetched_at < limit]:
+                del self._entries[old_key]
+
+    def _load(self, key):
+        # Single-flight: se já existe uma busca em andamento, reaproveita a mesma Task
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key))
+            self._inflight[key] = task
+        return task
+
+    async def _run(self, key):
+        try:
+            value = await self._loader(key)()
+            self.put(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get(self, key):
+        entry = self._entries.get(key)
+        if entry:
+            value, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                return value
+            if age < self.ttl + self.stale_ttl:
+                # Stale-while-revalidate: devolve o que tem e atualiza por trás
+                self._load(key)
+                return value
+        # shield: um clique cancelado não derruba a busca dos outros que estão esperando
+        return await asyncio.shield(self._load(key))
+
+    async def get_stats(self):
+        return await self._get("stats")
+
+    async def get_players(self):
+        return await self._get("players")
+
+    async def get_roster(self):
+        return await self._get("roster")
+
+    async def get_player(self, uuid):
+        return await self._get(f"player:{uuid}")
+
+    async def refresh_stats(self):
+        return await asyncio.shield(self._load("stats"))
+
+    async def refresh_roster(self):
+        return await asyncio.shield(self._load("roster"))
+
+    async def refresh_player(self, uuid):
+        return await asyncio.shield(self._load(f"player:{uuid}"))
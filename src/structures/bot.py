@@ -1,45 +1,110 @@
 import discord
 from discord.ext import commands
 import asyncio
-from src.utils.persistence import load_data, save_data
+import os
+from src.utils.persistence import store
+from src.utils.settings import settings
 
-class ExoBot(commands.Bot):
+def _shard_options():
+    """SHARD_COUNT/SHARD_IDS (preenchidos pelo cluster.py); vazios = o Discord decide os shards."""
+    shard_count = int(os.getenv("SHARD_COUNT", "0") or 0)
+    shard_ids = [int(i) for i in os.getenv("SHARD_IDS", "").split(",") if i.strip()]
+    if not shard_count:
+        return {}
+    return {"shard_count": shard_count, "shard_ids": shard_ids or None}
+
+class ExoBot(commands.AutoShardedBot):
     def __init__(self):
         intents = discord.Intents.default()
         intents.members = False
         intents.message_content = False
         
         # Prefix apenas como fallback, o foco são Comandos Slash
-        super().__init__(command_prefix="!", intents=intents)
+        super().__init__(command_prefix="!", intents=intents, **_shard_options())
+        self.metrics_server = None
+        self.warmup_task = None
         
-        data = load_data()
-        self.status_messages = data.get('status_messages', {})
+        # Referência direta ao dicionário do store (leituras sem disco)
+        self.status_messages = store.setdefault('status_messages', {})
+
+    def status_messages_for(self, monitor):
+        """Mapeamento {guild_id: mensagem de status} de um servidor monitorado."""
+        if monitor.primary:
+            return self.status_messages
+        return store.setdefault(monitor.messages_key, {})
 
-    def save_status_message(self, guild_id, channel_id, message_id):
-        self.status_messages[str(guild_id)] = {
+    def save_status_message(self, guild_id, channel_id, message_id, monitor=None):
+        key = monitor.messages_key if monitor else 'status_messages'
+        store.update(key, str(guild_id), {
             "channel_id": channel_id,
             "message_id": message_id
-        }
-        data = load_data()
-        data['status_messages'] = self.status_messages
-        save_data(data)
+        })
+
+    def forget_status_message(self, guild_id, monitor=None):
+        """Remove a mensagem de status salva da guild (ela foi apagada no Discord)."""
+        key = monitor.messages_key if monitor else 'status_messages'
+        store.delete(key, str(guild_id))
 
     async def setup_hook(self):
         # Imports locais para evitar circularidade
-        from src.utils.ui import StatusView
-        from src.services.exo_service import exo_service
-        from src.utils.inventory_renderer import renderer
-        
-        # Inicializar Assets proativamente
-        asyncio.create_task(renderer.initialize())
+        from src.utils.ui import status_view_for
+        from src.services.server_registry import registry
+
+        # Assets do inventário não são carregados aqui: ficam para o primeiro dossiê
+        # ou para o warm-up depois do on_ready (RENDER_WARMUP)
+        registry.load()
         await self.load_extension("src.cogs.status_cog")
+        await self.load_extension("src.cogs.history_cog")
+        await self.load_extension("src.cogs.player_cog")
+        await self.load_extension("src.cogs.alerts_cog")
+        await self.load_extension("src.cogs.stats_cog")
+        await self.load_extension("src.cogs.diagnostics_cog")
+
+        # Recarrega as configurações do tick quando o .env é alterado
+        settings.start(interval=float(os.getenv("SETTINGS_RELOAD_INTERVAL", "30")))
+
+        # Endpoint Prometheus local (opcional)
+        metrics_port = int(os.getenv("METRICS_PORT", "0") or 0)
+        if metrics_port:
+            from src.utils.instrumentation import MetricsServer
+            self.metrics_server = MetricsServer(port=metrics_port)
+            await self.metrics_server.start()
         
-        # Registrar views persistentes para os botões funcionarem sempre
-        self.add_view(StatusView(self, exo_service))
+        # Registrar views persistentes (uma por servidor) para os botões funcionarem sempre
+        for monitor in registry:
+            self.add_view(status_view_for(self, monitor, is_online=True))
         
         # Sincronização manual via comando é melhor que no boot
         print("✅ Bot configurado e pronto para ligar.")
 
     async def on_ready(self):
-        print(f"🤖 Bot online: {self.user}")
+        shards = ", ".join(str(i) for i in sorted(self.shards)) or "0"
+        print(f"🤖 Bot online: {self.user} (shards {shards} de {self.shard_count}, {len(self.guilds)} guilds)")
         print("💡 Se os comandos slash não aparecerem, use um comando de sync ou aguarde a propagação.")
+        if self.warmup_task is None and os.getenv("RENDER_WARMUP", "off").lower() == "on":
+            self.warmup_task = asyncio.create_task(self._warm_up_renderer(float(os.getenv("RENDER_WARMUP_DELAY", "30"))))
+
+    async def _warm_up_renderer(self, delay):
+        """Carrega a exo-inventory e os assets em segundo plano, depois que o painel já está no ar."""
+        from src.utils.inventory_renderer import renderer
+        await asyncio.sleep(delay)
+        try:
+            await renderer.initialize()
+            print("🎒 Renderizador de inventário pronto.")
+        except Exception as e:
+            print(f"⚠️ Erro ao pré-carregar o renderizador (será tentado no primeiro dossiê): {e}")
+
+    async def close(self):
+        from src.services.exo_service import http_pool
+        from src.utils.inventory_renderer import renderer
+
+        # Libera o pool de conexões da API e a thread de render antes de derrubar o gateway
+        settings.stop()
+        if self.warmup_task is not None:
+            self.warmup_task.cancel()
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+        await http_pool.close()
+        await renderer.close()
+        await store.flush()
+        await super().close()
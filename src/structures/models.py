@@ -0,0 +1,118 @@
+import json
+
+# Decoder de JSON mais rápido quando instalado (orjson > msgspec > json da stdlib)
+try:
+    import orjson
+    loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import msgspec
+        loads = msgspec.json.decode
+        JSON_BACKEND = "msgspec"
+    except ImportError:
+        loads = json.loads
+        JSON_BACKEND = "json"
+
+class ModelError(ValueError):
+    """Payload da API que não dá para transformar em modelo."""
+
+def _coerce(value, kind, default):
+    if value is None:
+        return default
+    if kind is bool:
+        return bool(value)
+    try:
+        return kind(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+# (campo, tipo, padrão) — o padrão é o que a UI já assumia quando o campo faltava
+STATS_SCHEMA = (
+    ("cpu_percent", float, 0.0),
+    ("memory_bytes", int, 0),
+    ("network_rx_bytes", int, 0),
+    ("network_tx_bytes", int, 0),
+    ("players_online", int, 0),
+    ("uptime_seconds", int, 0),
+    ("world_day", int, 0),
+    ("world_time", int, 0),
+    ("world_seed", str, "N/A"),
+    ("loaded_chunks", int, 0),
+    ("difficulty", str, "Normal"),
+    ("is_raining", bool, False),
+    ("disk_bytes", int, 0),
+    ("tps", float, 0.0),
+    ("mspt", float, 0.0),
+    ("heap_used_bytes", int, 0),
+    ("heap_max_bytes", int, 0),
+)
+
+PLAYER_SCHEMA = (
+    ("uuid", str, ""),
+    ("name", str, "???"),
+    ("ping", int, 0),
+    ("health", float, 0.0),
+    ("food", int, 0),
+    ("saturation", float, 0.0),
+    ("level", int, 0),
+    ("gamemode", str, "SURVIVAL"),
+    ("dimension", str, "???"),
+    ("x", float, 0.0),
+    ("y", float, 0.0),
+    ("z", float, 0.0),
+    ("online_seconds", int, 0),
+)
+
+class ServerStats:
+    """Snapshot de /mc-stats já validado; campos ausentes ou com tipo errado viram o padrão."""
+    __slots__ = tuple(name for name, _, _ in STATS_SCHEMA)
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict):
+            raise ModelError(f"stats: esperado objeto, veio {type(data).__name__}")
+        self = cls.__new__(cls)
+        for name, kind, default in STATS_SCHEMA:
+            setattr(self, name, _coerce(data.get(name), kind, default))
+        return self
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class Player:
+    """
+    Jogador online. `raw` guarda o payload original (inventário incluso) para o
+    renderer da exo-inventory; na lista leve (roster) ele fica None.
+    """
+    __slots__ = tuple(name for name, _, _ in PLAYER_SCHEMA) + ("raw",)
+
+    @classmethod
+    def from_dict(cls, data, keep_raw=True):
+        if not isinstance(data, dict):
+            raise ModelError(f"player: esperado objeto, veio {type(data).__name__}")
+        uuid = data.get("uuid")
+        if not uuid or not isinstance(uuid, str):
+            raise ModelError("player: sem uuid")
+        self = cls.__new__(cls)
+        for name, kind, default in PLAYER_SCHEMA:
+            setattr(self, name, _coerce(data.get(name), kind, default))
+        self.raw = data if keep_raw else None
+        return self
+
+def parse_players(data, keep_raw=True):
+    """
+    Converte {'players': [...]} em lista de Player. Entradas inválidas são puladas
+    (e contadas) em vez de derrubar o tick inteiro. Retorna (jogadores, descartados).
+    """
+    if isinstance(data, dict):
+        data = data.get("players")
+    if not isinstance(data, list):
+        raise ModelError("players: esperado lista de jogadores")
+    players, dropped = [], 0
+    for entry in data:
+        try:
+            players.append(Player.from_dict(entry, keep_raw))
+        except ModelError:
+            dropped += 1
+    return players, dropped
@@ -0,0 +1,190 @@
+import json
+import os
+from collections import deque
+
+# Métricas derivadas (o resto é lido direto do ServerStats pelo nome)
+DERIVED_METRICS = {
+    'heap_percent': lambda s: s.heap_used_bytes / s.heap_max_bytes * 100 if s.heap_max_bytes else None,
+}
+
+DEFAULT_RULES = [
+    {"name": "TPS baixo", "metric": "tps", "op": "<", "threshold": 15, "clear": 18, "window": 60, "agg": "mean"},
+    {"name": "MSPT alto", "metric": "mspt", "op": ">", "threshold": 50, "clear": 40, "window": 120, "agg": "mean", "unit": "ms"},
+    {"name": "CPU alta", "metric": "cpu_percent", "op": ">", "threshold": 90, "clear": 75, "window": 120, "agg": "mean", "unit": "%"},
+    {"name": "Heap quase cheio", "metric": "heap_percent", "op": ">", "threshold": 90, "clear": 80, "samples": 3, "agg": "all", "unit": "%"},
+]
+
+class SlidingWindow:
+    """
+    Janela deslizante por tempo (`seconds`) ou por quantidade (`samples`) com
+    média, mínimo e máximo em O(1) amortizado por amostra: soma corrente e duas
+    deques monotônicas (cada amostra entra e sai no máximo uma vez de cada).
+    """
+    __slots__ = ('seconds', 'samples', '_items', '_sum', '_min', '_max', '_seq', '_started')
+
+    def __init__(self, seconds=None, samples=None):
+        self.seconds = seconds
+        self.samples = samples
+        self.reset()
+
+    def reset(self):
+        self._items = deque() # (seq, ts, valor)
+        self._sum = 0.0
+        self._min = deque() # (seq, valor), valores crescentes
+        self._max = deque() # (seq, valor), valores decrescentes
+        self._seq = 0
+        self._started = None
+
+    def push(self, ts, value):
+        self._seq += 1
+        if self._started is None:
+            self._started = ts
+        self._items.append((self._seq, ts, value))
+        self._sum += value
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((self._seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((self._seq, value))
+
+        while self._items and (
+            (self.samples and len(self._items) > self.samples) or
+            (self.seconds and self._items[0][1] <= ts - self.seconds)
+        ):
+            seq, _, old = self._items.popleft()
+            self._sum -= old
+            if self._min[0][0] == seq:
+                self._min.popleft()
+            if self._max[0][0] == seq:
+                self._max.popleft()
+
+    @property
+    def full(self):
+        """A janela já cobre o período/quantidade pedido (antes disso não dá para concluir nada)."""
+        if not self._items:
+            return False
+        if self.samples:
+            return len(self._items) >= self.samples
+        return self._items[-1][1] - self._started >= self.seconds
+
+    def mean(self):
+        return self._sum / len(self._items)
+
+    def min(self):
+        return self._min[0][1]
+
+    def max(self):
+        return self._max[0][1]
+
+class AlertRule:
+    """Condição configurável: `agg` da métrica na janela comparado com o limite (`op`)."""
+
+    def __init__(self, entry):
+        self.name = entry['name']
+        self.metric = entry['metric']
+        self.op = entry.get('op', '>')
+        if self.op not in ('>', '<'):
+            raise ValueError(f"alerta {self.name}: op deve ser '>' ou '<'")
+        self.threshold = float(entry['threshold'])
+        # Histerese: só resolve depois de cruzar `clear` (do lado "bom" do limite)
+        self.clear = float(entry.get('clear', self.threshold))
+        self.window = entry.get('window')
+        self.samples = entry.get('samples')
+        if not self.window and not self.samples:
+            self.samples = 1
+        self.agg = entry.get('agg', 'mean')
+        if self.agg not in ('mean', 'min', 'max', 'all'):
+            raise ValueError(f"alerta {self.name}: agg deve ser mean, min, max ou all")
+        self.cooldown = float(entry.get('cooldown', 600))
+        self.unit = entry.get('unit', '')
+        self.servers = entry.get('servers') # None = todos
+
+    def value(self, stats):
+        derived = DERIVED_METRICS.get(self.metric)
+        return derived(stats) if derived else getattr(stats, self.metric, None)
+
+    def _agg(self, window, worst):
+        if self.agg == 'mean':
+            return window.mean()
+        if self.agg == 'all':
+            # "Todas as amostras acima do limite" = a menor acima; para resolver, a maior abaixo
+            above = self.op == '>'
+            return window.min() if above == worst else window.max()
+        return window.min() if self.agg == 'min' else window.max()
+
+    def triggered(self, window):
+        value = self._agg(window, worst=True)
+        return (value > self.threshold if self.op == '>' else value < self.threshold), value
+
+    def resolved(self, window):
+        value = self._agg(window, worst=False)
+        return (value < self.clear if self.op == '>' else value > self.clear), value
+
+    def describe(self):
+        span = f"{self.samples} amostras" if self.samples else f"{self.window:.0f}s"
+        agg = {'mean': "média", 'min': "mínimo", 'max': "máximo", 'all': "todas"}[self.agg]
+        return f"{self.metric} {self.op} {self.threshold:g}{self.unit} ({agg}, {span})"
+
+class _RuleState:
+    __slots__ = ('window', 'firing', 'last_fired')
+
+    def __init__(self, rule):
+        self.window = SlidingWindow(seconds=rule.window, samples=rule.samples)
+        self.firing = False
+        self.last_fired = None
+
+class AlertEngine:
+    """
+    Avalia as regras a cada amostra de stats de um servidor. Custo por amostra:
+    O(regras), cada uma O(1) amortizado. Retorna os eventos que mudaram de estado.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self._states = [(rule, _RuleState(rule)) for rule in rules]
+
+    def evaluate(self, stats, ts):
+        events = []
+        for rule, state in self._states:
+            value = rule.value(stats)
+            if value is None:
+                continue
+            state.window.push(ts, float(value))
+            if not state.window.full:
+                continue
+
+            if not state.firing:
+                triggered, agg_value = rule.triggered(state.window)
+                in_cooldown = state.last_fired is not None and ts - state.last_fired < rule.cooldown
+                if triggered and not in_cooldown:
+                    state.firing = True
+                    state.last_fired = ts
+                    events.append(self._event('alert', rule, agg_value))
+            else:
+                resolved, agg_value = rule.resolved(state.window)
+                if resolved:
+                    state.firing = False
+                    events.append(self._event('resolved', rule, agg_value))
+        return events
+
+    def _event(self, kind, rule, value):
+        return {'kind': kind, 'rule': rule.name, 'condition': rule.describe(), 'value': value, 'unit': rule.unit}
+
+    def reset(self):
+        """Servidor caiu: janelas e alertas ativos perdem o sentido (a queda já é notificada)."""
+        for _, state in self._states:
+            state.window.reset()
+            state.firing = False
+
+    def firing(self):
+        return [rule for rule, state in self._states if state.firing]
+
+def load_alert_rules(server_name):
+    """Regras do ALERTS_FILE (JSON, formato de alerts.example.json) ou as padrão."""
+    path = os.getenv("ALERTS_FILE", "")
+    entries = DEFAULT_RULES
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    return [AlertRule(e) for e in entries if not e.get('servers') or server_name in e['servers']]
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import struct
+from importlib import metadata
+from PIL import Image
+from exo_inventory import AssetsManager, InventoryRenderer as ExoRenderer
+from exo_inventory.renderer import SCALE, SLOT_SIZE
+
+# Importado só no primeiro uso do renderer (ver inventory_renderer.py): carregar
+# este módulo é o que traz a exo-inventory para a memória.
+
+ATLAS_MAGIC = b"EXOATLS1"
+ATLAS_FORMAT = 1 # Mude ao alterar o layout do arquivo: atlas antigos viram lixo e são refeitos
+
+ICON_SIZE = SLOT_SIZE * SCALE # Tamanho em que a biblioteca desenha cada ícone
+
+def _library_version():
+    try:
+        return metadata.version("exo-inventory")
+    except metadata.PackageNotFoundError:
+        return "?"
+
+class AssetAtlas:
+    """
+    Ícones da exo-inventory já decodificados e no tamanho do slot, num arquivo
+    versionado lido com mmap. Depois do primeiro build, um reinício não abre nem
+    redimensiona PNG nenhum, e só as páginas dos ícones usados entram na memória.
+    """
+
+    def __init__(self, directory, size=ICON_SIZE):
+        self.directory = directory
+        self.size = size
+        self.block = size * size * 4 # RGBA
+        self._file = None
+        self._map = None
+        self._slots = {} # {nome: posição no arquivo}
+        self.loaded_key = None
+
+    def key(self, assets_version):
+        """Versão do atlas: formato do arquivo + versão da biblioteca + versão dos assets + tamanho."""
+        raw = f"{ATLAS_FORMAT}|{_library_version()}|{assets_version}|{self.size}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+    def path(self, key):
+        return os.path.join(self.directory, f"atlas-{key}.bin")
+
+    def open(self, key):
+        """Mapeia o atlas dessa versão; False se ele não existe ou está inválido."""
+        self.close()
+        path = self.path(key)
+        if not os.path.exists(path):
+            return False
+        try:
+            f = open(path, 'rb')
+            if f.read(len(ATLAS_MAGIC)) != ATLAS_MAGIC:
+                f.close()
+                return False
+            (size,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(size))
+            start = len(ATLAS_MAGIC) + 4 + size
+            names = header['names']
+            if header['size'] != self.size or os.path.getsize(path) != start + len(names) * self.block:
+                print("⚠️ Atlas de assets truncado ou de outro tamanho, refazendo.")
+                f.close()
+                return False
+            self._file = f
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._slots = {name: start + i * self.block for i, name in enumerate(names)}
+            self.loaded_key = key
+            return True
+        except Exception as e:
+            print(f"⚠️ Erro ao abrir o atlas de assets: {e}")
+            self.close()
+            return False
+
+    def get(self, name):
+        offset = self._slots.get(name)
+        if offset is None:
+            return None
+        # Imagem somente leitura sobre o mmap: sem cópia até alguém redimensionar/colar
+        return Image.frombuffer("RGBA", (self.size, self.size), memoryview(self._map)[offset:offset + self.block], "raw", "RGBA", 0, 1)
+
+    def build(self, key, sources):
+        """Decodifica e redimensiona cada (nome, caminho do PNG) e grava o atlas de forma atômica."""
+        os.makedirs(self.directory, exist_ok=True)
+        names = []
+        tmp_path = f"{self.path(key)}.tmp"
+        with open(tmp_path, 'wb') as body:
+            for name, path in sources:
+                try:
+                    icon = Image.open(path).convert("RGBA")
+                except Exception:
+                    continue
+                # Mesmo filtro que a biblioteca usaria ao desenhar o ícone no slot
+                resample = Image.Resampling.NEAREST if icon.width <= 32 else Image.Resampling.LANCZOS
+                body.write(icon.resize((self.size, self.size), resample).tobytes())
+                names.append(name)
+
+        header = json.dumps({'format': ATLAS_FORMAT, 'size': self.size, 'names': names}).encode('utf-8')
+        final_tmp = f"{tmp_path}.final"
+        with open(final_tmp, 'wb') as f, open(tmp_path, 'rb') as body:
+            f.write(ATLAS_MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            while chunk := body.read(1 << 20):
+                f.write(chunk)
+        os.remove(tmp_path)
+        os.replace(final_tmp, self.path(key))
+
+        # Atlas de versões anteriores não serão mais abertos
+        for entry in os.listdir(self.directory):
+            if entry.startswith("atlas-") and entry != os.path.basename(self.path(key)):
+                try:
+                    os.remove(os.path.join(self.directory, entry))
+                except OSError:
+                    pass
+        return len(names)
+
+    def close(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass # Ainda há imagens apontando para o mapa; o GC fecha depois
+        if self._file is not None:
+            self._file.close()
+        self._map = None
+        self._file = None
+        self._slots = {}
+        self.loaded_key = None
+
+class AtlasAssetsManager(AssetsManager):
+    """
+    AssetsManager da exo-inventory servindo os ícones pelo AssetAtlas.
+    Com o índice local e um atlas da mesma versão já em disco, fica pronto sem
+    tocar na rede; a checagem de atualização da biblioteca roda em segundo plano.
+    """
+
+    def __init__(self, atlas_dir):
+        super().__init__()
+        self.atlas = AssetAtlas(atlas_dir)
+        self._ui_cache = {}
+        self._refresh_task = None
+
+    def _local_index(self):
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            return data.get("version", ""), data.get("index", {})
+        except Exception:
+            return None, {}
+
+    async def initialize(self, force_sync=False):
+        if not force_sync and not self._ready:
+            version, index = self._local_index()
+            if version and index and self.atlas.open(self.atlas.key(version)):
+                self.local_version, self.index = version, index
+                self._ready = True
+                self._refresh_task = asyncio.create_task(self._refresh())
+                return
+        await super().initialize(force_sync)
+        self._ensure_atlas()
+
+    async def _refresh(self):
+        """Checagem de atualização da biblioteca; se os assets mudaram, refaz o atlas."""
+        try:
+            await super().initialize()
+            self._ensure_atlas()
+        except Exception as e:
+            print(f"⚠️ [Assets] Falha ao checar atualização dos assets: {e}")
+
+    def _ensure_atlas(self):
+        if not self.index:
+            return # Assets ainda não baixados: a biblioteca lê os PNGs direto
+        key = self.atlas.key(self.local_version)
+        if self.atlas.loaded_key == key or self.atlas.open(key):
+            return
+        print("🧱 [Assets] Montando atlas de ícones...")
+        count = self.atlas.build(key, self._icon_sources())
+        self.atlas.open(key)
+        print(f"✅ [Assets] Atlas pronto: {count} ícones em {self.atlas.path(key)}")
+
+    def _icon_sources(self):
+        """(nome, caminho) de cada ícone do índice, com uma única varredura das pastas de versão."""
+        files = {}
+        for root, _, names in os.walk(self.versions_dir):
+            version = os.path.relpath(root, self.versions_dir).split(os.sep)[0]
+            for filename in names:
+                if filename.endswith(".png"):
+                    files.setdefault((version, filename[:-4].lower()), os.path.join(root, filename))
+        for name, version in self.index.items():
+            path = files.get((version, name))
+            if path is not None:
+                yield name, path
+
+    async def get_icon(self, item_id):
+        if not self._ready:
+            await self.initialize()
+        icon = self.atlas.get(item_id.split(":")[-1].lower())
+        if icon is not None:
+            return icon
+        return await super().get_icon(item_id)
+
+    def get_ui_asset(self, name):
+        # São poucos e pequenos: decodifica uma vez e reaproveita (quem usa só lê/redimensiona)
+        if name not in self._ui_cache:
+            self._ui_cache[name] = super().get_ui_asset(name)
+        return self._ui_cache[name]
+
+    def close(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self.atlas.close()
+
+def create_renderer(atlas_dir):
+    """InventoryRenderer da exo-inventory usando o atlas em `atlas_dir`."""
+    exo = ExoRenderer()
+    exo.assets = AtlasAssetsManager(atlas_dir)
+    return exo
@@ -0,0 +1,57 @@
+import io
+from datetime import datetime
+from PIL import Image, ImageDraw, ImageFont
+
+# Paleta escura no estilo do Discord
+BG_COLOR = (43, 45, 49)
+GRID_COLOR = (70, 73, 80)
+TEXT_COLOR = (220, 221, 222)
+LINE_COLOR = (87, 242, 135)
+
+WIDTH, HEIGHT = 900, 360
+MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 90, 20, 40, 40
+
+def render_line_chart(timestamps, values, title, value_fmt, tz):
+    """
+    Desenha um gráfico de linha simples com Pillow e retorna os bytes do PNG.
+    Pensado para rodar fora do event loop (asyncio.to_thread).
+    """
+    img = Image.new("RGB", (WIDTH, HEIGHT), BG_COLOR)
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+
+    draw.text((MARGIN_LEFT, 12), title, fill=TEXT_COLOR, font=font)
+
+    plot_w = WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_h = HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    t_min, t_max = timestamps[0], timestamps[-1]
+    v_min, v_max = min(values), max(values)
+    if v_max == v_min:
+        v_min, v_max = v_min - 1, v_max + 1
+    t_span = (t_max - t_min) or 1
+
+    # Grade horizontal com os valores no eixo Y
+    for k in range(5):
+        y = MARGIN_TOP + plot_h * k / 4
+        value = v_max - (v_max - v_min) * k / 4
+        draw.line([(MARGIN_LEFT, y), (WIDTH - MARGIN_RIGHT, y)], fill=GRID_COLOR)
+        draw.text((8, y - 6), value_fmt(value), fill=TEXT_COLOR, font=font)
+
+    # Horários de início/fim no eixo X
+    for ts, anchor_x in ((t_min, MARGIN_LEFT), (t_max, WIDTH - MARGIN_RIGHT - 80)):
+        label = datetime.fromtimestamp(ts, tz).strftime("%d/%m %H:%M")
+        draw.text((anchor_x, HEIGHT - MARGIN_BOTTOM + 12), label, fill=TEXT_COLOR, font=font)
+
+    points = [
+        (MARGIN_LEFT + plot_w * (ts - t_min) / t_span, MARGIN_TOP + plot_h * (v_max - v) / (v_max - v_min))
+        for ts, v in zip(timestamps, values)
+    ]
+    if len(points) == 1:
+        x, y = points[0]
+        draw.ellipse([(x - 3, y - 3), (x + 3, y + 3)], fill=LINE_COLOR)
+    else:
+        draw.line(points, fill=LINE_COLOR, width=2)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", optimize=False)
+    return buffer.getvalue()
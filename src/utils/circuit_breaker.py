@@ -0,0 +1,57 @@
+import time
+
+class CircuitBreaker:
+    """
+    Disjuntor simples por servidor: depois de `threshold` falhas seguidas (timeout,
+    conexão recusada, 5xx) as chamadas são recusadas na hora por `reset_timeout`
+    segundos; passado esse tempo uma única chamada de teste é liberada (meio-aberto)
+    e o resultado dela fecha ou reabre o circuito.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold=5, reset_timeout=30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_started = None # Chamada de teste em andamento (meio-aberto)
+
+    def allow(self):
+        """True se a chamada pode ir para a rede."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_started = None
+        # Meio-aberto: só uma chamada de teste por vez (uma que foi cancelada
+        # sem registrar resultado libera a vaga depois de reset_timeout)
+        now = time.monotonic()
+        if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_started = None
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_started = None
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def describe(self):
+        if self.state == self.OPEN:
+            remaining = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return f"aberto ({self.failures} falhas, teste em {remaining:.0f}s)"
+        if self.state == self.HALF_OPEN:
+            return "meio-aberto (testando)"
+        return f"fechado ({self.failures} falhas seguidas)" if self.failures else "fechado"
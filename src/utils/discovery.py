@@ -0,0 +1,49 @@
+import discord
+import time
+from src.utils.instrumentation import metrics
+
+class ChannelDiscovery:
+    """
+    Auto-descoberta do painel de status em guilds sem mensagem salva (procura o canal
+    pelo nome e uma mensagem do bot no histórico recente). Uma busca sem resultado fica
+    em cache negativo por `retry` segundos; eventos de canal da guild invalidam o cache,
+    então a busca só roda de novo quando algo pode ter mudado.
+    """
+    ERROR_RETRY = 60 # Falhas (ex.: timeout) são tentadas de novo mais cedo
+
+    def __init__(self, bot, channel_name, retry=3600):
+        self.bot = bot
+        self.channel_name = channel_name
+        self.retry = retry
+        self._misses = {} # {guild_id: momento (monotonic) em que vale tentar de novo}
+
+    async def find(self, guild):
+        """Retorna (channel_id, message_id) da mensagem de status encontrada ou None."""
+        retry_at = self._misses.get(guild.id)
+        if retry_at is not None and time.monotonic() < retry_at:
+            metrics.inc("exometric_discovery_total", result="cached_miss")
+            return None
+
+        channel = discord.utils.get(guild.text_channels, name=self.channel_name)
+        if channel is None:
+            return self._miss(guild.id, self.retry)
+
+        try:
+            with metrics.timer("discovery"):
+                async for message in channel.history(limit=20):
+                    if message.author.id == self.bot.user.id and message.embeds:
+                        self._misses.pop(guild.id, None)
+                        metrics.inc("exometric_discovery_total", result="found")
+                        return channel.id, message.id
+        except Exception: # Já contabilizado pelo timer
+            return self._miss(guild.id, self.ERROR_RETRY)
+        return self._miss(guild.id, self.retry)
+
+    def _miss(self, guild_id, delay):
+        self._misses[guild_id] = time.monotonic() + delay
+        metrics.inc("exometric_discovery_total", result="miss")
+        return None
+
+    def invalidate(self, guild_id):
+        """Algo mudou nos canais da guild: a próxima tentativa volta a buscar de verdade."""
+        self._misses.pop(guild_id, None)
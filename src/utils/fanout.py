@@ -0,0 +1,86 @@
+import asyncio
+import time
+from collections import deque
+
+class RouteLimiter:
+    """
+    Limitador por rota (ex.: ("send", channel_id)), no formato de janela deslizante:
+    no máximo `rate` chamadas a cada `per` segundos por rota. Evita que o loop
+    estoure os buckets do Discord e fique parado esperando 429.
+    """
+
+    def __init__(self, rate=5, per=5.0):
+        self.rate = rate
+        self.per = per
+        self._calls = {} # {rota: deque com os horários das últimas chamadas}
+        self._locks = {} # {rota: asyncio.Lock}
+
+    async def acquire(self, route):
+        lock = self._locks.get(route)
+        if lock is None:
+            lock = self._locks[route] = asyncio.Lock()
+
+        async with lock:
+            calls = self._calls.get(route)
+            if calls is None:
+                calls = self._calls[route] = deque(maxlen=self.rate)
+            if len(calls) == self.rate:
+                wait = calls[0] + self.per - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            calls.append(time.monotonic())
+
+class FanoutReport:
+    __slots__ = ('completed', 'failed', 'skipped', 'elapsed')
+
+    def __init__(self):
+        self.completed = []
+        self.failed = []
+        self.skipped = [] # Chaves que não terminaram antes do prazo do tick
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return f"<FanoutReport ok={len(self.completed)} falhas={len(self.failed)} puladas={len(self.skipped)} {self.elapsed:.2f}s>"
+
+class FanoutScheduler:
+    """
+    Executa o trabalho de cada guild em paralelo, com no máximo `concurrency`
+    tarefas simultâneas e um prazo total por tick (`deadline`).
+    """
+
+    def __init__(self, concurrency=25, deadline=12.0):
+        self.concurrency = concurrency
+        self.deadline = deadline
+
+    async def run(self, items, worker):
+        """
+        items: lista de (chave, argumento). worker: coroutine function(argumento).
+        Retorna um FanoutReport; o que passar do prazo é cancelado e reportado como pulado.
+        """
+        report = FanoutReport()
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def guarded(arg):
+            async with semaphore:
+                await worker(arg)
+
+        tasks = {asyncio.create_task(guarded(arg)): key for key, arg in items}
+        if not tasks:
+            return report
+
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending:
+            task.cancel()
+            report.skipped.append(tasks[task])
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            if task.exception() is not None:
+                report.failed.append(tasks[task])
+            else:
+                report.completed.append(tasks[task])
+
+        report.elapsed = time.monotonic() - started
+        return report
@@ -0,0 +1,171 @@
+import aiohttp
+import asyncio
+import discord
+import functools
+import time
+from aiohttp import web
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Limites (segundos) dos buckets dos histogramas, no estilo Prometheus
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def categorize(exc):
+    """Agrupa exceções em poucas categorias estáveis (evita explosão de labels)."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(exc, discord.NotFound):
+        return "not_found"
+    if isinstance(exc, discord.Forbidden):
+        return "forbidden"
+    if isinstance(exc, discord.HTTPException):
+        return "rate_limited" if exc.status == 429 else "discord_http"
+    if isinstance(exc, aiohttp.ClientError):
+        return "connection"
+    if isinstance(exc, (ValueError, KeyError, TypeError)):
+        return "malformed"
+    return "other"
+
+class Histogram:
+    """Histograma de buckets fixos: observe() é um bisect e um incremento."""
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # Último = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Estimativa pelo limite superior do bucket (suficiente para diagnóstico)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for i, n in enumerate(self.counts):
+            running += n
+            if running >= target:
+                return self.buckets[i] if i < len(self.buckets) else float('inf')
+        return float('inf')
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+class Metrics:
+    """Registro em memória de tempos, contagens e erros por etapa."""
+
+    def __init__(self):
+        self._histograms = {} # {(nome, labels): Histogram}
+        self._counters = {} # {(nome, labels): valor}
+        self._gauges = {} # {(nome, labels): valor}
+        self.started_at = time.time()
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        hist = self._histograms.get(key)
+        if hist is None:
+            hist = self._histograms[key] = Histogram()
+        hist.observe(seconds)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def error(self, stage, exc, **labels):
+        self.inc("exometric_errors_total", stage=stage, category=categorize(exc), **labels)
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        """Mede a duração da etapa e registra o erro (categorizado) se houver exceção."""
+        started = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error(stage, e, **labels)
+            raise
+        finally:
+            self.observe("exometric_stage_seconds", time.perf_counter() - started, stage=stage, **labels)
+
+    def stages(self):
+        """Resumo por etapa para o /diagnostics: [(labels, count, média, p95)]."""
+        rows = []
+        for (name, labels), hist in sorted(self._histograms.items()):
+            if name == "exometric_stage_seconds":
+                rows.append((dict(labels), hist.count, hist.sum / hist.count if hist.count else 0.0, hist.quantile(0.95)))
+        return rows
+
+    def errors(self):
+        return [(dict(labels), value) for (name, labels), value in sorted(self._counters.items()) if name == "exometric_errors_total"]
+
+    def render_prometheus(self):
+        lines = []
+        seen = set()
+        for (name, labels), hist in sorted(self._histograms.items()):
+            if name not in seen:
+                lines.append(f"# TYPE {name} histogram")
+                seen.add(name)
+            cumulative = 0
+            bounds = [str(b) for b in hist.buckets] + ["+Inf"]
+            for bound, n in zip(bounds, hist.counts):
+                cumulative += n
+                lines.append(f"{name}_bucket{_label_str(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_sum{_label_str(labels)} {hist.sum}")
+            lines.append(f"{name}_count{_label_str(labels)} {hist.count}")
+        for kind, table in (("counter", self._counters), ("gauge", self._gauges)):
+            for (name, labels), value in sorted(table.items()):
+                if name not in seen:
+                    lines.append(f"# TYPE {name} {kind}")
+                    seen.add(name)
+                lines.append(f"{name}{_label_str(labels)} {value}")
+        lines.append("# TYPE exometric_uptime_seconds gauge")
+        lines.append(f"exometric_uptime_seconds {time.time() - self.started_at:.0f}")
+        return "\n".join(lines) + "\n"
+
+# Instância única usada por todo o bot
+metrics = Metrics()
+
+def instrumented(stage):
+    """Decorator para handlers assíncronos (botões, selects): mede tempo e erros."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with metrics.timer(stage):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class MetricsServer:
+    """Endpoint HTTP local (/metrics) no formato texto do Prometheus."""
+
+    def __init__(self, host="127.0.0.1", port=9108):
+        self.host = host
+        self.port = port
+        self._runner = None
+
+    async def _handle(self, request):
+        return web.Response(text=metrics.render_prometheus(), content_type="text/plain", charset="utf-8")
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        print(f"📈 Métricas em http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
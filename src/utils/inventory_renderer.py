@@ -1,37 +1,162 @@
+import asyncio
 import discord
-from exo_inventory import InventoryRenderer as ExoRenderer
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from src.utils.instrumentation import metrics
+
+# Atlas de ícones decodificados (ver asset_atlas.py), reaproveitado entre reinícios
+ASSET_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '.asset_cache')
+
+# Únicos campos do payload que o renderer da exo-inventory lê. Vida, fome, nível, posição
+# e campos novos do mod mudam sem alterar a imagem, então ficam fora da chave do cache
+RENDER_KEYS = ('uuid', 'armor', 'off_hand', 'main_inventory', 'hotbar')
+
+def inventory_key(player_data):
+    """Hash canônico da parte do payload que influencia o render."""
+    relevant = {k: player_data.get(k) for k in RENDER_KEYS}
+    raw = json.dumps(relevant, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+class RenderCache:
+    """LRU de PNGs limitado pelo total de bytes (não pela quantidade de itens)."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict() # {chave: bytes do PNG}
+
+    def get(self, key):
+        png = self._entries.get(key)
+        if png is not None:
+            self._entries.move_to_end(key)
+        return png
+
+    def put(self, key, png):
+        if len(png) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._entries[key] = png
+        self.size += len(png)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+class _RenderWorker:
+    """
+    Thread dedicada com o próprio event loop. A exo-inventory é assíncrona e guarda
+    estado (assets carregados), então ela vive inteira nesse loop e o trabalho do
+    Pillow não trava o loop principal do bot (heartbeats do gateway).
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="exo-render", daemon=True)
+                self._thread.start()
+
+    async def run(self, coro):
+        """Executa a coroutine no loop da thread de render e aguarda o resultado."""
+        self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return await asyncio.wrap_future(future)
+
+    def stop(self):
+        with self._lock:
+            if self._thread is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=5)
+                self._loop.close()
+                self._thread = None
+                self._loop = None
 
 class InventoryRenderer:
+    """
+    A exo-inventory só é importada e os assets só são carregados no primeiro render
+    (ou no warm-up opcional): nada disso atrasa o boot nem a primeira edição do painel.
+    """
+
     def __init__(self):
-        self._exo = ExoRenderer()
+        self._exo = None # Criado no loop de render, no primeiro uso
         self._initialized = False
+        self._init_lock = None # Criado dentro do loop de render
+        self._worker = _RenderWorker()
+        self._cache = RenderCache(int(float(os.getenv("RENDER_CACHE_MB", "32")) * 1024 * 1024))
+        self._inflight = {} # {chave: Task} renders em andamento
+
+    async def _initialize_on_worker(self):
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if not self._initialized:
+                if self._exo is None:
+                    from src.utils.asset_atlas import create_renderer
+                    self._exo = create_renderer(os.path.abspath(os.getenv("ASSET_CACHE_DIR") or ASSET_CACHE_DIR))
+                with metrics.timer("render_init"):
+                    await self._exo.initialize()
+                self._initialized = True
 
     async def initialize(self):
-        """Inicializa o motor de renderização da biblioteca exo-inventory."""
+        """Importa a exo-inventory e carrega os assets (warm-up; o primeiro render faz isso sozinho)."""
         if not self._initialized:
-            await self._exo.initialize()
-            self._initialized = True
+            await self._worker.run(self._initialize_on_worker())
+
+    async def _close_on_worker(self):
+        if self._exo is not None:
+            await self._exo.close()
+            self._exo.assets.close()
+
+    async def _render_png(self, player_data):
+        # Roda no loop da thread de render
+        await self._initialize_on_worker()
+        file = await self._exo.render_player(player_data)
+        file.fp.seek(0)
+        return file.fp.read()
+
+    async def _render_miss(self, key, player_data):
+        try:
+            png = await self._worker.run(self._render_png(player_data))
+            self._cache.put(key, png)
+            return png
+        finally:
+            self._inflight.pop(key, None)
 
     async def render(self, player_data):
         """
         Gera a imagem de inventário do jogador usando a biblioteca exo-inventory.
-        Retorna um objeto discord.File.
+        Inventários já renderizados saem do cache. Retorna um objeto discord.File novo.
         """
-        if not self._initialized:
-            await self.initialize()
+        key = inventory_key(player_data)
+        png = self._cache.get(key)
+        metrics.inc("exometric_render_cache_total", result="hit" if png is not None else "miss")
+        if png is None:
+            # Vários cliques no mesmo jogador aguardam o mesmo render
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._render_miss(key, player_data))
+                self._inflight[key] = task
+            with metrics.timer("render_inventory"):
+                png = await asyncio.shield(task)
 
-        # A biblioteca já retorna um objeto discord.File
-        file = await self._exo.render_player(player_data)
-        
-        # Ajusta o filename se necessário (opcional, pois a lib usa "render.png" por padrão)
         name = player_data.get('name', 'player')
-        file.filename = f"inventory_{name}.png"
-        
-        return file
+        return discord.File(io.BytesIO(png), filename=f"inventory_{name}.png")
 
     async def close(self):
-        """Fecha a sessão da biblioteca."""
-        await self._exo.close()
+        """Fecha a sessão da biblioteca e encerra a thread de render."""
+        if self._worker._thread is not None:
+            await self._worker.run(self._close_on_worker())
+        self._worker.stop()
 
 # Instância única para ser importada pelos outros módulos
 renderer = InventoryRenderer()
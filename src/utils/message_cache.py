@@ -0,0 +1,39 @@
+import time
+
+class StatusMessageCache:
+    """
+    Guarda em memória os handles (PartialMessage) das mensagens de status
+    e a impressão digital do último conteúdo enviado para cada guild.
+    Assim o loop não precisa de fetch_message e só edita quando algo mudou.
+    """
+
+    def __init__(self, bot, max_silence=300):
+        self.bot = bot
+        self.max_silence = max_silence # Força um edit de tempos em tempos (rodapé "Último Update")
+        self._handles = {} # {guild_id: PartialMessage}
+        self._rendered = {} # {guild_id: (fingerprint, momento do edit)}
+
+    def get_handle(self, guild_id, msg_info):
+        """Retorna o PartialMessage da guild sem chamadas REST."""
+        handle = self._handles.get(guild_id)
+        if handle is None or handle.id != msg_info['message_id'] or handle.channel.id != msg_info['channel_id']:
+            channel = self.bot.get_partial_messageable(msg_info['channel_id'])
+            handle = channel.get_partial_message(msg_info['message_id'])
+            self._handles[guild_id] = handle
+            self._rendered.pop(guild_id, None)
+        return handle
+
+    def needs_edit(self, guild_id, fingerprint):
+        rendered = self._rendered.get(guild_id)
+        if not rendered:
+            return True
+        last_fingerprint, edited_at = rendered
+        return last_fingerprint != fingerprint or (time.monotonic() - edited_at) >= self.max_silence
+
+    def mark_edited(self, guild_id, fingerprint):
+        self._rendered[guild_id] = (fingerprint, time.monotonic())
+
+    def forget(self, guild_id):
+        """Descarta o handle (mensagem apagada ou reconfigurada via /setup)."""
+        self._handles.pop(guild_id, None)
+        self._rendered.pop(guild_id, None)
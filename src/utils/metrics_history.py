@@ -0,0 +1,172 @@
+import json
+import math
+import os
+import struct
+import time
+from array import array
+
+# Colunas numéricas guardadas a cada amostra do get_stats
+COLUMNS = (
+    'cpu_percent', 'memory_bytes', 'tps', 'mspt',
+    'heap_used_bytes', 'heap_max_bytes',
+    'network_rx_bytes', 'network_tx_bytes', 'players_online'
+)
+
+# (nome, tamanho do bucket em segundos, capacidade). 0 = amostra bruta.
+# bruto ~6h a 15s, 1 min por 24h, 15 min por ~30 dias
+TIERS = (
+    ('raw', 0, 1440),
+    ('1m', 60, 1440),
+    ('15m', 900, 2880),
+)
+
+FILE_MAGIC = b"EXOHIST1"
+
+class RingSeries:
+    """Buffer circular de capacidade fixa: um array('d') por coluna + timestamps."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.head = 0 # Próxima posição de escrita
+        self.count = 0
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.columns = {name: array('d', bytes(8 * capacity)) for name in COLUMNS}
+
+    def append(self, ts, values):
+        i = self.head
+        self.timestamps[i] = ts
+        for name in COLUMNS:
+            self.columns[name][i] = values[name]
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _indexes(self):
+        start = (self.head - self.count) % self.capacity
+        return ((start + k) % self.capacity for k in range(self.count))
+
+    def oldest(self):
+        if not self.count:
+            return None
+        return self.timestamps[(self.head - self.count) % self.capacity]
+
+    def select(self, column, since):
+        """Retorna (timestamps, valores) em ordem cronológica a partir de `since`."""
+        ts_out, val_out = [], []
+        col = self.columns[column]
+        for i in self._indexes():
+            ts = self.timestamps[i]
+            if ts >= since and not math.isnan(col[i]):
+                ts_out.append(ts)
+                val_out.append(col[i])
+        return ts_out, val_out
+
+class _Bucket:
+    """Acumula a média das amostras de um bucket antes de ir para o tier agregado."""
+    __slots__ = ('key', 'n', 'sums', 'counts')
+
+    def __init__(self, key):
+        self.key = key
+        self.n = 0
+        self.sums = dict.fromkeys(COLUMNS, 0.0)
+        self.counts = dict.fromkeys(COLUMNS, 0)
+
+    def add(self, values):
+        self.n += 1
+        for name in COLUMNS:
+            v = values[name]
+            if not math.isnan(v):
+                self.sums[name] += v
+                self.counts[name] += 1
+
+    def mean(self):
+        return {name: (self.sums[name] / self.counts[name]) if self.counts[name] else math.nan for name in COLUMNS}
+
+class MetricsHistory:
+    """
+    Histórico das métricas do servidor em memória constante: cada tier é um
+    RingSeries e os tiers agregados (1 min, 15 min) são alimentados por média.
+    """
+
+    def __init__(self):
+        self.tiers = [(name, size, RingSeries(capacity)) for name, size, capacity in TIERS]
+        self._buckets = {name: None for name, size, _ in TIERS if size}
+
+    def record(self, data, ts=None):
+        ts = ts if ts is not None else time.time()
+        # `data` é um ServerStats (já validado na borda do serviço)
+        values = {name: float(getattr(data, name)) for name in COLUMNS}
+
+        for name, size, series in self.tiers:
+            if not size:
+                series.append(ts, values)
+                continue
+            key = int(ts // size)
+            bucket = self._buckets[name]
+            if bucket is not None and bucket.key != key:
+                # Fecha o bucket anterior no meio do intervalo
+                series.append((bucket.key + 0.5) * size, bucket.mean())
+                bucket = None
+            if bucket is None:
+                bucket = self._buckets[name] = _Bucket(key)
+            bucket.add(values)
+
+    def query(self, column, seconds, now=None):
+        """Usa o tier mais detalhado que ainda cobre a janela pedida."""
+        now = now if now is not None else time.time()
+        since = now - seconds
+        for name, size, series in self.tiers:
+            oldest = series.oldest()
+            if oldest is not None and (oldest <= since or series.count < series.capacity):
+                return name, series.select(column, since)
+        name, _, series = self.tiers[-1]
+        return name, series.select(column, since)
+
+    # --- Persistência opcional ---
+
+    def save(self, path):
+        header = {
+            'columns': list(COLUMNS),
+            'tiers': [[name, size, series.capacity, series.head, series.count] for name, size, series in self.tiers]
+        }
+        raw = json.dumps(header).encode('utf-8')
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(FILE_MAGIC)
+            f.write(struct.pack('<I', len(raw)))
+            f.write(raw)
+            for _, _, series in self.tiers:
+                series.timestamps.tofile(f)
+                for name in COLUMNS:
+                    series.columns[name].tofile(f)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'rb') as f:
+                if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                    return False
+                (size,) = struct.unpack('<I', f.read(4))
+                header = json.loads(f.read(size))
+                if header['columns'] != list(COLUMNS) or [t[:3] for t in header['tiers']] != [[n, s, sr.capacity] for n, s, sr in self.tiers]:
+                    print("⚠️ Histórico salvo com layout diferente, ignorando.")
+                    return False
+                # Lê tudo antes de trocar, para um arquivo truncado não deixar tiers pela metade
+                loaded = []
+                for (_, _, series), (_, _, _, head, count) in zip(self.tiers, header['tiers']):
+                    timestamps = array('d')
+                    timestamps.fromfile(f, series.capacity)
+                    columns = {}
+                    for name in COLUMNS:
+                        col = array('d')
+                        col.fromfile(f, series.capacity)
+                        columns[name] = col
+                    loaded.append((series, timestamps, columns, head, count))
+            for series, timestamps, columns, head, count in loaded:
+                series.timestamps, series.columns = timestamps, columns
+                series.head, series.count = head, count
+            return True
+        except Exception as e:
+            print(f"⚠️ Erro ao carregar histórico: {e}")
+            return False
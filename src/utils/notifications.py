@@ -0,0 +1,60 @@
+import time
+
+# Limites do Discord por mensagem
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_CHARS_PER_MESSAGE = 6000
+
+class NotificationBatch:
+    """
+    Junta os eventos (start/stop/entrada/saída) de um tick, ou de uma janela de
+    debounce em segundos, para que cada guild receba uma única mensagem compacta.
+    """
+
+    def __init__(self, debounce=0):
+        self.debounce = debounce
+        self._events = []
+        self._opened_at = None
+
+    def _add(self, event):
+        if not self._events:
+            self._opened_at = time.monotonic()
+        event.setdefault('ts', int(time.time()))
+        self._events.append(event)
+
+    def add_start(self, launch_ts=None):
+        self._add({'kind': 'start', 'launch_ts': launch_ts})
+
+    def add_stop(self):
+        self._add({'kind': 'stop'})
+
+    def add_join(self, player):
+        self._add({'kind': 'join', 'uuid': player['uuid'], 'name': player['name']})
+
+    def add_leave(self, player):
+        self._add({'kind': 'leave', 'uuid': player['uuid'], 'name': player['name']})
+
+    def ready(self):
+        """Há eventos e a janela de debounce já fechou."""
+        if not self._events:
+            return False
+        return self.debounce <= 0 or (time.monotonic() - self._opened_at) >= self.debounce
+
+    def drain(self):
+        events, self._events = self._events, []
+        self._opened_at = None
+        return events
+
+def split_messages(embeds):
+    """Agrupa os embeds em mensagens respeitando 10 embeds e 6000 caracteres por mensagem."""
+    messages = []
+    current, current_len = [], 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or current_len + size > MAX_CHARS_PER_MESSAGE):
+            messages.append(current)
+            current, current_len = [], 0
+        current.append(embed)
+        current_len += size
+    if current:
+        messages.append(current)
+    return messages
@@ -1,20 +1,186 @@
+import asyncio
 import json
 import os
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data.json')
 
+class PersistenceStore:
+    """
+    Estado do bot em memória com gravação em segundo plano (write-behind).
+    - Leituras e updates nunca tocam no disco.
+    - Vários updates próximos viram uma única gravação (coalescidos por `flush_delay`).
+    - A gravação é atômica: arquivo temporário + fsync + os.replace, então um crash
+      no meio nunca deixa um data.json pela metade.
+    Em cluster todos os processos usam o mesmo arquivo, mas só o líder grava: os seguidores
+    mandam as mudanças para ele pelo IPC e recebem de volta as dos outros (ver status_cog).
+    """
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, path=None, flush_delay=1.0, read_only=None):
+        self.path = os.path.abspath(path) if path else None
+        self.flush_delay = flush_delay
+        self.read_only = read_only
+        self.on_change = None # Chamado com cada mudança local (o cluster repassa pelo IPC)
+        self._loaded = None
+        self._dirty = False
+        self._flush_task = None
+        self._write_lock = None # Criado no event loop; uma gravação por vez
+
+    @property
+    def _data(self):
+        if self._loaded is None:
+            # Leitura tardia: o main.py só carrega o .env (DATA_FILE, CLUSTER_ROLE) depois dos imports
+            if self.path is None:
+                self.path = os.path.abspath(os.getenv("DATA_FILE") or DATA_PATH)
+            if self.read_only is None:
+                self.read_only = os.getenv("CLUSTER_ROLE", "").lower() == "follower"
+            self._loaded = self._load()
+        return self._loaded
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            # Não sobrescreve o arquivo ruim com {}: guarda uma cópia para recuperação manual
+            corrupt_path = f"{self.path}.corrupt"
+            print(f"❌ data.json ilegível ({e}). Cópia salva em {corrupt_path}")
+            if self.read_only:
+                return {}
+            try:
+                os.replace(self.path, corrupt_path)
+            except OSError:
+                pass
+            return {}
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def setdefault(self, key, default):
+        if key not in self._data:
+            self.apply({'op': 'setdefault', 'key': key, 'value': default})
+        return self._data[key]
+
+    def set(self, key, value):
+        self.apply({'op': 'set', 'key': key, 'value': value})
+
+    def update(self, key, subkey, value):
+        """Atualiza uma única entrada de um dicionário (ex.: status_messages[guild_id])."""
+        self.apply({'op': 'update', 'key': key, 'subkey': subkey, 'value': value})
+
+    def delete(self, key, subkey=None):
+        self.apply({'op': 'delete', 'key': key, 'subkey': subkey})
+
+    def apply(self, change, notify=True):
+        """
+        Aplica uma mudança ({op, key, subkey, value}). Também usado para as mudanças
+        recebidas de outro processo do cluster; com notify=False não repassa de novo.
+        """
+        op, key = change['op'], change['key']
+        if op == 'set':
+            self._data[key] = change['value']
+        elif op == 'setdefault':
+            self._data.setdefault(key, change['value'])
+        elif op == 'update':
+            self._data.setdefault(key, {})[change['subkey']] = change['value']
+        elif op == 'delete':
+            if change.get('subkey') is None:
+                self._data.pop(key, None)
+            else:
+                self._data.get(key, {}).pop(change['subkey'], None)
+        else:
+            raise ValueError(f"Operação desconhecida: {op}")
+        if notify and self.on_change is not None:
+            self.on_change(change)
+        self.mark_dirty()
+
+    def replace(self, data):
+        """
+        Troca todo o estado pelo recebido do líder. Dicionários existentes são
+        atualizados no lugar: quem guardou uma referência (ex.: bot.status_messages) continua válido.
+        """
+        for key in list(self._data):
+            if key not in data:
+                del self._data[key]
+        for key, value in data.items():
+            current = self._data.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current.clear()
+                current.update(value)
+            else:
+                self._data[key] = value
+
+    def snapshot(self):
+        return json.loads(json.dumps(self._data))
+
+    def mark_dirty(self):
+        if self.read_only:
+            return # Seguidor do cluster: quem grava o arquivo é o líder
+        self._dirty = True
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Fora do event loop (boot/scripts): grava na hora
+            self.flush_sync()
+            return
+        # Uma tarefa em andamento volta a gravar sozinha enquanto houver mudanças
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        delay = self.flush_delay
+        while self._dirty:
+            await asyncio.sleep(delay)
+            if await self.flush():
+                delay = self.flush_delay
+            else:
+                # Disco cheio/sem permissão: tenta de novo com backoff em vez de esperar outra mudança
+                delay = min(self.MAX_RETRY_DELAY, max(1.0, delay * 2))
+
+    def _serialize(self):
+        self._dirty = False
+        return json.dumps(self._data, indent=4, ensure_ascii=False)
+
+    def _write(self, payload):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar data.json: {e}")
+            return False
+
+    async def flush(self):
+        """
+        Serializa no loop (snapshot consistente) e grava em uma thread. Mudanças
+        feitas durante a gravação entram numa nova rodada. False se a gravação falhou.
+        """
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        async with self._write_lock:
+            while self._dirty:
+                payload = self._serialize()
+                if not await asyncio.to_thread(self._write, payload):
+                    self._dirty = True
+                    return False
+        return True
+
+    def flush_sync(self):
+        if self._dirty and not self._write(self._serialize()):
+            self._dirty = True
+
+# Instância única do estado persistido
+store = PersistenceStore()
+
 def load_data():
-    if not os.path.exists(DATA_PATH):
-        return {}
-    try:
-        with open(DATA_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except:
-        return {}
+    return store.snapshot()
 
 def save_data(data):
-    try:
-        with open(DATA_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-    except Exception as e:
-        print(f"Erro ao salvar data.json: {e}")
+    for key, value in data.items():
+        store.set(key, value)
@@ -0,0 +1,80 @@
+from bisect import bisect_left, insort
+
+class PlayerIndex:
+    """
+    Jogadores online de um servidor, indexados por uuid (dict) e por nome
+    (lista ordenada de (nome em minúsculas, uuid) para busca por prefixo com bisect).
+    Mantido pelo loop de presença e pelos eventos do stream; o inspetor e o
+    /player leem daqui sem buscar a lista inteira de novo.
+    """
+
+    def __init__(self):
+        self._by_uuid = {} # {uuid: Player}
+        self._names = [] # [(nome.lower(), uuid)] ordenada
+
+    def __len__(self):
+        return len(self._by_uuid)
+
+    def __contains__(self, uuid):
+        return uuid in self._by_uuid
+
+    def __iter__(self):
+        return iter(self._by_uuid.values())
+
+    def get(self, uuid):
+        return self._by_uuid.get(uuid)
+
+    def replace(self, players):
+        """Troca o conteúdo inteiro (resultado de um poll da lista de jogadores)."""
+        self._by_uuid = {p.uuid: p for p in players}
+        self._names = sorted((p.name.lower(), p.uuid) for p in self._by_uuid.values())
+
+    def add(self, player):
+        old = self._by_uuid.get(player.uuid)
+        if old is not None:
+            self._discard_name(old)
+        self._by_uuid[player.uuid] = player
+        insort(self._names, (player.name.lower(), player.uuid))
+
+    def remove(self, uuid):
+        """Remove e retorna o jogador (ou None se ele não estava no índice)."""
+        player = self._by_uuid.pop(uuid, None)
+        if player is not None:
+            self._discard_name(player)
+        return player
+
+    def _discard_name(self, player):
+        entry = (player.name.lower(), player.uuid)
+        i = bisect_left(self._names, entry)
+        if i < len(self._names) and self._names[i] == entry:
+            del self._names[i]
+
+    def find(self, query):
+        """Resolve uuid ou nome exato (sem diferenciar maiúsculas)."""
+        player = self._by_uuid.get(query)
+        if player is not None:
+            return player
+        query = query.lower()
+        i = bisect_left(self._names, (query, ""))
+        if i < len(self._names) and self._names[i][0] == query:
+            return self._by_uuid[self._names[i][1]]
+        return None
+
+    def search(self, prefix, limit=25):
+        """Jogadores cujo nome começa com `prefix`, em ordem alfabética."""
+        prefix = prefix.lower()
+        results = []
+        for i in range(bisect_left(self._names, (prefix, "")), len(self._names)):
+            name, uuid = self._names[i]
+            if not name.startswith(prefix) or len(results) >= limit:
+                break
+            results.append(self._by_uuid[uuid])
+        return results
+
+    def page_count(self, size=25):
+        return max(1, -(-len(self._names) // size))
+
+    def page(self, number, size=25):
+        """Página `number` (começando em 0) da lista em ordem alfabética."""
+        start = number * size
+        return [self._by_uuid[uuid] for _, uuid in self._names[start:start + size]]
@@ -0,0 +1,98 @@
+import asyncio
+import random
+import time
+from src.utils.instrumentation import metrics
+
+class AdaptiveInterval:
+    """
+    Decide quanto esperar até a próxima consulta, e por quê.
+    - Servidor inacessível: backoff exponencial (com jitter) até `max_interval`.
+    - Algo mudando (jogadores/métricas): cai para `fast`.
+    - Estável por `calm_ticks` consultas seguidas: volta para `base`.
+    """
+
+    def __init__(self, base, fast, max_interval, calm_ticks=3, jitter=0.1):
+        self.base = base
+        self.fast = min(fast, base)
+        self.max_interval = max(max_interval, base)
+        self.calm_ticks = calm_ticks
+        self.jitter = jitter
+        self.interval = base
+        self.reason = "intervalo padrão"
+        self._failures = 0
+        self._calm = calm_ticks
+
+    def _set(self, interval, reason):
+        # Jitter evita que vários bots/pollers batam na API no mesmo instante
+        spread = interval * self.jitter
+        self.interval = max(1.0, interval + random.uniform(-spread, spread))
+        self.reason = reason
+
+    def on_unreachable(self):
+        self._failures += 1
+        backoff = min(self.max_interval, self.base * 2 ** (self._failures - 1))
+        self._set(backoff, f"servidor inacessível ({self._failures}x seguidas), backoff")
+
+    def on_success(self, changed):
+        self._failures = 0
+        if changed:
+            self._calm = 0
+            self._set(self.fast, "atividade detectada")
+        elif self._calm < self.calm_ticks:
+            self._calm += 1
+            self._set(self.fast, "aguardando estabilizar")
+        else:
+            self._set(self.base, "estável")
+
+    def hold(self, interval, reason):
+        """Intervalo definido por fora (ex.: stream de eventos ativo), sem mexer no backoff."""
+        self._set(interval, reason)
+
+    def describe(self):
+        return f"{self.interval:.1f}s ({self.reason})"
+
+class PollLoop:
+    """
+    Loop de consulta com intervalo variável (substitui o tasks.loop fixo).
+    `callback` é uma coroutine function chamada a cada iteração; o intervalo
+    seguinte é lido de `schedule.interval` depois de cada chamada.
+    """
+
+    def __init__(self, name, callback, schedule, before=None):
+        self.name = name
+        self.callback = callback
+        self.schedule = schedule
+        self.before = before
+        self._task = None
+        self._last_reason = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"poll:{self.name}")
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def is_running(self):
+        return self._task is not None and not self._task.done()
+
+    async def _run(self):
+        if self.before is not None:
+            await self.before()
+        while True:
+            started = time.perf_counter()
+            try:
+                await self.callback()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                metrics.error("poll_tick", e, loop=self.name)
+                print(f"❌ Erro no loop {self.name}: {e}")
+            metrics.observe("exometric_stage_seconds", time.perf_counter() - started, stage="poll_tick", loop=self.name)
+            metrics.set_gauge("exometric_poll_interval_seconds", self.schedule.interval, loop=self.name)
+
+            if self.schedule.reason != self._last_reason:
+                print(f"⏱️ {self.name}: próximo ciclo em {self.schedule.describe()}")
+                self._last_reason = self.schedule.reason
+            await asyncio.sleep(self.schedule.interval)
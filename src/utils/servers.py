@@ -0,0 +1,11 @@
+import discord
+from discord import app_commands
+from src.services.server_registry import registry
+
+async def server_autocomplete(interaction: discord.Interaction, current: str):
+    """Autocomplete do parâmetro `servidor`: servidores monitorados cujo nome contém o texto digitado."""
+    current = current.lower()
+    return [
+        app_commands.Choice(name=monitor.name, value=monitor.name)
+        for monitor in registry if current in monitor.name.lower()
+    ][:25]
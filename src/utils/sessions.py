@@ -0,0 +1,314 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from src.utils.ui import TZ_OFFSET
+
+SESSIONS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'sessions.db')
+
+WEEKDAYS = ("Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom")
+
+SCHEMA = """
+-- Sessões encerradas: só recebem INSERT (nunca são reescritas)
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    joined_at REAL NOT NULL,
+    left_at REAL NOT NULL,
+    dimension TEXT,
+    peak_ping INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_player ON sessions (server, uuid, joined_at);
+CREATE INDEX IF NOT EXISTS sessions_time ON sessions (server, joined_at);
+
+-- Sessões em andamento, gravadas a cada flush para sobreviver a um reinício
+CREATE TABLE IF NOT EXISTS open_sessions (
+    server TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    joined_at REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    dimension TEXT,
+    peak_ping INTEGER NOT NULL,
+    PRIMARY KEY (server, uuid)
+);
+
+-- Rollups atualizados junto com cada sessão encerrada: o /stats só lê daqui
+CREATE TABLE IF NOT EXISTS player_totals (
+    server TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    sessions INTEGER NOT NULL,
+    longest REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (server, uuid)
+);
+CREATE INDEX IF NOT EXISTS player_totals_rank ON player_totals (server, seconds DESC);
+CREATE INDEX IF NOT EXISTS player_totals_name ON player_totals (server, name_lower);
+
+CREATE TABLE IF NOT EXISTS daily_peaks (
+    server TEXT NOT NULL,
+    day TEXT NOT NULL,
+    peak INTEGER NOT NULL,
+    peak_at REAL NOT NULL,
+    PRIMARY KEY (server, day)
+);
+
+CREATE TABLE IF NOT EXISTS hourly_activity (
+    server TEXT NOT NULL,
+    weekday INTEGER NOT NULL,
+    hour INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (server, weekday, hour)
+);
+"""
+
+def _local_day(ts):
+    return datetime.fromtimestamp(ts, TZ_OFFSET).strftime("%Y-%m-%d")
+
+def hour_segments(start, end):
+    """Divide [start, end) em pedaços por hora local: [(dia da semana, hora, segundos)]."""
+    offset = TZ_OFFSET.utcoffset(None).total_seconds()
+    segments = []
+    t = start
+    while t < end:
+        local = t + offset
+        seg_end = min(end, (local // 3600 + 1) * 3600 - offset)
+        # 1970-01-01 foi uma quinta-feira (0 = segunda)
+        weekday = (int(local // 86400) + 3) % 7
+        segments.append((weekday, int(local % 86400 // 3600), seg_end - t))
+        t = seg_end
+    return segments
+
+class _OpenSession:
+    __slots__ = ('uuid', 'name', 'joined_at', 'dimension', 'peak_ping')
+
+    def __init__(self, player, ts):
+        self.uuid = player.uuid
+        self.name = player.name
+        self.joined_at = ts
+        self.dimension = None
+        self.peak_ping = 0
+        self.update(player)
+
+    def update(self, player):
+        if player.ping > self.peak_ping:
+            self.peak_ping = player.ping
+        if player.dimension != "???":
+            self.dimension = player.dimension
+
+class SessionStore:
+    """
+    Sessões de jogo (entrada/saída, dimensão, pior ping) num SQLite local.
+    - Entradas e saídas só mexem em memória; um flush periódico grava tudo numa
+      única transação, em outra thread.
+    - Cada sessão encerrada atualiza na mesma transação os rollups (tempo total por
+      jogador, pico diário de jogadores, atividade por dia da semana/hora), então
+      as consultas do /stats nunca varrem o histórico bruto.
+    - As sessões abertas também vão para o disco a cada flush: depois de um crash
+      elas são encerradas no último momento em que foram vistas.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock() # Uma conexão, usada por uma thread de cada vez
+        self._open = {} # {servidor: {uuid: _OpenSession}}
+        self._closed = [] # [(servidor, _OpenSession, left_at)] aguardando o flush
+        self._peaks = {} # {(servidor, dia): (pico, ts)} desde o último flush
+
+    def connect(self, recover=True):
+        """Abre o banco; `recover` encerra as sessões que ficaram abertas (só quem grava deve pedir)."""
+        with self._lock:
+            if self._conn is None:
+                # Resolvido só aqui: o main.py carrega o .env depois dos imports
+                self.path = os.path.abspath(self.path or os.getenv("SESSIONS_DB") or SESSIONS_PATH)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                # WAL: processos seguidores do cluster leem enquanto o líder grava
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.executescript(SCHEMA)
+            if recover:
+                self._recover()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- Registro (event loop, só memória) ---
+
+    def join(self, server, player, ts):
+        sessions = self._open.setdefault(server, {})
+        if player.uuid in sessions:
+            return
+        sessions[player.uuid] = _OpenSession(player, ts)
+        self._observe(server, len(sessions), ts)
+
+    def leave(self, server, uuid, ts):
+        session = self._open.get(server, {}).pop(uuid, None)
+        if session is not None:
+            self._closed.append((server, session, ts))
+
+    def sync(self, server, players, ts):
+        """Reconcilia as sessões abertas com a lista completa de jogadores online."""
+        sessions = self._open.setdefault(server, {})
+        current = set()
+        for player in players:
+            current.add(player.uuid)
+            session = sessions.get(player.uuid)
+            if session is None:
+                sessions[player.uuid] = _OpenSession(player, ts)
+            else:
+                session.update(player)
+        for uuid in [uuid for uuid in sessions if uuid not in current]:
+            self._closed.append((server, sessions.pop(uuid), ts))
+        self._observe(server, len(sessions), ts)
+
+    def _observe(self, server, online, ts):
+        key = (server, _local_day(ts))
+        peak = self._peaks.get(key)
+        if peak is None or online > peak[0]:
+            self._peaks[key] = (online, ts)
+
+    def open_session(self, server, uuid):
+        return self._open.get(server, {}).get(uuid)
+
+    # --- Gravação ---
+
+    async def flush(self):
+        """Grava as sessões encerradas, os picos e o checkpoint das abertas (em outra thread)."""
+        if self._conn is None:
+            return
+        now = time.time()
+        closed, self._closed = self._closed, []
+        peaks, self._peaks = self._peaks, {}
+        open_rows = [
+            (server, s.uuid, s.name, s.joined_at, now, s.dimension, s.peak_ping)
+            for server, sessions in self._open.items() for s in sessions.values()
+        ]
+        if not (closed or peaks or open_rows):
+            return
+        try:
+            await asyncio.to_thread(self._write, closed, peaks, open_rows)
+        except Exception:
+            # Devolve o lote para a próxima tentativa (os picos só valem pelo máximo)
+            self._closed = closed + self._closed
+            for key, peak in peaks.items():
+                current = self._peaks.get(key)
+                if current is None or peak[0] > current[0]:
+                    self._peaks[key] = peak
+            raise
+
+    def _write(self, closed, peaks, open_rows):
+        with self._lock, self._conn:
+            rows = [(server, s.uuid, s.name, s.joined_at, left_at, s.dimension, s.peak_ping) for server, s, left_at in closed]
+            self._close_rows(rows)
+            self._conn.executemany(
+                "INSERT INTO daily_peaks (server, day, peak, peak_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (server, day) DO UPDATE SET peak = excluded.peak, peak_at = excluded.peak_at "
+                "WHERE excluded.peak > daily_peaks.peak",
+                [(server, day, peak, ts) for (server, day), (peak, ts) in peaks.items()]
+            )
+            self._conn.execute("DELETE FROM open_sessions")
+            self._conn.executemany("INSERT INTO open_sessions VALUES (?, ?, ?, ?, ?, ?, ?)", open_rows)
+
+    def _close_rows(self, rows):
+        """Insere sessões encerradas e aplica cada uma aos rollups (chamado dentro de uma transação)."""
+        if not rows:
+            return
+        self._conn.executemany(
+            "INSERT INTO sessions (server, uuid, name, joined_at, left_at, dimension, peak_ping) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        self._conn.executemany(
+            "INSERT INTO player_totals (server, uuid, name, name_lower, seconds, sessions, longest, last_seen) "
+            "VALUES (?1, ?2, ?3, lower(?3), ?4, 1, ?4, ?5) "
+            "ON CONFLICT (server, uuid) DO UPDATE SET name = excluded.name, name_lower = excluded.name_lower, "
+            "seconds = seconds + excluded.seconds, sessions = sessions + 1, "
+            "longest = max(longest, excluded.longest), last_seen = max(last_seen, excluded.last_seen)",
+            [(server, uuid, name, max(0.0, left - joined), left) for server, uuid, name, joined, left, _, _ in rows]
+        )
+        hourly = {}
+        for server, _, _, joined, left, _, _ in rows:
+            for weekday, hour, seconds in hour_segments(joined, left):
+                key = (server, weekday, hour)
+                hourly[key] = hourly.get(key, 0.0) + seconds
+        self._conn.executemany(
+            "INSERT INTO hourly_activity (server, weekday, hour, seconds) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (server, weekday, hour) DO UPDATE SET seconds = seconds + excluded.seconds",
+            [(*key, seconds) for key, seconds in hourly.items()]
+        )
+
+    def _recover(self):
+        with self._conn:
+            rows = self._conn.execute(
+                "SELECT server, uuid, name, joined_at, last_seen, dimension, peak_ping FROM open_sessions"
+            ).fetchall()
+            self._close_rows(rows)
+            self._conn.execute("DELETE FROM open_sessions")
+        if rows:
+            print(f"🕒 {len(rows)} sessões abertas no último desligamento foram encerradas")
+
+    # --- Consultas (chamar com asyncio.to_thread) ---
+
+    def _query(self, sql, params):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def top_players(self, server, limit=10):
+        return self._query(
+            "SELECT name, seconds, sessions FROM player_totals WHERE server = ? ORDER BY seconds DESC LIMIT ?",
+            (server, limit)
+        )
+
+    def summary(self, server):
+        """(jogadores distintos, segundos jogados, sessões)."""
+        return self._query(
+            "SELECT COUNT(*), COALESCE(SUM(seconds), 0), COALESCE(SUM(sessions), 0) FROM player_totals WHERE server = ?",
+            (server,)
+        )[0]
+
+    def player(self, server, name):
+        """(uuid, nome, segundos, sessões, mais longa, visto por último) ou None."""
+        rows = self._query(
+            "SELECT uuid, name, seconds, sessions, longest, last_seen FROM player_totals WHERE server = ? AND name_lower = ? "
+            "ORDER BY last_seen DESC LIMIT 1",
+            (server, name.lower())
+        )
+        return rows[0] if rows else None
+
+    def last_dimension(self, server, uuid):
+        """Dimensão em que o jogador estava no fim da última sessão registrada."""
+        rows = self._query(
+            "SELECT dimension FROM sessions WHERE server = ? AND uuid = ? AND dimension IS NOT NULL "
+            "ORDER BY joined_at DESC LIMIT 1",
+            (server, uuid)
+        )
+        return rows[0][0] if rows else None
+
+    def daily_peaks(self, server, days=14):
+        since = _local_day(time.time() - (days - 1) * 86400)
+        return self._query(
+            "SELECT day, peak, peak_at FROM daily_peaks WHERE server = ? AND day >= ? ORDER BY day",
+            (server, since)
+        )
+
+    def heatmap(self, server):
+        """Matriz 7x24 (segunda..domingo x hora local) com os segundos jogados."""
+        grid = [[0.0] * 24 for _ in range(7)]
+        for weekday, hour, seconds in self._query(
+            "SELECT weekday, hour, seconds FROM hourly_activity WHERE server = ?", (server,)
+        ):
+            grid[weekday][hour] = seconds
+        return grid
+
+# Instância única para ser importada pelos outros módulos
+sessions = SessionStore()
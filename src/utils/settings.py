@@ -0,0 +1,112 @@
+import asyncio
+import os
+from dataclasses import dataclass
+from dotenv import dotenv_values
+
+# Variáveis que o cluster.py define para cada processo (papel, shards, IPC, porta de métricas)
+LAUNCHER_KEYS = ("SHARD_COUNT", "SHARD_IDS", "CLUSTER_ROLE", "CLUSTER_IPC", "METRICS_PORT")
+
+def _flag(name, default="on"):
+    return os.getenv(name, default).lower() == "on"
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Configurações usadas a cada tick, lidas do ambiente uma vez. Imutável:
+    um reload cria outra instância e quem guardou a antiga continua consistente.
+    """
+    notify_login: bool
+    notify_logout: bool
+    notify_server_start: bool
+    notify_server_stop: bool
+    notify_alerts: bool
+    mention_role_id: str
+    notify_debounce: float
+    status_max_silence: int
+    stream_resync_interval: float
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            notify_login=_flag("NOTIFY_LOGIN"),
+            notify_logout=_flag("NOTIFY_LOGOUT"),
+            notify_server_start=_flag("NOTIFY_SERVER_START"),
+            notify_server_stop=_flag("NOTIFY_SERVER_STOP"),
+            notify_alerts=_flag("NOTIFY_ALERTS"),
+            mention_role_id=os.getenv("MENTION_ROLE_ID", ""),
+            notify_debounce=float(os.getenv("NOTIFY_DEBOUNCE", "0")),
+            status_max_silence=int(os.getenv("STATUS_MAX_SILENCE", "300")),
+            stream_resync_interval=float(os.getenv("STREAM_RESYNC_INTERVAL", "300"))
+        )
+
+    @property
+    def mention(self):
+        return f"<@&{self.mention_role_id}>" if self.mention_role_id else ""
+
+class SettingsStore:
+    """
+    Guarda a Settings atual e recarrega o .env quando ele muda (mtime verificado
+    em segundo plano), avisando quem se registrou em on_reload.
+    """
+
+    def __init__(self, env_file=".env"):
+        self.env_file = env_file
+        # O que o cluster.py definiu para este processo vale mais que o .env; o resto do
+        # .env também chega aos filhos pelo ambiente, mas precisa continuar recarregável
+        self._launcher = {key for key in LAUNCHER_KEYS if key in os.environ}
+        self._current = None
+        self._listeners = []
+        self._task = None
+
+    @property
+    def current(self):
+        # Leitura tardia: o main.py só carrega o .env depois dos imports
+        if self._current is None:
+            self._current = Settings.from_env()
+        return self._current
+
+    def on_reload(self, callback):
+        self._listeners.append(callback)
+
+    def reload(self):
+        for key, value in dotenv_values(self.env_file).items():
+            if key not in self._launcher and value is not None:
+                os.environ[key] = value
+        new = Settings.from_env()
+        if new != self.current:
+            self._current = new
+            for callback in self._listeners:
+                callback(new)
+            print("🔄 Configurações recarregadas do .env")
+        return new
+
+    def _env_mtime(self):
+        try:
+            return os.stat(self.env_file).st_mtime
+        except OSError:
+            return None
+
+    async def _watch(self, interval):
+        last_mtime = self._env_mtime()
+        while True:
+            await asyncio.sleep(interval)
+            mtime = self._env_mtime()
+            if mtime == last_mtime:
+                continue
+            last_mtime = mtime
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"⚠️ Erro ao recarregar configurações (mantendo as atuais): {e}")
+
+    def start(self, interval=30):
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch(interval))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+# Instância única para ser importada pelos outros módulos
+settings = SettingsStore()
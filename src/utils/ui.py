@@ -1,12 +1,17 @@
 import discord
 from discord import Embed, ButtonStyle, ui, File
 from datetime import datetime, timedelta, timezone
+import hashlib
+import json
 import os
 import time
 
 # Fuso Horário Brasil (GMT-3)
 TZ_OFFSET = timezone(timedelta(hours=-3))
 from src.utils.inventory_renderer import renderer
+from src.services.server_registry import DEFAULT_HOST
+from src.services.exo_service import AUTH_ERROR, CIRCUIT_OPEN, MALFORMED, TIMEOUT
+from src.utils.instrumentation import instrumented
 
 # Caminhos locais para os ícones
 # Baseado na pasta atual: raiz/src/utils/ui.py
@@ -23,19 +28,19 @@ def format_bytes(size):
     return f"{size:.2f} {power_labels[n]}B"
 
 def create_player_dossier_embed(p, inv_file_name_placeholder=None):
-    embed = Embed(title=f"🛡️ Dossiê: {p['name']}", color=0x3498DB)
-    embed.set_thumbnail(url=f"https://mc-heads.net/avatar/{p.get('uuid')}/64")
+    embed = Embed(title=f"🛡️ Dossiê: {p.name}", color=0x3498DB)
+    embed.set_thumbnail(url=f"https://mc-heads.net/avatar/{p.uuid}/64")
     
     if inv_file_name_placeholder:
         embed.set_image(url=f"attachment://{inv_file_name_placeholder}")
 
     # Cálculo do Timestamp UTC absoluto (time.time() é o mais seguro)
-    login_ts = int(time.time() - p.get('online_seconds', 0))
+    login_ts = int(time.time() - p.online_seconds)
 
     # Status Vital
-    health = p.get('health', 0)
-    food = p.get('food', 0)
-    sat = p.get('saturation', 0)
+    health = p.health
+    food = p.food
+    sat = p.saturation
     
     embed.add_field(
         name="❤️ Vitalidade", 
@@ -44,9 +49,9 @@ def create_player_dossier_embed(p, inv_file_name_placeholder=None):
     )
 
     # Progressão e Sessão
-    lvl = p.get('level', 0)
-    gm = p.get('gamemode', 'SURVIVAL').capitalize()
-    ping = p.get('ping', 0)
+    lvl = p.level
+    gm = p.gamemode.capitalize()
+    ping = p.ping
     
     embed.add_field(
         name="📊 Atributos", 
@@ -55,8 +60,8 @@ def create_player_dossier_embed(p, inv_file_name_placeholder=None):
     )
 
     # Localização Detalhada
-    dim = p.get('dimension', '???').split(':')[-1].replace('_', ' ').capitalize()
-    coords = f"`X:{int(p.get('x',0))} Y:{int(p.get('y',0))} Z:{int(p.get('z',0))}`"
+    dim = p.dimension.split(':')[-1].replace('_', ' ').capitalize()
+    coords = f"`X:{int(p.x)} Y:{int(p.y)} Z:{int(p.z)}`"
     
     embed.add_field(
         name="📍 Localização & Sessão", 
@@ -66,32 +71,43 @@ def create_player_dossier_embed(p, inv_file_name_placeholder=None):
     
     return embed
 
-def create_status_embed(data):
+# Motivo exibido no painel quando não há dados (estado retornado pelo ExoMetricService)
+OFFLINE_REASONS = {
+    TIMEOUT: "⏱️ A API do ExoMetric não respondeu a tempo.",
+    AUTH_ERROR: "🔑 A API recusou o token. Verifique o `API_TOKEN`.",
+    MALFORMED: "🧩 A API respondeu com dados inválidos.",
+    CIRCUIT_OPEN: "⚠️ O servidor Minecraft não está respondendo. Nova tentativa em instantes.",
+}
+
+def create_status_embed(data, host=DEFAULT_HOST, state=None):
     files = []
     if not data:
-        embed = Embed(title="🔴 ExoMetric - Offline", color=0xFF4B4B)
-        embed.description = "⚠️ O servidor Minecraft não está respondendo."
+        if state in (AUTH_ERROR, MALFORMED):
+            embed = Embed(title="🟠 ExoMetric - Erro na API", color=0xE67E22)
+        else:
+            embed = Embed(title="🔴 ExoMetric - Offline", color=0xFF4B4B)
+        embed.description = OFFLINE_REASONS.get(state, "⚠️ O servidor Minecraft não está respondendo.")
         return embed, files
 
-    net_in = format_bytes(data.get('network_rx_bytes', 0))
-    net_out = format_bytes(data.get('network_tx_bytes', 0))
-    cpu = data.get('cpu_percent', 0)
-    ram_used = format_bytes(data.get('memory_bytes', 0))
+    net_in = format_bytes(data.network_rx_bytes)
+    net_out = format_bytes(data.network_tx_bytes)
+    cpu = data.cpu_percent
+    ram_used = format_bytes(data.memory_bytes)
     
     # Cálculos de Tempo (UTC absoluto via time.time)
     now_ts = time.time()
-    launch_timestamp = int(now_ts - data.get('uptime_seconds', 0))
-    world_day = data.get('world_day', 0)
+    launch_timestamp = int(now_ts - data.uptime_seconds)
+    world_day = data.world_day
 
     embed = Embed(
         title="<a:loading:1274933254880755815> Painel de Status",
-        description=f"\n🖥️ **Host:**\n```\nosguri.servegame.net\n```",
+        description=f"\n🖥️ **Host:**\n```\n{host}\n```",
         color=0x57F287
     )
 
     embed.add_field(name="⚙️ RECURSOS", value=f"```ansi\n\u001b[1;33mCPU:\u001b[0m {cpu}%\n\u001b[1;34mRAM:\u001b[0m {ram_used}\n```", inline=True)
     embed.add_field(name="📡 CONEXÃO", value=f"```ansi\n\u001b[1;32mIn:\u001b[0m {net_in}/s\n\u001b[1;31mOut:\u001b[0m {net_out}/s\n```", inline=True)
-    embed.add_field(name="👥 JOGADORES", value=f"```ansi\n\u001b[1;36mOnline:\u001b[0m {data.get('players_online', 0)}\n```", inline=False)
+    embed.add_field(name="👥 JOGADORES", value=f"```ansi\n\u001b[1;36mOnline:\u001b[0m {data.players_online}\n```", inline=False)
     
     # Formatação do Tempo Online para o Bloco ANSI
     uptime_sec = int(now_ts - launch_timestamp)
@@ -105,48 +121,155 @@ def create_status_embed(data):
     embed.add_field(name="📅 MUNDO", value=f"```ansi\n\u001b[1;35mDIA:\u001b[0m {world_day}\n```", inline=True)
     embed.add_field(name="⏱️ SERVIDOR", value=f"```ansi\n\u001b[1;32mON:\u001b[0m {uptime_fmt}\n```", inline=True)
     
-    updated_at = datetime.now(TZ_OFFSET).strftime("%H:%M:%S")
-    embed.set_footer(text=f"🟢 Último Update: {updated_at}")
+    stamp_status_embed(embed, data)
     return embed, files
 
+def stamp_status_embed(embed, data):
+    """Rodapé com o horário do update (a única parte do painel que muda a cada tick)."""
+    if data:
+        updated_at = datetime.now(TZ_OFFSET).strftime("%H:%M:%S")
+        embed.set_footer(text=f"🟢 Último Update: {updated_at}")
+
+def render_fingerprint(embed, files, view):
+    """
+    Hash do que o usuário realmente vê na mensagem de status (campos do embed,
+    anexos e botões). O rodapé com o horário do update fica de fora, senão todo tick seria diferente.
+    """
+    payload = embed.to_dict()
+    payload.pop('footer', None)
+    payload.pop('timestamp', None)
+    parts = [json.dumps(payload, sort_keys=True, ensure_ascii=False)]
+    parts += [f"file:{f.filename}" for f in files]
+    parts += [f"item:{getattr(item, 'custom_id', '')}" for item in view.children]
+    return hashlib.sha1("\x1f".join(parts).encode('utf-8')).hexdigest()
+
+def _single_notification_embed(event):
+    kind = event['kind']
+    if kind == 'start':
+        embed = Embed(title="🚀 Servidor Iniciado!", description="O servidor foi **ligado com sucesso**!", color=0x57F287, timestamp=discord.utils.utcnow())
+        if event.get('launch_ts'):
+            embed.add_field(name="⏱️ Online desde", value=f"<t:{event['launch_ts']}:R>")
+    elif kind == 'stop':
+        embed = Embed(title="🛑 Servidor Desconectado!", description="O servidor acaba de ficar **OFFLINE**.", color=0xFF4B4B, timestamp=discord.utils.utcnow())
+    elif kind == 'join':
+        embed = Embed(title="📥 Novo Jogador Online!", description=f"O jogador **{event['name']}** entrou no mundo!", color=0x2ECC71, timestamp=discord.utils.utcnow())
+        embed.set_thumbnail(url=f"https://mc-heads.net/avatar/{event['uuid']}/64")
+        embed.add_field(name="⏱️ Hora da Entrada", value=f"<t:{event['ts']}:R>")
+    else:
+        embed = Embed(title="📤 Jogador Desconectado!", description=f"O jogador **{event['name']}** saiu do mundo!", color=0xE67E22, timestamp=discord.utils.utcnow())
+        embed.set_thumbnail(url=f"https://mc-heads.net/avatar/{event['uuid']}/64")
+        embed.add_field(name="⏱️ Hora da Saída", value=f"<t:{event['ts']}:R>")
+    return embed
+
+def _notification_line(event):
+    kind = event['kind']
+    if kind == 'start':
+        since = f" (online desde <t:{event['launch_ts']}:R>)" if event.get('launch_ts') else ""
+        return f"🚀 Servidor **ligado**{since}"
+    if kind == 'stop':
+        return "🛑 Servidor ficou **OFFLINE**"
+    if kind == 'join':
+        return f"📥 **{event['name']}** entrou <t:{event['ts']}:R>"
+    return f"📤 **{event['name']}** saiu <t:{event['ts']}:R>"
+
+def create_notification_embeds(events, label=""):
+    """
+    Um evento isolado mantém o embed detalhado de sempre; vários eventos do mesmo
+    tick viram um resumo em lista, quebrado em mais embeds quando passa do limite.
+    """
+    if not events:
+        return []
+    if len(events) == 1:
+        embeds = [_single_notification_embed(events[0])]
+        if label:
+            embeds[0].set_author(name=f"🖥️ {label}")
+        return embeds
+
+    joins = sum(1 for e in events if e['kind'] == 'join')
+    leaves = sum(1 for e in events if e['kind'] == 'leave')
+    footer = f"📥 {joins} entrada(s) • 📤 {leaves} saída(s)"
+
+    # Descrição limitada a 4096 caracteres; 4000 deixa folga para o título
+    chunks, current = [], ""
+    for event in events:
+        line = _notification_line(event)
+        if current and len(current) + len(line) + 1 > 4000:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    chunks.append(current)
+
+    embeds = []
+    for i, chunk in enumerate(chunks):
+        title = "🔔 Atividade do Servidor" if i == 0 else "🔔 Atividade do Servidor (cont.)"
+        embed = Embed(title=title, description=chunk, color=0x3498DB, timestamp=discord.utils.utcnow())
+        embed.set_footer(text=footer)
+        if label:
+            embed.set_author(name=f"🖥️ {label}")
+        embeds.append(embed)
+    return embeds
+
+def create_alert_embeds(events, label=""):
+    """Um embed por alerta disparado/resolvido (regras do AlertEngine)."""
+    embeds = []
+    for event in events:
+        value = f"{event['value']:.1f}{event['unit']}"
+        if event['kind'] == 'alert':
+            embed = Embed(title=f"🚨 Alerta: {event['rule']}", description=f"Condição atingida: `{event['condition']}`", color=0xE74C3C, timestamp=discord.utils.utcnow())
+        else:
+            embed = Embed(title=f"✅ Normalizado: {event['rule']}", description=f"Voltou ao normal: `{event['condition']}`", color=0x2ECC71, timestamp=discord.utils.utcnow())
+        embed.add_field(name="📈 Valor na janela", value=f"`{value}`")
+        if label:
+            embed.set_author(name=f"🖥️ {label}")
+        embeds.append(embed)
+    return embeds
+
 def create_world_embed(data):
-    time = data.get('world_time', 0)
+    time = data.world_time
     hours = (time // 1000 + 6) % 24
     minutes = (time % 1000) * 60 // 1000
     
     embed = Embed(title="🌐 Detalhes do Mundo Minecraft", color=0x9B59B6)
     
     # Seed em destaque total
-    seed = data.get('world_seed', 'N/A')
+    seed = data.world_seed
     url = f"https://www.chunkbase.com/apps/biome-finder#seed={seed}&platform=java_1_21_5&dimension=overworld"
     embed.add_field(name="🌍 Seed", value=f"[🗺️ Ver no Chunkbase]({url})\n```\n{seed}\n```", inline=False)
     
     # Outros dados em blocos simples
-    embed.add_field(name="📅 Dia", value=f"`{data.get('world_day', 0)}`", inline=True)
+    embed.add_field(name="📅 Dia", value=f"`{data.world_day}`", inline=True)
     embed.add_field(name="⏰ Hora Local", value=f"`{hours:02d}:{minutes:02d}`", inline=True)
-    embed.add_field(name="📦 Chunks", value=f"`{data.get('loaded_chunks', 0)} carregados`", inline=True)
+    embed.add_field(name="📦 Chunks", value=f"`{data.loaded_chunks} carregados`", inline=True)
     
-    diff = str(data.get('difficulty', 'Normal')).upper()
+    diff = data.difficulty.upper()
     embed.add_field(name="⚔️ Dificuldade", value=f"`{diff}`", inline=True)
     
-    clima = "Chovendo" if data.get('is_raining') else "Céu Limpo"
+    clima = "Chovendo" if data.is_raining else "Céu Limpo"
     embed.add_field(name="🌧️ Clima", value=f"`{clima}`", inline=True)
     
     # Informação extra: Armazenamento
-    disco = format_bytes(data.get('disk_bytes', 0))
+    disco = format_bytes(data.disk_bytes)
     embed.add_field(name="💽 Armazenamento", value=f"`{disco}`", inline=True)
     
     return embed
 
 def create_performance_embed(data):
-    ram_pct = (data.get('heap_used_bytes', 0) / data.get('heap_max_bytes', 1)) * 100
+    ram_pct = (data.heap_used_bytes / (data.heap_max_bytes or 1)) * 100
     bar = "🟩" * int(ram_pct/10) + "⬛" * (10 - int(ram_pct/10))
     embed = Embed(title="⚡ Métricas de Performance", color=0xE67E22)
-    embed.add_field(name="🚀 TPS", value=f"`{data.get('tps', 0):.2f}`", inline=True)
-    embed.add_field(name="🕒 MSPT", value=f"`{data.get('mspt', 0):.2f}ms`", inline=True)
-    embed.add_field(name="💾 Java Heap", value=f"{bar} ({ram_pct:.1f}%)\n`{format_bytes(data.get('heap_used_bytes', 0))} / {format_bytes(data.get('heap_max_bytes', 0))}`", inline=False)
+    embed.add_field(name="🚀 TPS", value=f"`{data.tps:.2f}`", inline=True)
+    embed.add_field(name="🕒 MSPT", value=f"`{data.mspt:.2f}ms`", inline=True)
+    embed.add_field(name="💾 Java Heap", value=f"{bar} ({ram_pct:.1f}%)\n`{format_bytes(data.heap_used_bytes)} / {format_bytes(data.heap_max_bytes)}`", inline=False)
     return embed
 
+async def stats_embed(service, build):
+    """Embed de `build(stats)` ou, sem dados (servidor offline/erro na API), o mesmo aviso do painel."""
+    data = await service.get_stats()
+    if data is None:
+        embed, _ = create_status_embed(None, state=service.service.state("stats"))
+        return embed
+    return build(data)
+
 # --- Views de Resposta Efêmera ---
 
 class WorldRefreshView(ui.View):
@@ -155,10 +278,10 @@ class WorldRefreshView(ui.View):
         self.service = service
 
     @ui.button(label="Atualizar", emoji="🔄", style=ButtonStyle.secondary)
+    @instrumented("button.world_refresh")
     async def refresh(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer()
-        data = await self.service.get_stats()
-        await interaction.edit_original_response(embed=create_world_embed(data))
+        await interaction.edit_original_response(embed=await stats_embed(self.service, create_world_embed))
 
 class PerfRefreshView(ui.View):
     def __init__(self, service):
@@ -166,10 +289,10 @@ class PerfRefreshView(ui.View):
         self.service = service
 
     @ui.button(label="Atualizar", emoji="🔄", style=ButtonStyle.secondary)
+    @instrumented("button.perf_refresh")
     async def refresh(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer()
-        data = await self.service.get_stats()
-        await interaction.edit_original_response(embed=create_performance_embed(data))
+        await interaction.edit_original_response(embed=await stats_embed(self.service, create_performance_embed))
 
 class PlayerRefreshView(ui.View):
     def __init__(self, service, uuid):
@@ -178,83 +301,137 @@ class PlayerRefreshView(ui.View):
         self.uuid = uuid
 
     @ui.button(label="Atualizar Inventário", emoji="🔄", style=ButtonStyle.secondary)
+    @instrumented("button.player_refresh")
     async def refresh(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer()
-        data = await self.service.get_players()
-        p = next((x for x in data['players'] if x['uuid'] == self.uuid), None)
+        # Força uma leitura nova do jogador (o botão existe justamente para isso)
+        p = await self.service.refresh_player(self.uuid)
         if not p:
             await interaction.followup.send("❌ Jogador saiu do servidor.", ephemeral=True)
             return
         
-        inv_file = await renderer.render(p)
+        inv_file = await renderer.render(p.raw)
         p_embed = create_player_dossier_embed(p, inv_file.filename)
         await interaction.edit_original_response(embed=p_embed, attachments=[inv_file], view=self)
 
+async def show_player_dossier(interaction, service, uuid):
+    """Busca só esse jogador, renderiza o inventário e troca a resposta da interação pelo dossiê."""
+    p = await service.get_player(uuid)
+    if not p:
+        await interaction.followup.send("❌ Jogador não encontrado.", ephemeral=True)
+        return
+
+    inv_file = await renderer.render(p.raw)
+    p_embed = create_player_dossier_embed(p, inv_file.filename)
+    await interaction.edit_original_response(content="", embed=p_embed, attachments=[inv_file], view=PlayerRefreshView(service, uuid))
+
+class PlayerInspectorView(ui.View):
+    """Inspetor paginado (25 por página, limite do Select) lendo do índice de jogadores do servidor."""
+    PAGE_SIZE = 25
+
+    def __init__(self, monitor, page=0):
+        super().__init__(timeout=120)
+        self.monitor = monitor
+        self.service = monitor.cache
+
+        pages = monitor.players.page_count(self.PAGE_SIZE)
+        self.page = max(0, min(page, pages - 1))
+        options = [
+            discord.SelectOption(label=p.name, description=f"Ping: {p.ping}ms", value=p.uuid, emoji="👤")
+            for p in monitor.players.page(self.page, self.PAGE_SIZE)
+        ]
+        if options:
+            self.player_select.options = options
+        else:
+            # Todos saíram: o Discord recusa (400) um Select sem opções
+            self.remove_item(self.player_select)
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= pages - 1
+        self.page_label.label = f"{self.page + 1}/{pages}"
+
+    def content(self):
+        return f"🔍 **Inspetor de Jogadores** • {len(self.monitor.players)} online (use `/player` para buscar pelo nome)"
+
+    @ui.select(placeholder="Selecione um jogador...", row=0)
+    @instrumented("select.player")
+    async def player_select(self, interaction: discord.Interaction, select: ui.Select):
+        try:
+            await interaction.response.defer()
+            await show_player_dossier(interaction, self.service, select.values[0])
+        except Exception as e:
+            print(f"❌ Erro: {e}")
+            await interaction.followup.send(f"❌ Erro ao gerar inventário.", ephemeral=True)
+
+    @ui.button(emoji="◀️", style=ButtonStyle.secondary, row=1)
+    async def previous_page(self, interaction: discord.Interaction, button: ui.Button):
+        view = PlayerInspectorView(self.monitor, self.page - 1)
+        await interaction.response.edit_message(content=view.content(), view=view)
+
+    @ui.button(label="1/1", style=ButtonStyle.secondary, disabled=True, row=1)
+    async def page_label(self, interaction: discord.Interaction, button: ui.Button):
+        pass
+
+    @ui.button(emoji="▶️", style=ButtonStyle.secondary, row=1)
+    async def next_page(self, interaction: discord.Interaction, button: ui.Button):
+        view = PlayerInspectorView(self.monitor, self.page + 1)
+        await interaction.response.edit_message(content=view.content(), view=view)
+
 # --- View Principal ---
 
+def status_view_for(bot, monitor, is_online):
+    """StatusView do servidor para o estado online/offline, criada uma vez e reaproveitada."""
+    view = monitor.status_views.get(is_online)
+    if view is None:
+        view = monitor.status_views[is_online] = StatusView(bot, monitor, is_online=is_online)
+    return view
+
 class StatusView(ui.View):
-    def __init__(self, bot, service, is_online=True):
+    def __init__(self, bot, monitor, is_online=True):
         super().__init__(timeout=None)
         self.bot = bot
-        self.service = service
+        self.monitor = monitor
+        self.service = monitor.cache
+
+        # Cada servidor monitorado tem seu próprio conjunto de custom_ids
+        if monitor.view_suffix:
+            for item in self.children:
+                item.custom_id = f"{item.custom_id}{monitor.view_suffix}"
         
         if not is_online:
             for item in self.children[:]:
-                if getattr(item, 'custom_id', '') != "persistent:refresh":
+                if getattr(item, 'custom_id', '') != f"persistent:refresh{monitor.view_suffix}":
                     self.remove_item(item)
 
     @ui.button(label="Atualizar", emoji="🔄", style=ButtonStyle.primary, custom_id="persistent:refresh")
+    @instrumented("button.refresh")
     async def refresh_button(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer()
         data = await self.service.get_stats()
-        embed, files = create_status_embed(data)
+        embed, files = create_status_embed(data, self.monitor.host, self.monitor.service.state("stats"))
         # Atualiza a view para esconder os botões se cair ou voltar
-        new_view = StatusView(self.bot, self.service, is_online=(data is not None))
+        new_view = status_view_for(self.bot, self.monitor, is_online=(data is not None))
         await interaction.edit_original_response(embed=embed, attachments=files, view=new_view)
 
     @ui.button(emoji="🌐", style=ButtonStyle.secondary, custom_id="persistent:world")
+    @instrumented("button.world")
     async def world_button(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer(ephemeral=True)
-        data = await self.service.get_stats()
-        await interaction.followup.send(embed=create_world_embed(data), view=WorldRefreshView(self.service), ephemeral=True)
+        embed = await stats_embed(self.service, create_world_embed)
+        await interaction.followup.send(embed=embed, view=WorldRefreshView(self.service), ephemeral=True)
 
     @ui.button(emoji="⚡", style=ButtonStyle.secondary, custom_id="persistent:perf")
+    @instrumented("button.perf")
     async def perf_button(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer(ephemeral=True)
-        data = await self.service.get_stats()
-        await interaction.followup.send(embed=create_performance_embed(data), view=PerfRefreshView(self.service), ephemeral=True)
+        embed = await stats_embed(self.service, create_performance_embed)
+        await interaction.followup.send(embed=embed, view=PerfRefreshView(self.service), ephemeral=True)
 
     @ui.button(emoji="👥", style=ButtonStyle.secondary, custom_id="persistent:players")
+    @instrumented("button.players")
     async def players_button(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer(ephemeral=True)
-        data = await self.service.get_players()
-        if not data or not data.get('players'):
-            await interaction.followup.send("🚫 Nenhum jogador online no momento.", ephemeral=True)
+        # Servido pelo índice mantido pelo loop de presença: nada é buscado na API aqui
+        if not len(self.monitor.players):
+            await interaction.response.send_message("🚫 Nenhum jogador online no momento.", ephemeral=True)
             return
-
-        select = ui.Select(
-            placeholder="Selecione um jogador...",
-            options=[discord.SelectOption(label=p['name'], description=f"Ping: {p['ping']}ms", value=p['uuid'], emoji="👤") for p in data['players'][:25]]
-        )
-
-        async def select_callback(inter: discord.Interaction):
-            try:
-                await inter.response.defer()
-                uuid = select.values[0]
-                p = next((x for x in data['players'] if x['uuid'] == uuid), None)
-                if not p:
-                    await inter.followup.send("❌ Jogador não encontrado.", ephemeral=True)
-                    return
-
-                inv_file = await renderer.render(p)
-                p_embed = create_player_dossier_embed(p, inv_file.filename)
-                
-                await inter.edit_original_response(content="", embed=p_embed, attachments=[inv_file], view=PlayerRefreshView(self.service, uuid))
-            except Exception as e:
-                print(f"❌ Erro: {e}")
-                await inter.followup.send(f"❌ Erro ao gerar inventário.", ephemeral=True)
-
-        select.callback = select_callback
-        inspect_view = ui.View(timeout=60)
-        inspect_view.add_item(select)
-        await interaction.followup.send("🔍 **Inspetor de Jogadores**", view=inspect_view, ephemeral=True)
+        view = PlayerInspectorView(self.monitor)
+        await interaction.response.send_message(view.content(), view=view, ephemeral=True)
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+
+from src.utils.persistence import PersistenceStore
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_update_during_write_is_persisted(tmp_path):
+    path = tmp_path / "data.json"
+
+    async def scenario():
+        store = PersistenceStore(str(path), flush_delay=0)
+        writing = threading.Event()
+        release = threading.Event()
+        real_write = store._write
+
+        def slow_write(payload):
+            writing.set()
+            release.wait(5)
+            return real_write(payload)
+
+        store._write = slow_write
+        store.update('status_messages', '1', {"channel_id": 1, "message_id": 10})
+        # Espera a primeira gravação começar e muda o estado no meio dela
+        while not writing.is_set():
+            await asyncio.sleep(0.01)
+        store.update('status_messages', '2', {"channel_id": 2, "message_id": 20})
+        release.set()
+        await store._flush_task
+
+    asyncio.run(scenario())
+    assert set(_read(path)['status_messages']) == {'1', '2'}
+
+def test_failed_write_is_retried(tmp_path):
+    path = tmp_path / "data.json"
+
+    async def scenario():
+        store = PersistenceStore(str(path), flush_delay=0)
+        store.MAX_RETRY_DELAY = 0.01
+        real_write = store._write
+        failures = [True]
+
+        def flaky_write(payload):
+            if failures:
+                failures.pop()
+                return False
+            return real_write(payload)
+
+        store._write = flaky_write
+        store.set('alert_routes', {'1': {"channel_id": 5}})
+        await asyncio.wait_for(store._flush_task, 5)
+        assert not store._dirty
+
+    asyncio.run(scenario())
+    assert _read(path)['alert_routes'] == {'1': {"channel_id": 5}}
+
+def test_read_only_store_forwards_changes_without_writing(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({'status_messages': {'1': {"channel_id": 1, "message_id": 10}}}), encoding='utf-8')
+    store = PersistenceStore(str(path), read_only=True)
+    sent = []
+    store.on_change = sent.append
+
+    store.update('status_messages', '2', {"channel_id": 2, "message_id": 20})
+    store.apply({'op': 'delete', 'key': 'status_messages', 'subkey': '1'}, notify=False)
+
+    assert [change['subkey'] for change in sent] == ['2']
+    assert set(store.get('status_messages')) == {'2'}
+    assert set(_read(path)['status_messages']) == {'1'}
+
+def test_replace_keeps_existing_references(tmp_path):
+    store = PersistenceStore(str(tmp_path / "data.json"), read_only=True)
+    messages = store.setdefault('status_messages', {})
+    store.replace({'status_messages': {'3': {"channel_id": 3, "message_id": 30}}})
+    assert store.get('status_messages') is messages
+    assert set(messages) == {'3'}
+
+def test_data_file_and_role_are_read_on_first_use(tmp_path, monkeypatch):
+    # O store é criado no import, antes do main.py carregar o .env
+    monkeypatch.delenv("DATA_FILE", raising=False)
+    monkeypatch.delenv("CLUSTER_ROLE", raising=False)
+    store = PersistenceStore()
+    path = tmp_path / "custom.json"
+    path.write_text(json.dumps({'alert_routes': {'1': {"channel_id": 5}}}), encoding='utf-8')
+    monkeypatch.setenv("DATA_FILE", str(path))
+    monkeypatch.setenv("CLUSTER_ROLE", "follower")
+
+    assert store.get('alert_routes') == {'1': {"channel_id": 5}}
+    assert store.path == str(path) and store.read_only
@@ -0,0 +1,16 @@
+import os
+
+from src.utils.settings import SettingsStore
+
+def test_reload_applies_env_inherited_from_launcher(tmp_path, monkeypatch):
+    # cluster.py repassa o .env inteiro aos filhos pelo ambiente, junto com as próprias variáveis
+    env_file = tmp_path / ".env"
+    env_file.write_text("NOTIFY_LOGIN=on\nCLUSTER_ROLE=standalone\n", encoding='utf-8')
+    monkeypatch.setenv("NOTIFY_LOGIN", "on")
+    monkeypatch.setenv("CLUSTER_ROLE", "follower")
+    store = SettingsStore(str(env_file))
+    assert store.current.notify_login
+
+    env_file.write_text("NOTIFY_LOGIN=off\nCLUSTER_ROLE=standalone\n", encoding='utf-8')
+    assert not store.reload().notify_login
+    assert os.environ["CLUSTER_ROLE"] == "follower"
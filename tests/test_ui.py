@@ -0,0 +1,50 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.services.exo_service import TIMEOUT
+from src.structures.models import Player, ServerStats
+from src.utils.player_index import PlayerIndex
+from src.utils.ui import OFFLINE_REASONS, PlayerInspectorView, create_performance_embed, create_world_embed, stats_embed
+
+def _view(players, page=0):
+    index = PlayerIndex()
+    index.replace(players)
+    monitor = SimpleNamespace(cache=None, players=index)
+
+    async def build():
+        return PlayerInspectorView(monitor, page)
+
+    return asyncio.run(build())
+
+def test_inspector_without_players_has_no_select():
+    view = _view([])
+    assert view.player_select not in view.children
+    assert all(item.to_component_dict().get('options', True) for item in view.children)
+    assert view.previous_page.disabled and view.next_page.disabled
+
+def test_inspector_lists_current_page():
+    players = [Player.from_dict({'uuid': f"u{i}", 'name': f"Jogador{i:02d}", 'ping': i}, keep_raw=False) for i in range(30)]
+    view = _view(players, page=1)
+    assert [option.value for option in view.player_select.options] == [f"u{i}" for i in range(25, 30)]
+    assert view.page_label.label == "2/2"
+
+class _Cache:
+    """Substituto do SnapshotCache: get_stats com valor fixo e o estado da última leitura."""
+
+    def __init__(self, stats, state):
+        self.stats = stats
+        self.service = SimpleNamespace(state=lambda kind: state)
+
+    async def get_stats(self):
+        return self.stats
+
+def test_stats_buttons_show_offline_notice_without_data():
+    cache = _Cache(None, TIMEOUT)
+    for build in (create_world_embed, create_performance_embed):
+        embed = asyncio.run(stats_embed(cache, build))
+        assert embed.description == OFFLINE_REASONS[TIMEOUT]
+
+def test_stats_buttons_build_embed_with_data():
+    stats = ServerStats.from_dict({'tps': 19.5, 'mspt': 12.0, 'heap_used_bytes': 512, 'heap_max_bytes': 1024})
+    embed = asyncio.run(stats_embed(_Cache(stats, None), create_performance_embed))
+    assert embed.title == "⚡ Métricas de Performance"